@@ -0,0 +1,317 @@
+"""
+    This module contains a persistent, content-addressed disk cache for
+    the image assets generated by the `StyleBuilderTTK` class.
+
+    Rendering the theme images (checkbuttons, toggles, scrollbars, etc...)
+    requires drawing large images with PIL and resampling them to the
+    screen resolution. The finished images are stored as png data so that
+    they can be loaded directly into tkinter photoimages the next time
+    the application is started.
+"""
+import base64
+import hashlib
+import io
+import os
+import struct
+import sys
+from pathlib import Path
+
+# increment when the file layout or the asset rendering changes in a way
+# that is not captured by the package version.
+CACHE_FORMAT = 1
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+_MAGIC = b"TTKB"
+_HEADER = struct.Struct("<4sI")
+_LENGTH = struct.Struct("<I")
+_SUFFIX = ".assets"
+
+
+def package_version():
+    """Return the installed version of ttkbootstrap.
+
+    When the package metadata is not available (for example, when running
+    from a source tree), the modification time of the style module is
+    used instead so that edited sources do not load stale assets.
+
+    Returns:
+
+        str:
+            The version string.
+    """
+    try:
+        from importlib.metadata import version
+
+        return version("ttkbootstrap")
+    except Exception:
+        from ttkbootstrap import style
+
+        return f"dev-{os.path.getmtime(style.__file__)}"
+
+
+def default_directory():
+    """Return the platform specific user cache directory used to store
+    the image assets.
+
+    Returns:
+
+        Path:
+            The cache directory.
+    """
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData/Local"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library/Caches"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "ttkbootstrap" / "assets"
+
+
+class AssetCache:
+    """A size-bounded disk cache of rendered theme images.
+
+    Each entry holds the png data for a group of images created by one
+    call to a builder asset method. The entry is addressed by a hash of
+    the builder method, the color and size inputs, the scaling factor,
+    and the ttkbootstrap version; so an entry never needs to be
+    invalidated, only evicted. When the total size of the cache exceeds
+    `max_bytes`, the least recently used entries are removed.
+
+    Examples:
+
+        ```python
+        import ttkbootstrap as ttk
+
+        # must be enabled before the window is created to cache the
+        # assets of the startup theme.
+        cache = ttk.Style.enable_asset_cache()
+
+        app = ttk.Window(themename="darkly")
+
+        # remove all cached images
+        cache.clear()
+        ```
+    """
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Parameters:
+
+            directory (Union[str, Path]):
+                The directory where the assets are stored. By default,
+                this is a `ttkbootstrap` folder in the user cache
+                directory.
+
+            max_bytes (int):
+                The maximum size of the cache on disk, in bytes.
+        """
+        self.directory = Path(directory or default_directory())
+        self.max_bytes = max_bytes
+        self.version = package_version()
+        self.hits = 0
+        self.misses = 0
+        self._size = None
+
+    def make_key(self, *parts):
+        """Create a content address from the inputs used to render a
+        group of images.
+
+        Parameters:
+
+            *parts:
+                The values that determine the rendered images. The values
+                must have a stable `repr`.
+
+        Returns:
+
+            str:
+                A hexadecimal digest.
+        """
+        source = repr((CACHE_FORMAT, self.version, parts))
+        return hashlib.sha1(source.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """Return the png data stored for `key`.
+
+        Parameters:
+
+            key (str):
+                The content address created by `make_key`.
+
+        Returns:
+
+            Union[List[bytes], None]:
+                The png data of each image in the group, or `None` if the
+                key is not in the cache.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            images = self._unpack(data)
+        except (OSError, ValueError, struct.error):
+            self.misses += 1
+            return None
+        try:
+            # touch the entry so that eviction is least-recently-used
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return images
+
+    def put(self, key, images):
+        """Store the png data for a group of images.
+
+        Parameters:
+
+            key (str):
+                The content address created by `make_key`.
+
+            images (List[bytes]):
+                The png data of each image in the group.
+        """
+        data = self._pack(images)
+        path = self._path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            # an existing entry is replaced; its size is not added twice
+            replaced = path.stat().st_size
+        except OSError:
+            replaced = 0
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError:
+            # a read-only or full disk must never break the application
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return
+        if self._size is not None:
+            self._size += len(data) - replaced
+        if self.size() > self.max_bytes:
+            self.evict()
+
+    def size(self):
+        """Return the total size of the cached assets in bytes.
+
+        Returns:
+
+            int:
+                The size of the cache on disk.
+        """
+        if self._size is None:
+            self._size = sum(p.stat().st_size for p in self._entries())
+        return self._size
+
+    def evict(self, max_bytes=None):
+        """Remove the least recently used entries until the cache is no
+        larger than 75% of `max_bytes`.
+
+        Parameters:
+
+            max_bytes (int):
+                The size limit to enforce. Defaults to the `max_bytes`
+                given when the cache was created.
+        """
+        limit = (self.max_bytes if max_bytes is None else max_bytes) * 0.75
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        total = sum(e[1] for e in entries)
+        for _, size, path in entries:
+            if total <= limit:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+        self._size = total
+
+    def clear(self):
+        """Remove all cached assets."""
+        for path in self._entries():
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        self._size = 0
+
+    @staticmethod
+    def to_png(image):
+        """Encode a PIL image as png data.
+
+        Parameters:
+
+            image (PIL.Image.Image):
+                The image to encode.
+
+        Returns:
+
+            bytes:
+                The png data.
+        """
+        buffer = io.BytesIO()
+        image.save(buffer, format="png")
+        return buffer.getvalue()
+
+    @staticmethod
+    def to_photo_data(png):
+        """Encode png data so that it can be passed as the `data`
+        option of a `tkinter.PhotoImage`.
+
+        Parameters:
+
+            png (bytes):
+                The png data.
+
+        Returns:
+
+            str:
+                The base64 encoded png data.
+        """
+        return base64.b64encode(png).decode("ascii")
+
+    def _path(self, key):
+        return self.directory / key[:2] / f"{key}{_SUFFIX}"
+
+    def _entries(self):
+        if not self.directory.is_dir():
+            return []
+        return list(self.directory.glob(f"*/*{_SUFFIX}"))
+
+    @staticmethod
+    def _pack(images):
+        chunks = [_HEADER.pack(_MAGIC, len(images))]
+        for png in images:
+            chunks.append(_LENGTH.pack(len(png)))
+            chunks.append(png)
+        return b"".join(chunks)
+
+    @staticmethod
+    def _unpack(data):
+        magic, count = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC:
+            raise ValueError("Not a ttkbootstrap asset file")
+        offset = _HEADER.size
+        images = []
+        for _ in range(count):
+            (length,) = _LENGTH.unpack_from(data, offset)
+            offset += _LENGTH.size
+            png = data[offset : offset + length]
+            if len(png) != length:
+                raise ValueError("Truncated asset file")
+            images.append(png)
+            offset += length
+        return images
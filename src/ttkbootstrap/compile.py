@@ -0,0 +1,386 @@
+"""
+    Compile a ttkbootstrap theme into a single, self-contained tcl script.
+
+    The script contains every `ttk::style` command used to create the
+    theme and its styles, and the png data of the theme images. Loading
+    a compiled theme is a single `eval` in tcl, instead of drawing the
+    images and building the styles with `StyleBuilderTTK`, which reduces
+    the startup time of applications that use one fixed theme.
+
+    A compiled theme is only valid for the ttkbootstrap version, theme
+    colors, and screen scaling factor it was compiled with. If any of
+    these differ at runtime, the theme is built normally.
+
+    Compile a theme from the command line (a display is required; on a
+    headless system, run it under Xvfb):
+
+        python -m ttkbootstrap.compile darkly -o darkly.tcl
+        python -m ttkbootstrap.compile darkly --styles primary.TButton \\
+            success.Outline.TButton Horizontal.TScrollbar
+
+    Load it before the window is created:
+
+        ```python
+        import ttkbootstrap as ttk
+
+        ttk.Style.load_compiled_theme("darkly.tcl")
+        app = ttk.Window(themename="darkly")
+        ```
+"""
+import argparse
+import json
+import re
+import sys
+import tkinter as tk
+from tkinter import ttk
+
+from ttkbootstrap.assetcache import package_version
+from ttkbootstrap.style import Bootstyle, Colors, Keywords, Style
+from ttkbootstrap.style import StyleBuilderTTK, ThemeDefinition
+from ttkbootstrap.style import ORIENT_CLASSES, USER_THEMES
+from ttkbootstrap.tclbatch import tcl_command, tcl_quote
+from ttkbootstrap.themes.standard import STANDARD_THEMES
+
+COMPILED_FORMAT = 1
+HEADER = "# ttkbootstrap compiled theme "
+
+# style commands that do not change the theme
+_QUERIES = {
+    "lookup",
+    "element names",
+    "element options",
+    "theme names",
+    "theme use",
+}
+_IMAGE_NAME = re.compile(r"\bpyimage\d+\b")
+
+
+class CompiledTheme:
+    """A theme compiled into a tcl script.
+
+    Attributes:
+
+        name (str):
+            The theme name.
+
+        themetype (str):
+            The theme type; **light** or **dark**.
+
+        colors (Dict[str, str]):
+            The theme colors by color label.
+
+        styles (List[str]):
+            The ttk styles that are included in the script.
+
+        scaling (float):
+            The scaling factor used to draw the images.
+
+        version (str):
+            The ttkbootstrap version used to compile the theme.
+
+        script (str):
+            The tcl script.
+    """
+
+    def __init__(
+        self, name, themetype, colors, styles, scaling, version, script
+    ):
+        self.name = name
+        self.themetype = themetype
+        self.colors = colors
+        self.styles = styles
+        self.scaling = scaling
+        self.version = version
+        self.script = script
+
+    @staticmethod
+    def read(path):
+        """Read a compiled theme from a file.
+
+        Parameters:
+
+            path (str):
+                The path of the compiled theme.
+
+        Returns:
+
+            CompiledTheme:
+                The compiled theme.
+        """
+        with open(path, encoding="utf-8") as f:
+            header = f.readline()
+            script = f.read()
+        if not header.startswith(HEADER):
+            raise ValueError(f"{path} is not a compiled ttkbootstrap theme")
+        meta = json.loads(header[len(HEADER):])
+        if meta.get("format") != COMPILED_FORMAT:
+            raise ValueError(f"{path} has an unsupported format")
+        return CompiledTheme(
+            name=meta["name"],
+            themetype=meta["type"],
+            colors=meta["colors"],
+            styles=meta["styles"],
+            scaling=meta["scaling"],
+            version=meta["version"],
+            script=script,
+        )
+
+    def write(self, path):
+        """Write the compiled theme to a file.
+
+        Parameters:
+
+            path (str):
+                The file path.
+        """
+        meta = {
+            "format": COMPILED_FORMAT,
+            "name": self.name,
+            "type": self.themetype,
+            "colors": self.colors,
+            "styles": self.styles,
+            "scaling": self.scaling,
+            "version": self.version,
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(HEADER + json.dumps(meta) + "\n")
+            f.write(self.script)
+
+    def definition(self):
+        """Return a theme definition with the name and colors of the
+        compiled theme.
+
+        Returns:
+
+            ThemeDefinition:
+                The theme definition.
+        """
+        return ThemeDefinition(self.name, self.colors, self.themetype)
+
+    def is_compatible(self, builder):
+        """Return `True` if the compiled theme matches the version,
+        colors, and scaling factor that the builder would use.
+
+        Parameters:
+
+            builder (StyleBuilderTTK):
+                The builder of the theme.
+
+        Returns:
+
+            bool:
+                Whether the compiled theme can be used.
+        """
+        return (
+            self.version == package_version()
+            and self.colors == theme_colors(builder.colors)
+            and abs(self.scaling - builder.scaling_factor()) < 1e-9
+        )
+
+    def install(self, style, activate=True):
+        """Create the theme and its styles by evaluating the script, and
+        register the styles that it contains.
+
+        Parameters:
+
+            style (Style):
+                The style object.
+
+            activate (bool):
+                Make the theme current.
+        """
+        style.tk.eval(self.script)
+        if activate:
+            ttk.Style.theme_use(style, self.name)
+        for ttkstyle in self.styles:
+            style._register_ttkstyle(ttkstyle)
+
+
+class TclRecorder:
+    """A proxy for the tcl interpreter of the `Style` object that
+    records the `ttk::style` commands that change the theme. All
+    commands are passed on to the interpreter."""
+
+    def __init__(self, tk):
+        """
+        Parameters:
+
+            tk (_tkinter.tkapp):
+                The tcl interpreter.
+        """
+        self._tk = tk
+        self.commands = []
+
+    def call(self, *args):
+        if args and args[0] == "ttk::style" and not _is_query(args):
+            self.commands.append(tcl_command(args))
+        return self._tk.call(*args)
+
+    def __getattr__(self, name):
+        return getattr(self._tk, name)
+
+
+def _is_query(args):
+    subcommand = " ".join(str(a) for a in args[1:3])
+    if args[1] in _QUERIES or subcommand in _QUERIES:
+        return True
+    # `configure` and `map` without values, and `layout` without a
+    # layout specification are queries
+    if args[1] in ("configure", "map"):
+        return len(args) <= 4
+    return args[1] == "layout" and (len(args) == 3 or args[3] is None)
+
+
+def theme_colors(colors):
+    """Return the colors of a theme as a dictionary.
+
+    Parameters:
+
+        colors (Colors):
+            The theme colors.
+
+    Returns:
+
+        Dict[str, str]:
+            The color value of each color label.
+    """
+    return {label: colors.get(label) for label in Colors.label_iter()}
+
+
+def all_ttkstyles():
+    """Return a ttk style name for every combination of color, type,
+    and widget class that has a builder method.
+
+    Returns:
+
+        List[str]:
+            The ttk style names.
+    """
+    ttkstyles = {}
+    for widget_class in Keywords.CLASSES:
+        orient = "horizontal" if widget_class in ORIENT_CLASSES else ""
+        for widget_type in ["", *Keywords.TYPES]:
+            for color in ["", *Keywords.COLORS]:
+                string = "-".join(
+                    x for x in (color, widget_type, orient, widget_class) if x
+                )
+                resolved = Bootstyle.resolve(string=string)
+                if not hasattr(StyleBuilderTTK, resolved.method_name):
+                    continue
+                key = (resolved.method_name, resolved.color)
+                ttkstyles.setdefault(key, resolved.ttkstyle)
+    return sorted(ttkstyles.values())
+
+
+def compile_theme(themename, styles=None):
+    """Build a theme and record it as a tcl script.
+
+    This must be called before the theme is created in the current
+    process; a `Style` object is created if it does not exist.
+
+    Parameters:
+
+        themename (str):
+            The name of a standard or user theme.
+
+        styles (List[str]):
+            The ttk style names to include, such as `primary.TButton`.
+            By default, every style that ttkbootstrap can build is
+            included.
+
+    Returns:
+
+        CompiledTheme:
+            The compiled theme.
+    """
+    # always record the theme, even if a compiled version was loaded
+    Style.compiled_themes.pop(themename, None)
+    style = Style.get_instance()
+    if style is None:
+        # start with another theme so that the recorder is in place
+        # before the compiled theme is created.
+        names = [*STANDARD_THEMES, *USER_THEMES]
+        root = tk.Tk()
+        root.withdraw()
+        style = Style([n for n in names if n != themename][0])
+    if themename not in style.theme_names():
+        raise ValueError(f"'{themename}' is not a valid theme")
+    created = style.tk.splitlist(style.tk.call("ttk::style", "theme", "names"))
+    if themename in created:
+        raise ValueError(f"The theme '{themename}' was already created")
+
+    recorder = TclRecorder(style.tk)
+    style.tk = recorder
+    try:
+        style.theme_use(themename)
+        builder: StyleBuilderTTK = style._get_builder()
+        for ttkstyle in all_ttkstyles() if styles is None else styles:
+            if not style.style_exists_in_theme(ttkstyle):
+                resolved = Bootstyle.resolve(string=ttkstyle)
+                builder.build_style(resolved.method_name, resolved.color)
+    finally:
+        style.tk = recorder._tk
+
+    images = {}
+    lines = []
+    # the image names are substituted into quoted commands, so they must
+    #   not contain characters that are escaped
+    prefix = re.sub(r"\W", "_", themename, flags=re.ASCII)
+    for i, name in enumerate(builder.theme_images):
+        images[name] = f"ttkbootstrap_{prefix}_{i}"
+        data = style.tk.call(name, "data", "-format", "png")
+        lines.append(
+            f"image create photo {images[name]} -format png -data {{{data}}}"
+        )
+
+    def rename(match):
+        return images.get(match.group(0), match.group(0))
+
+    theme_create = []
+    settings = []
+    for command in recorder.commands:
+        command = _IMAGE_NAME.sub(rename, command)
+        if command.startswith("ttk::style theme create"):
+            theme_create.append(command)
+        else:
+            settings.append("    " + command)
+
+    lines.extend(theme_create)
+    lines.append(f"ttk::style theme settings {tcl_quote(themename)} {{")
+    lines.extend(settings)
+    lines.append("}")
+
+    return CompiledTheme(
+        name=themename,
+        themetype=style.theme.type,
+        colors=theme_colors(style.colors),
+        styles=sorted(style._theme_styles[themename]),
+        scaling=builder.scaling_factor(),
+        version=package_version(),
+        script="\n".join(lines) + "\n",
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m ttkbootstrap.compile",
+        description="Compile a ttkbootstrap theme into a tcl script.",
+    )
+    parser.add_argument("theme", help="the name of the theme to compile")
+    parser.add_argument(
+        "-o", "--output", help="the output file; default is <theme>.tcl"
+    )
+    parser.add_argument(
+        "--styles",
+        nargs="+",
+        help="the ttk style names to include; default is all styles",
+    )
+    args = parser.parse_args(argv)
+    compiled = compile_theme(args.theme, args.styles)
+    path = args.output or f"{args.theme}.tcl"
+    compiled.write(path)
+    print(f"{path}: {len(compiled.styles)} styles", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+"""
+    This module contains the registry that shares the photoimages of the
+    theme image assets between styles and themes.
+
+    Many style builder methods render the same images; for example, the
+    arrows of several widgets in the same color, or the disabled state of
+    a toggle, which is identical for every color and in themes that share
+    palette colors. The images are identified by the render function and
+    the parameters it was called with, so a shared image is found before
+    anything is rendered. Size parameters are compared unscaled; an image
+    that is shared by several themes is rendered again in place when the
+    scaling factor changes.
+
+    Each image group counts the styles that hold it. When no style holds
+    a group, its photoimages are emptied to release their pixel memory,
+    but they are not deleted, because the element definitions of the
+    theme still refer to them by name. The group is rendered again in
+    place when a style holds it again.
+
+    When the colors of a theme are updated in place, the photoimages of
+    a group are rendered again with the new colors only if no other
+    style holds them; otherwise the recolored style is given a new group
+    of photoimages, and the other styles keep their images.
+"""
+
+
+class ImageGroup:
+    """The photoimages created by a single render of an image asset.
+
+    Attributes:
+
+        images (List[PhotoImage]):
+            The photoimages.
+
+        names (List[str]):
+            The tk names of the photoimages.
+
+        render (Callable):
+            The render function of the asset.
+
+        params (Tuple):
+            The parameters passed to the render function; sizes are
+            unscaled.
+
+        factor (float):
+            The scaling factor of the current image data.
+
+        hits (int):
+            The number of times the images were reused.
+
+        refs (int):
+            The number of holders of the images.
+
+        evicted (bool):
+            Whether the photoimages were emptied.
+    """
+
+    def __init__(self, images, names, render, params, factor):
+        self.images = images
+        self.names = names
+        self.render = render
+        self.params = params
+        self.factor = factor
+        self.hits = 0
+        self.refs = 0
+        self.evicted = False
+
+
+class ImageRegistry:
+    """Registers the photoimages of the theme image assets by render
+    function and parameters, so that identical assets share a single
+    tk image.
+
+    Examples:
+
+        ```python
+        import ttkbootstrap as ttk
+
+        app = ttk.Window()
+        app.style.theme_use("darkly")
+        print(app.style.image_registry.report())
+        ```
+    """
+
+    def __init__(self):
+        self._groups = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(render, params):
+        """Return the registry key of an image asset.
+
+        Parameters:
+
+            render (Callable):
+                The render function of the asset.
+
+            params (Tuple):
+                The parameters passed to the render function. Sizes may
+                be given as `Scaled` values.
+
+        Returns:
+
+            Tuple:
+                A hashable key.
+        """
+        return (render.__qualname__, _hashable(params))
+
+    def get(self, key):
+        """Return the image group registered with `key`, or `None`.
+
+        Parameters:
+
+            key (Tuple):
+                The registry key.
+
+        Returns:
+
+            Union[ImageGroup, None]:
+                The image group.
+        """
+        return self._groups.get(key)
+
+    def lookup(self, key):
+        """Return the image group registered with `key`, or `None`, and
+        count the hit or miss.
+
+        Parameters:
+
+            key (Tuple):
+                The registry key.
+
+        Returns:
+
+            Union[ImageGroup, None]:
+                The image group.
+        """
+        group = self._groups.get(key)
+        if group is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            group.hits += 1
+        return group
+
+    def add(self, key, images, names, render, params, factor):
+        """Register the photoimages of an image asset.
+
+        Parameters:
+
+            key (Tuple):
+                The registry key.
+
+            images (List[PhotoImage]):
+                The photoimages.
+
+            names (List[str]):
+                The tk names of the photoimages.
+
+            render (Callable):
+                The render function of the asset.
+
+            params (Tuple):
+                The unscaled parameters passed to the render function.
+
+            factor (float):
+                The scaling factor the images were rendered with.
+
+        Returns:
+
+            ImageGroup:
+                The registered image group.
+        """
+        group = ImageGroup(images, names, render, params, factor)
+        self._groups[key] = group
+        return group
+
+    def update(self, group, render, params):
+        """Register a group again with new parameters, after the images
+        are rendered again in place.
+
+        Parameters:
+
+            group (ImageGroup):
+                The image group.
+
+            render (Callable):
+                The render function of the asset.
+
+            params (Tuple):
+                The new unscaled parameters.
+        """
+        self.discard(group)
+        group.render = render
+        group.params = params
+        self._groups.setdefault(self.make_key(render, params), group)
+
+    def discard(self, group):
+        """Remove the registration of a group, if it is registered.
+
+        Parameters:
+
+            group (ImageGroup):
+                The image group.
+        """
+        key = self.make_key(group.render, group.params)
+        if self._groups.get(key) is group:
+            del self._groups[key]
+
+    @staticmethod
+    def retain(group):
+        """Add a holder to an image group.
+
+        Parameters:
+
+            group (ImageGroup):
+                The image group.
+
+        Returns:
+
+            bool:
+                `True` if the photoimages were emptied and must be
+                rendered again.
+        """
+        group.refs += 1
+        return group.evicted
+
+    @staticmethod
+    def release(group):
+        """Remove a holder from an image group.
+
+        Parameters:
+
+            group (ImageGroup):
+                The image group.
+
+        Returns:
+
+            bool:
+                `True` if the group has no holders left, and its
+                photoimages should be emptied.
+        """
+        group.refs -= 1
+        return group.refs <= 0 and not group.evicted
+
+    def report(self):
+        """Return the number of registered images, and the number of
+        images and bytes that were saved by sharing them. The bytes are
+        estimated at 4 bytes per pixel, which is how tk stores photo
+        images.
+
+        Returns:
+
+            Dict[str, int]:
+                The `images`, `evicted`, `hits`, `misses`,
+                `images_saved`, and `bytes_saved` values.
+        """
+        images = 0
+        evicted = 0
+        images_saved = 0
+        bytes_saved = 0
+        for group in self._groups.values():
+            images += len(group.images)
+            if group.evicted:
+                evicted += len(group.images)
+            if not group.hits:
+                continue
+            images_saved += len(group.images) * group.hits
+            for image in group.images:
+                bytes_saved += image.width() * image.height() * 4 * group.hits
+        return {
+            "images": images,
+            "evicted": evicted,
+            "hits": self.hits,
+            "misses": self.misses,
+            "images_saved": images_saved,
+            "bytes_saved": bytes_saved,
+        }
+
+    def clear(self):
+        """Remove all registered images."""
+        self._groups.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def _hashable(value):
+    """Convert the lists in a parameter value into tuples."""
+    if isinstance(value, (list, tuple)):
+        items = tuple(_hashable(v) for v in value)
+        if type(value) in (list, tuple):
+            return items
+        # keep named tuples, such as `Scaled`, distinct from plain tuples
+        return type(value).__name__, items
+    return value
@@ -0,0 +1,268 @@
+"""
+    This module contains the instrumentation used to measure the cost of
+    the `StyleBuilderTTK` methods that build the ttk styles.
+
+    The profiler is enabled with `Style.enable_profiling`. For each
+    builder method and color, it records the number of calls, the wall
+    time, the time spent rendering images with PIL, the number of
+    `ttk::style` commands sent to tcl, and the number of images created.
+"""
+import csv
+import io
+import json
+from contextlib import contextmanager
+from time import perf_counter
+
+FIELDS = [
+    "method",
+    "color",
+    "calls",
+    "wall_time",
+    "render_time",
+    "tcl_calls",
+    "images",
+]
+
+
+class BuildRecord:
+    """The accumulated measurements of a style builder method for a
+    single color."""
+
+    def __init__(self, method, color):
+        """
+        Parameters:
+
+            method (str):
+                The name of the `StyleBuilderTTK` method.
+
+            color (str):
+                The color label passed to the method.
+        """
+        self.method = method
+        self.color = color
+        self.calls = 0
+        self.wall_time = 0.0
+        self.render_time = 0.0
+        self.tcl_calls = 0
+        self.images = 0
+
+    def as_dict(self):
+        """Return the measurements as a dictionary.
+
+        Returns:
+
+            Dict[str, Any]:
+                The measurements keyed by field name.
+        """
+        return {field: getattr(self, field) for field in FIELDS}
+
+    def __repr__(self):
+        return f"BuildRecord({self.as_dict()})"
+
+
+class StyleProfiler:
+    """Collects the measurements of the style builder methods.
+
+    Measurements are inclusive; if a builder method is called while
+    another is being recorded, its cost is included in both records.
+
+    Examples:
+
+        ```python
+        import ttkbootstrap as ttk
+
+        app = ttk.Window()
+        profiler = app.style.enable_profiling()
+
+        app.style.theme_use("darkly")
+
+        # the most expensive builder methods first
+        for record in profiler.records()[:5]:
+            print(record)
+
+        profiler.to_csv("theme-build.csv")
+        ```
+    """
+
+    def __init__(self):
+        self._records = {}
+        self._stack = []
+
+    @contextmanager
+    def record(self, method, color):
+        """A context manager that measures the builder method for the
+        duration of the block.
+
+        Parameters:
+
+            method (str):
+                The name of the builder method.
+
+            color (str):
+                The color label passed to the method.
+        """
+        key = (method, color or "")
+        rec = self._records.get(key)
+        if rec is None:
+            rec = self._records[key] = BuildRecord(*key)
+        rec.calls += 1
+        self._stack.append(rec)
+        start = perf_counter()
+        try:
+            yield rec
+        finally:
+            rec.wall_time += perf_counter() - start
+            self._stack.pop()
+
+    def current(self):
+        """Return the records of the builder methods that are currently
+        running, or an empty list.
+
+        Returns:
+
+            List[BuildRecord]:
+                The active records, outermost first.
+        """
+        return list(self._stack)
+
+    def count_tcl_call(self):
+        """Count a `ttk::style` command for the running builder
+        methods."""
+        for rec in self._stack:
+            rec.tcl_calls += 1
+
+    def count_images(self, count, records=None):
+        """Count the images created for the running builder methods.
+
+        Parameters:
+
+            count (int):
+                The number of images created.
+
+            records (List[BuildRecord]):
+                The records to update. Defaults to the running records.
+        """
+        for rec in self._stack if records is None else records:
+            rec.images += count
+
+    def add_render_time(self, seconds, records=None):
+        """Add time spent rendering images with PIL.
+
+        Parameters:
+
+            seconds (float):
+                The render time in seconds.
+
+            records (List[BuildRecord]):
+                The records to update. Defaults to the running records.
+        """
+        for rec in self._stack if records is None else records:
+            rec.render_time += seconds
+
+    def records(self):
+        """Return the recorded measurements, most expensive first.
+
+        Returns:
+
+            List[Dict[str, Any]]:
+                A dictionary of measurements for each builder method and
+                color.
+        """
+        recs = sorted(
+            self._records.values(), key=lambda r: r.wall_time, reverse=True
+        )
+        return [rec.as_dict() for rec in recs]
+
+    def totals(self):
+        """Return the measurements summed for each builder method
+        across all colors.
+
+        Returns:
+
+            Dict[str, Dict[str, Any]]:
+                The measurements keyed by builder method name.
+        """
+        totals = {}
+        for rec in self._records.values():
+            total = totals.setdefault(rec.method, BuildRecord(rec.method, ""))
+            total.calls += rec.calls
+            total.wall_time += rec.wall_time
+            total.render_time += rec.render_time
+            total.tcl_calls += rec.tcl_calls
+            total.images += rec.images
+        return {method: rec.as_dict() for method, rec in totals.items()}
+
+    def reset(self):
+        """Remove all recorded measurements."""
+        self._records.clear()
+
+    def to_json(self, path=None):
+        """Return the records as a json document and optionally write
+        it to a file.
+
+        Parameters:
+
+            path (str):
+                The file path to write. Optional.
+
+        Returns:
+
+            str:
+                The json document.
+        """
+        text = json.dumps(self.records(), indent=2)
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        return text
+
+    def to_csv(self, path=None):
+        """Return the records as comma separated values and optionally
+        write them to a file.
+
+        Parameters:
+
+            path (str):
+                The file path to write. Optional.
+
+        Returns:
+
+            str:
+                The csv text, including a header row.
+        """
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=FIELDS, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(self.records())
+        text = buffer.getvalue()
+        if path is not None:
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                f.write(text)
+        return text
+
+
+class TclCallCounter:
+    """A proxy for the tcl interpreter of the `Style` object that counts
+    the `ttk::style` commands made while the profiler is enabled. All
+    other attributes are delegated to the interpreter."""
+
+    def __init__(self, tk, profiler):
+        """
+        Parameters:
+
+            tk (_tkinter.tkapp):
+                The tcl interpreter.
+
+            profiler (StyleProfiler):
+                The profiler that is notified of each command.
+        """
+        self._tk = tk
+        self._profiler = profiler
+
+    def call(self, *args):
+        if args and args[0] == "ttk::style":
+            self._profiler.count_tcl_call()
+        return self._tk.call(*args)
+
+    def __getattr__(self, name):
+        return getattr(self._tk, name)
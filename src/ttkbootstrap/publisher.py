@@ -1,5 +1,8 @@
+import weakref
 from enum import Enum
-from typing import List
+from time import perf_counter
+from tkinter import TclError
+from typing import Dict, List
 
 
 class Channel(Enum):
@@ -23,7 +26,7 @@ class Subscriber:
     """A subcriber data class used to store information about a specific
     subcriber to the `Publisher`."""
 
-    def __init__(self, name, func, channel):
+    def __init__(self, name, func, channel, widget=None):
         """Create a subscriber.
 
         Parameters:
@@ -36,24 +39,85 @@ class Subscriber:
 
             channel (Channel):
                 The subscription channel.
+
+            widget (Widget):
+                The widget that is updated by the subscriber. Only a
+                weak reference to the widget is kept, and the widget is
+                passed to `func` as the first argument. Optional.
         """
         self.name = name
         self.func = func
         self.channel = channel
+        self.widget_ref = None
+        if widget is not None:
+            self.widget_ref = weakref.ref(widget, self._on_widget_deleted)
+
+    @property
+    def alive(self):
+        """`False` if the widget of the subscriber was deleted."""
+        return self.widget_ref is None or self.widget_ref() is not None
+
+    def notify(self, *args):
+        """Call the subscriber function.
+
+        Returns:
+
+            bool:
+                `False` if the widget no longer exists; otherwise `True`.
+        """
+        if self.widget_ref is None:
+            self.func(*args)
+            return True
+        widget = self.widget_ref()
+        if widget is None:
+            return False
+        try:
+            self.func(widget, *args)
+        except TclError:
+            if widget.winfo_exists():
+                raise
+            # destroyed, but the python object is still referenced
+            return False
+        return True
+
+    def _on_widget_deleted(self, _):
+        Publisher._remove(self)
 
 
 class Publisher:
     """A class used to publish events for widget updates for theme changes
-    or configurations"""
+    or configurations.
+
+    Subscribers are indexed by channel. Subscribers that are created
+    with a widget hold a weak reference to it, and are removed
+    automatically when the widget is deleted or found destroyed.
+    """
 
-    __subscribers = {}
+    __channels: Dict[Channel, Dict[str, Subscriber]] = {
+        channel: {} for channel in Channel
+    }
+    __subscribers: Dict[str, Subscriber] = {}
 
     @staticmethod
-    def subscriber_count():
-        return len(Publisher.__subscribers)
+    def subscriber_count(channel=None):
+        """Return the number of subscribers.
+
+        Parameters:
+
+            channel (Channel):
+                Count only the subscribers of this channel. Optional.
+
+        Returns:
+
+            int:
+                The number of subscribers.
+        """
+        if channel is None:
+            return len(Publisher.__subscribers)
+        return len(Publisher.__channels[channel])
 
     @staticmethod
-    def subscribe(name, func, channel):
+    def subscribe(name, func, channel, widget=None):
         """Subscribe to an event.
 
         Parameters:
@@ -66,9 +130,18 @@ class Publisher:
 
             channel (Channel):
                 Indicates the channel grouping the subscribers.
+
+            widget (Widget):
+                The widget that is updated. When provided, it is passed
+                to `func` as the first argument, and the subscription is
+                removed when the widget is deleted. Use this instead of
+                binding the widget in a closure, which keeps the widget
+                alive. Optional.
         """
-        subs = Publisher.__subscribers
-        subs[name] = Subscriber(name, func, channel)
+        Publisher.unsubscribe(name)
+        sub = Subscriber(name, func, channel, widget)
+        Publisher.__subscribers[name] = sub
+        Publisher.__channels[channel][name] = sub
 
     @staticmethod
     def unsubscribe(name):
@@ -79,24 +152,29 @@ class Publisher:
             name (str):
                 The widget's tkinter/tcl name.
         """
-        subs = Publisher.__subscribers
-        try:
-            del subs[name]
-        except:
-            pass
+        sub = Publisher.__subscribers.pop(name, None)
+        if sub is not None:
+            Publisher.__channels[sub.channel].pop(name, None)
 
+    @staticmethod
     def get_subscribers(channel):
         """Return a list of subscribers
 
+        Parameters:
+
+            channel (Channel):
+                The subscription channel.
+
         Returns:
 
-            List:
-                List of key-value tuples
+            List[Subscriber]:
+                The subscribers of the channel whose widgets still
+                exist.
         """
-        subs = Publisher.__subscribers.values()
-        channel_subs = [s for s in subs if s.channel == channel]
-        return channel_subs
+        subs = Publisher.__channels[channel].values()
+        return [s for s in subs if s.alive]
 
+    @staticmethod
     def publish_message(channel, *args):
         """Publish a message to all subscribers
 
@@ -108,11 +186,183 @@ class Publisher:
             **args:
                 optional arguments to pass to the subscribers.
         """
-        subs: List[Subscriber] = Publisher.get_subscribers(channel)
+        subs: List[Subscriber] = list(Publisher.__channels[channel].values())
         for sub in subs:
-            sub.func(*args)
+            Publisher._notify(sub, *args)
 
     @staticmethod
     def clear_subscribers():
         """Reset all subscriptions."""
         Publisher.__subscribers.clear()
+        for subs in Publisher.__channels.values():
+            subs.clear()
+
+    @staticmethod
+    def _notify(sub, *args):
+        """Notify a subscriber if it is still subscribed, and remove it
+        if its widget no longer exists."""
+        if Publisher.__subscribers.get(sub.name) is not sub:
+            return
+        if not sub.notify(*args):
+            Publisher._remove(sub)
+
+    @staticmethod
+    def _remove(sub):
+        """Remove a subscriber if it has not been replaced by a newer
+        subscriber with the same name."""
+        if Publisher.__subscribers.get(sub.name) is sub:
+            Publisher.unsubscribe(sub.name)
+
+
+class Dispatcher:
+    """Publishes messages to the subscribers in time-sliced batches on
+    the tkinter event loop, so that the application stays responsive
+    while a large number of widgets is updated.
+
+    Each batch runs until the time budget is used, and the next batch is
+    scheduled with `after`, which allows tkinter to process events and
+    redraw the window in between. The subscribers with mapped widgets
+    are updated first. Publishing to a channel while a previous message
+    to that channel is still being delivered restarts the delivery with
+    the new message, so repeated messages are coalesced into one pass.
+
+    Examples:
+
+        ```python
+        import ttkbootstrap as ttk
+
+        app = ttk.Window()
+        app.style.enable_sliced_dispatch(
+            budget=8,
+            on_progress=lambda done, total: print(done, total),
+            on_complete=lambda: print("done"),
+        )
+        ```
+    """
+
+    def __init__(self, master, budget=8, on_progress=None, on_complete=None):
+        """
+        Parameters:
+
+            master (Widget):
+                The widget used to schedule the batches.
+
+            budget (float):
+                The time budget of each batch in milliseconds.
+
+            on_progress (Callable):
+                Called with the number of updated subscribers and the
+                total number of subscribers after each batch. Optional.
+
+            on_complete (Callable):
+                Called with no arguments when all messages have been
+                delivered. Optional.
+        """
+        self.master = master
+        self.budget = budget
+        self.on_progress = on_progress
+        self.on_complete = on_complete
+        self._messages = {}  # args by channel
+        self._queue = []  # ( subscriber, args )
+        self._unmapped = []  # queued items with widgets that are not mapped
+        self._stale = False
+        self._done = 0
+        self._after_id = None
+
+    @property
+    def pending(self):
+        """`True` while messages are being delivered."""
+        return bool(self._messages)
+
+    def publish(self, channel, *args):
+        """Deliver a message to the subscribers of a channel in batches.
+
+        Parameters:
+
+            channel (Channel):
+                The subscription channel.
+
+            *args:
+                Optional arguments to pass to the subscribers.
+        """
+        self._messages[channel] = args
+        self._stale = True
+        if self._after_id is None:
+            self._after_id = self.master.after_idle(self._run_batch)
+
+    def flush(self):
+        """Deliver all pending messages immediately."""
+        if self._after_id is not None:
+            self.master.after_cancel(self._after_id)
+            self._after_id = None
+        if self._messages:
+            self._build_queue()
+            self._deliver(len(self._queue))
+            self._deliver(len(self._unmapped))
+            self._finish()
+
+    def _build_queue(self):
+        """Queue every subscriber of the pending messages, starting
+        over if a new message was published since the last batch."""
+        if not self._stale:
+            return
+        queue = []
+        for channel, args in self._messages.items():
+            subs = Publisher.get_subscribers(channel)
+            queue.extend((sub, args) for sub in subs)
+        self._queue = queue
+        self._unmapped = []
+        self._stale = False
+        self._done = 0
+
+    def _run_batch(self):
+        self._after_id = None
+        deadline = perf_counter() + self.budget / 1000
+        self._build_queue()
+        while (self._queue or self._unmapped) and perf_counter() < deadline:
+            self._deliver(16)
+        if self._queue or self._unmapped:
+            if self.on_progress is not None:
+                remaining = len(self._queue) + len(self._unmapped)
+                self.on_progress(self._done, self._done + remaining)
+            self._after_id = self.master.after(1, self._run_batch)
+        else:
+            self._finish()
+
+    def _deliver(self, count):
+        """Take the next `count` items of the queue. The widgets are
+        checked as they are reached, and the subscribers with widgets
+        that are not mapped are set aside and updated after the others.
+        """
+        if self._queue:
+            batch = self._queue[:count]
+            del self._queue[:count]
+            for sub, args in batch:
+                if self._is_mapped(sub):
+                    Publisher._notify(sub, *args)
+                    self._done += 1
+                else:
+                    self._unmapped.append((sub, args))
+        else:
+            batch = self._unmapped[:count]
+            del self._unmapped[:count]
+            for sub, args in batch:
+                Publisher._notify(sub, *args)
+            self._done += len(batch)
+
+    def _finish(self):
+        self._messages.clear()
+        if self.on_progress is not None:
+            self.on_progress(self._done, self._done)
+        if self.on_complete is not None:
+            self.on_complete()
+
+    @staticmethod
+    def _is_mapped(sub):
+        if sub.widget_ref is None:
+            return True
+        widget = sub.widget_ref()
+        try:
+            return widget is not None and bool(widget.winfo_ismapped())
+        except TclError:
+            return False
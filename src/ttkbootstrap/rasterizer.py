@@ -0,0 +1,313 @@
+"""
+    This module contains a small anti-aliased rasterizer for the shapes
+    used in the theme image assets: rectangles, rounded rectangles,
+    circles, rings, and text glyphs.
+
+    Shapes are described in a fixed *design* coordinate space (for
+    example, a 134 x 134 checkbutton), and are rasterized directly at
+    the target size of the asset. When NumPy is installed, the pixel
+    coverage of each shape is computed from its signed distance over
+    the whole image at once. Otherwise, the shapes are drawn with PIL on
+    a small supersampled image that is reduced to the target size.
+
+    Examples:
+
+        ```python
+        canvas = create_canvas((14, 14), (134, 134))
+        canvas.rounded_rectangle(
+            [2, 2, 132, 132], 16, fill="#ffffff", outline="#000000", width=6
+        )
+        image = canvas.image()
+        ```
+"""
+from functools import lru_cache
+from math import sqrt
+
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# the scale of the supersampled image when NumPy is not available
+SUPERSAMPLE = 8
+
+
+@lru_cache(maxsize=64)
+def load_font(filename, size):
+    """Load a truetype font. Fonts are cached by file name and size.
+
+    Parameters:
+
+        filename (str):
+            The font file name or path.
+
+        size (int):
+            The font size in pixels.
+
+    Returns:
+
+        Union[ImageFont.FreeTypeFont, None]:
+            The font, or `None` if the font could not be loaded.
+    """
+    try:
+        return ImageFont.truetype(filename, size)
+    except OSError:
+        return None
+
+
+def create_canvas(size, design_size):
+    """Create a canvas that rasterizes shapes described in the design
+    coordinate space to an image of `size`.
+
+    Parameters:
+
+        size (Tuple[int, int]):
+            The width and height of the image in pixels.
+
+        design_size (Tuple[int, int]):
+            The width and height of the design coordinate space.
+
+    Returns:
+
+        Union[CoverageCanvas, SupersampleCanvas]:
+            A canvas object.
+    """
+    if np is None:
+        return SupersampleCanvas(size, design_size)
+    return CoverageCanvas(size, design_size)
+
+
+class CoverageCanvas:
+    """Rasterizes shapes with signed distance coverage over NumPy
+    arrays. The box coordinates are inclusive, as in `ImageDraw`, and
+    outlines are drawn on the inside of the shape."""
+
+    def __init__(self, size, design_size):
+        """
+        Parameters:
+
+            size (Tuple[int, int]):
+                The width and height of the image in pixels.
+
+            design_size (Tuple[int, int]):
+                The width and height of the design coordinate space.
+        """
+        self.width, self.height = (int(x) for x in size)
+        self.sx = self.width / design_size[0]
+        self.sy = self.height / design_size[1]
+        self.scale = sqrt(self.sx * self.sy)
+        self._x = np.arange(self.width, dtype=np.float32)[None, :] + 0.5
+        self._y = np.arange(self.height, dtype=np.float32)[:, None] + 0.5
+        shape = (self.height, self.width)
+        self._color = np.zeros(shape + (3,), dtype=np.float32)  # premultiplied
+        self._alpha = np.zeros(shape, dtype=np.float32)
+
+    def rectangle(self, box, fill=None, outline=None, width=0):
+        """Draw a rectangle."""
+        self.rounded_rectangle(box, 0, fill, outline, width)
+
+    def rounded_rectangle(self, box, radius, fill=None, outline=None, width=0):
+        """Draw a rectangle with rounded corners."""
+        cx, cy, hx, hy = self._target_box(box)
+        r = min(radius * self.scale, hx, hy)
+        qx = np.abs(self._x - cx) - hx + r
+        qy = np.abs(self._y - cy) - hy + r
+        outside = np.hypot(np.maximum(qx, 0), np.maximum(qy, 0))
+        inside = np.minimum(np.maximum(qx, qy), 0)
+        self._shape(outside + inside - r, fill, outline, width)
+
+    def ellipse(self, box, fill=None, outline=None, width=0):
+        """Draw an ellipse that fits in the box."""
+        cx, cy, rx, ry = self._target_box(box)
+        px = (self._x - cx) / rx
+        py = (self._y - cy) / ry
+        k0 = np.hypot(px, py)
+        k1 = np.hypot(px / rx, py / ry)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dist = np.where(k1 > 0, k0 * (k0 - 1) / k1, -min(rx, ry))
+        self._shape(dist, fill, outline, width)
+
+    def text(self, xy, text, font, fill):
+        """Draw text with a font that is scaled to the target size.
+
+        Parameters:
+
+            xy (Tuple[float, float]):
+                The top left position of the text.
+
+            text (str):
+                The text to draw.
+
+            font (Tuple[str, int]):
+                The font file name and the font size in design units.
+                If `None`, or if the font cannot be loaded, the default
+                PIL font is used.
+
+            fill (str):
+                The text color.
+        """
+        fnt = None
+        if font is not None:
+            fnt = load_font(font[0], max(1, round(font[1] * self.scale)))
+        if fnt is None:
+            fnt = ImageFont.load_default()
+        mask = Image.new("L", (self.width, self.height))
+        ImageDraw.Draw(mask).text(
+            (xy[0] * self.sx, xy[1] * self.sy), text, font=fnt, fill=255
+        )
+        coverage = np.asarray(mask, dtype=np.float32) / 255
+        self._paint([(coverage, fill)])
+
+    def image(self):
+        """Return the rasterized image.
+
+        Returns:
+
+            Image.Image:
+                An RGBA image.
+        """
+        alpha = self._alpha[..., None]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            color = np.where(alpha > 0, self._color / alpha, 0)
+        pixels = np.concatenate([color, alpha * 255], axis=2)
+        pixels = np.clip(np.rint(pixels), 0, 255).astype(np.uint8)
+        return Image.fromarray(pixels, "RGBA")
+
+    def _target_box(self, box):
+        """Return the center and half size of a design box in pixels."""
+        x0 = box[0] * self.sx
+        y0 = box[1] * self.sy
+        x1 = (box[2] + 1) * self.sx
+        y1 = (box[3] + 1) * self.sy
+        return (x0 + x1) / 2, (y0 + y1) / 2, (x1 - x0) / 2, (y1 - y0) / 2
+
+    def _shape(self, dist, fill, outline, width):
+        """Paint the fill and the inside outline of a shape from its
+        signed distance in pixels. The fill and the outline are painted
+        as a single layer, so that the anti-aliased edge of an outlined
+        shape is not covered twice."""
+        coverage = np.clip(0.5 - dist, 0, 1)
+        layers = []
+        if outline and width:
+            inner = np.clip(0.5 - (dist + width * self.scale), 0, 1)
+            layers.append((coverage - inner, outline))
+            if fill:
+                layers.append((inner, fill))
+        elif fill:
+            layers.append((coverage, fill))
+        if layers:
+            self._paint(layers)
+
+    def _paint(self, layers):
+        """Composite a layer over the image. The layer is made of
+        `(coverage, color)` parts that do not overlap."""
+        color = np.zeros_like(self._color)
+        alpha = np.zeros_like(self._alpha)
+        for coverage, fill in layers:
+            rgba = ImageColor.getrgb(fill)
+            opacity = rgba[3] / 255 if len(rgba) == 4 else 1.0
+            part = coverage * opacity
+            color += part[..., None] * np.array(rgba[:3], dtype=np.float32)
+            alpha += part
+        self._color *= (1 - alpha)[..., None]
+        self._color += color
+        self._alpha *= 1 - alpha
+        self._alpha += alpha
+
+
+class SupersampleCanvas:
+    """Draws shapes with `ImageDraw` on an image that is `SUPERSAMPLE`
+    times larger than the target size, and reduces it to the target
+    size. This is used when NumPy is not installed."""
+
+    def __init__(self, size, design_size):
+        """
+        Parameters:
+
+            size (Tuple[int, int]):
+                The width and height of the image in pixels.
+
+            design_size (Tuple[int, int]):
+                The width and height of the design coordinate space.
+        """
+        self.width, self.height = (int(x) for x in size)
+        self.kx = self.width * SUPERSAMPLE / design_size[0]
+        self.ky = self.height * SUPERSAMPLE / design_size[1]
+        self.scale = sqrt(self.kx * self.ky)
+        self._image = Image.new(
+            "RGBA", (self.width * SUPERSAMPLE, self.height * SUPERSAMPLE)
+        )
+        self._draw = ImageDraw.Draw(self._image)
+
+    def rectangle(self, box, fill=None, outline=None, width=0):
+        """Draw a rectangle."""
+        self._draw.rectangle(
+            self._target_box(box), fill, outline, self._width(width)
+        )
+
+    def rounded_rectangle(self, box, radius, fill=None, outline=None, width=0):
+        """Draw a rectangle with rounded corners."""
+        self._draw.rounded_rectangle(
+            self._target_box(box),
+            radius * self.scale,
+            fill,
+            outline,
+            self._width(width),
+        )
+
+    def ellipse(self, box, fill=None, outline=None, width=0):
+        """Draw an ellipse that fits in the box."""
+        self._draw.ellipse(
+            self._target_box(box), fill, outline, self._width(width)
+        )
+
+    def text(self, xy, text, font, fill):
+        """Draw text with a font that is scaled to the target size.
+
+        Parameters:
+
+            xy (Tuple[float, float]):
+                The top left position of the text.
+
+            text (str):
+                The text to draw.
+
+            font (Tuple[str, int]):
+                The font file name and the font size in design units.
+                If `None`, or if the font cannot be loaded, the default
+                PIL font is used.
+
+            fill (str):
+                The text color.
+        """
+        fnt = None
+        if font is not None:
+            fnt = load_font(font[0], max(1, round(font[1] * self.scale)))
+        if fnt is None:
+            fnt = ImageFont.load_default()
+        self._draw.text(
+            (xy[0] * self.kx, xy[1] * self.ky), text, font=fnt, fill=fill
+        )
+
+    def image(self):
+        """Return the rasterized image.
+
+        Returns:
+
+            Image.Image:
+                An RGBA image.
+        """
+        return self._image.resize((self.width, self.height), Image.BOX)
+
+    def _target_box(self, box):
+        return [
+            round(box[0] * self.kx),
+            round(box[1] * self.ky),
+            round((box[2] + 1) * self.kx) - 1,
+            round((box[3] + 1) * self.ky) - 1,
+        ]
+
+    def _width(self, width):
+        return max(1, round(width * self.scale)) if width else 0
@@ -1,15 +1,27 @@
 import re
+import json
+import atexit
 import colorsys
+import weakref
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from time import perf_counter
 from tkinter import font
 from math import ceil
 from tkinter import TclError, ttk
-from typing import Any, Callable
-from PIL import ImageTk, ImageDraw, Image, ImageFont
+from functools import lru_cache
+from typing import Any, Callable, NamedTuple
+from PIL import ImageTk, ImageDraw, Image
 from ttkbootstrap.constants import *
 from ttkbootstrap.themes.standard import STANDARD_THEMES
-from ttkbootstrap.publisher import Publisher, Channel
+from ttkbootstrap.publisher import Publisher, Channel, Dispatcher
 from ttkbootstrap import utility as util
+from ttkbootstrap.assetcache import AssetCache, DEFAULT_MAX_BYTES
+from ttkbootstrap.imageregistry import ImageRegistry
+from ttkbootstrap.profiler import StyleProfiler, TclCallCounter
+from ttkbootstrap.rasterizer import create_canvas, load_font
+from ttkbootstrap.tclbatch import TclBatch
 from PIL import ImageColor
 
 try:
@@ -18,6 +30,9 @@ try:
 except:
     USER_THEMES = {}
 
+# increment when the layout of the style manifest file changes
+STYLE_MANIFEST_FORMAT = 1
+
 class Colors:
     """A class that defines the color scheme for a theme as well as
     provides several static methods for manipulating colors.
@@ -460,6 +475,13 @@ class Style(ttk.Style):
     """
 
     instance = None
+    asset_cache = None
+    asset_executor = None
+    lazy_rebuild = False
+    keep_themes = None
+    defer_styles = False
+    compiled_themes = {}
+    style_manifest = None
 
     def __new__(cls, theme=None):
         if Style.instance is None:
@@ -482,12 +504,33 @@ class Style(ttk.Style):
         self._theme_definitions = {}
         self._style_registry = set()  # all styles used
         self._theme_styles = {}  # styles used in theme
+        self._widget_styles = weakref.WeakKeyDictionary()  # style by widget
         self._theme_names = set()
+        self._recent_themes = []  # least recently used first
+        self._prebuild_themes = []  # themes to prebuild, in order
+        self._prebuild_budget = 8
+        self._prebuild_complete = None
+        self._prebuild_id = None
+        self.build_time = 0.0  # seconds to build the styles of last theme
+        self.profiler = None
+        self.dispatcher = None
+        self._tcl_batch = None
+        self._deferred_styles = {}  # ResolvedStyle by ttk style name
+        self._fallback_layouts = {}  # ( theme, layout ): exists
+        self._deferred_hook = None
+        self._existing_elements = None  # kept while a theme is recolored
+        self.image_registry = ImageRegistry()  # images shared by themes
         self._load_themes()
         super().__init__()
 
         Style.instance = self
+        util.get_scaling_context(self.master).subscribe(
+            self._on_scaling_change
+        )
+        self._install_popdown_hook()
         self.theme_use(theme)
+        if Style.style_manifest is not None:
+            self._build_manifest_styles(Style.style_manifest)
 
         # apply localization
         from ttkbootstrap import localization
@@ -568,6 +611,19 @@ class Style(ttk.Style):
         runtime. Otherwise, pass the theme name into the Style
         constructor to instantiate the style with a theme.
 
+        The widgets are updated before this method returns, unless
+        sliced dispatch is enabled with `enable_sliced_dispatch`.
+
+        By default, every style created since the application started
+        is rebuilt for the new theme. When `Style.lazy_rebuild` is
+        `True`, only the styles used by existing widgets are rebuilt;
+        other styles are built when a widget first requests them.
+
+        When `Style.keep_themes` is set to a number, the image assets
+        of the themes that were used less recently than the current
+        theme and that number of other themes are evicted with
+        `evict_themes`.
+
         Parameters:
 
             themename (str):
@@ -588,17 +644,84 @@ class Style(ttk.Style):
         if themename in existing_themes:
             self.theme = self._theme_definitions.get(themename)
             super().theme_use(themename)
+            self._get_builder().rescale_image_assets()
             self._create_ttk_styles_on_theme_change()
-            Publisher.publish_message(Channel.STD)
+            self._publish_theme_change()
         # setup a new theme
         elif themename in self._theme_names:
             self.theme = self._theme_definitions.get(themename)
             self._theme_objects[themename] = StyleBuilderTTK()
             self._create_ttk_styles_on_theme_change()
-            Publisher.publish_message(Channel.STD)
+            self._publish_theme_change()
         else:
             raise TclError(themename, "is not a valid theme.")
 
+        if themename in self._recent_themes:
+            self._recent_themes.remove(themename)
+        self._recent_themes.append(themename)
+        if Style.keep_themes is not None:
+            self.evict_themes(Style.keep_themes)
+
+    def update_theme_colors(self, themename, **colors):
+        """Change the colors of a theme and update its styles in place.
+
+        Only the styles whose builder methods read one of the changed
+        color labels are built again, and only their image assets are
+        rendered again, into the existing photoimages. If the theme is
+        current, the widgets are updated. A theme that was not created
+        yet is built with the new colors when it is first used.
+
+        Image assets that are shared with other styles or themes are not
+        changed; the recolored styles are given new photoimages, and
+        their elements are created again under a new name. A theme that
+        was installed from a compiled theme is built from python the
+        first time its colors are updated.
+
+        Parameters:
+
+            themename (str):
+                The name of the theme.
+
+            **colors:
+                The new color values by color label, such as
+                `primary="#ff0000"`.
+
+        Returns:
+
+            int:
+                The number of styles that were updated.
+
+        Examples:
+
+            ```python
+            import ttkbootstrap as ttk
+
+            app = ttk.Window(themename="litera")
+            app.style.update_theme_colors("litera", primary="#7b2cbf")
+            ```
+        """
+        definition = self._theme_definitions.get(themename)
+        if definition is None:
+            raise TclError(themename, "is not a valid theme.")
+        labels = set()
+        for label, value in colors.items():
+            if definition.colors.get(label) != value:
+                definition.colors.set(label, value)
+                labels.add(label)
+        builder: StyleBuilderTTK = self._theme_objects.get(themename)
+        if not labels or builder is None:
+            return 0
+        if themename == self.theme.name:
+            count = builder.recolor(labels)
+            self._publish_theme_change()
+            return count
+        current = self.theme
+        self.theme = definition
+        try:
+            return self._in_theme_settings(themename, builder.recolor, labels)
+        finally:
+            self.theme = current
+
     def style_exists_in_theme(self, ttkstyle: str):
         """Check if a style exists in the current theme.
 
@@ -617,11 +740,676 @@ class Style(ttk.Style):
         exists_in_registry = ttkstyle in self._style_registry
         return exists_in_theme and exists_in_registry
 
+    def styles_in_use(self):
+        """Return the ttk styles that are used by existing ttkbootstrap
+        widgets.
+
+        Returns:
+
+            Set[str]:
+                A set of ttk style names.
+        """
+        return set(self._widget_styles.values())
+
+    def style_refcounts(self):
+        """Return the number of existing ttkbootstrap widgets that use
+        each ttk style.
+
+        Returns:
+
+            Dict[str, int]:
+                The number of widgets by ttk style name.
+        """
+        counts = {}
+        for ttkstyle in self._widget_styles.values():
+            counts[ttkstyle] = counts.get(ttkstyle, 0) + 1
+        return counts
+
+    def evict_themes(self, keep=1):
+        """Release the image assets of the themes that were not used
+        recently. The current theme and the `keep` most recently used
+        other themes are kept.
+
+        The photoimages of the evicted styles are emptied, unless they
+        are shared with a style that is kept. Themes that are scheduled
+        to be prebuilt with `prebuild_themes` are also kept. Tk cannot
+        delete a theme or its elements, so the style settings remain;
+        when an evicted theme is used again, its styles are restored by
+        rendering their images again.
+
+        Parameters:
+
+            keep (int):
+                The number of recently used themes to keep in addition
+                to the current theme.
+
+        Returns:
+
+            int:
+                The number of styles that were evicted.
+        """
+        current = self.theme.name
+        others = [t for t in self._recent_themes if t != current]
+        kept = set(others[len(others) - keep:] if keep > 0 else [])
+        kept.add(current)
+        kept.update(self._prebuild_themes)
+        count = 0
+        for themename, builder in self._theme_objects.items():
+            if themename not in kept:
+                count += builder.evict_styles()
+        return count
+
+    def evict_unused_styles(self):
+        """Release the image assets of the styles that are not used by
+        any existing ttkbootstrap widget, in every theme. The parents of
+        the styles in use are kept as well. An evicted style is restored
+        when a widget requests it again.
+
+        Returns:
+
+            int:
+                The number of styles that were evicted.
+        """
+        in_use = set(self._widget_styles.values())
+        count = 0
+        for builder in self._theme_objects.values():
+            count += builder.evict_styles(keep=in_use)
+        return count
+
+    def memory_report(self):
+        """Return the number of photoimages and the pixel memory used by
+        the image assets of each theme, and in total. The pixel memory
+        is estimated at 4 bytes per pixel. Images that are shared by
+        several themes are included in each theme, but only once in the
+        total.
+
+        Returns:
+
+            Dict[str, Any]:
+                The `themes` usage by theme name, the total `images` and
+                `bytes`, and the `shared` image statistics of the
+                `image_registry`.
+        """
+        themes = {}
+        sizes = {}
+        for themename, builder in self._theme_objects.items():
+            themes[themename] = builder.memory_usage(sizes)
+        return {
+            "themes": themes,
+            "images": len(sizes),
+            "bytes": sum(sizes.values()),
+            "shared": self.image_registry.report(),
+        }
+
+    def _track_widget_style(self, widget, ttkstyle):
+        """Record the ttk style that is used by a widget. The record is
+        removed automatically when the widget object is deleted.
+
+        Parameters:
+
+            widget (ttk.Widget):
+                The widget instance.
+
+            ttkstyle (str):
+                The name of the ttk style used by the widget.
+        """
+        if ttkstyle:
+            self._widget_styles[widget] = ttkstyle
+        else:
+            self._widget_styles.pop(widget, None)
+
     @staticmethod
     def get_instance():
         """Returns and instance of the style class"""
         return Style.instance
 
+    @staticmethod
+    def enable_asset_cache(directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        """Store the generated theme image assets in a persistent disk
+        cache so that they are loaded instead of redrawn the next time
+        the application is started.
+
+        Call this method *before* the `Style` or `Window` is created so
+        that the assets of the startup theme are also cached.
+
+        Parameters:
+
+            directory (Union[str, Path]):
+                The directory where the assets are stored. By default,
+                this is a folder in the user cache directory.
+
+            max_bytes (int):
+                The maximum size of the cache on disk, in bytes. The
+                least recently used assets are removed when this limit
+                is exceeded.
+
+        Returns:
+
+            AssetCache:
+                The asset cache object.
+        """
+        Style.asset_cache = AssetCache(directory, max_bytes)
+        return Style.asset_cache
+
+    @staticmethod
+    def enable_style_manifest(path):
+        """Build the ttk styles listed in a manifest file when the
+        `Style` is created, and write the ttk styles registered during
+        this run to the manifest when the application exits.
+
+        Applications tend to use the same styles on every run. With a
+        manifest, these styles are built in one pass at startup, before
+        the widgets are created, instead of one at a time while the
+        widgets are created. The pass uses the parallel image assets
+        if they are enabled with `enable_parallel_assets`.
+
+        Call this method *before* the `Style` or `Window` is created.
+
+        Parameters:
+
+            path (Union[str, Path]):
+                The path of the manifest file. It is created if it does
+                not exist.
+        """
+        if Style.style_manifest is None:
+            atexit.register(Style._save_style_manifest_at_exit)
+        Style.style_manifest = path
+
+    @staticmethod
+    def disable_style_manifest():
+        """Stop reading and writing the style manifest. The manifest
+        file is not removed."""
+        Style.style_manifest = None
+
+    def save_style_manifest(self, path):
+        """Write the ttk styles registered since the application
+        started to a manifest file that can be used with
+        `enable_style_manifest`.
+
+        Parameters:
+
+            path (Union[str, Path]):
+                The path of the manifest file.
+        """
+        manifest = {
+            "format": STYLE_MANIFEST_FORMAT,
+            "styles": sorted(self._style_registry),
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=1)
+
+    @staticmethod
+    def load_style_manifest(path):
+        """Read the ttk style names from a manifest file.
+
+        Parameters:
+
+            path (Union[str, Path]):
+                The path of the manifest file.
+
+        Returns:
+
+            List[str]:
+                The ttk style names, or an empty list if the file does
+                not exist or is not a valid manifest.
+        """
+        try:
+            with open(path, encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return []
+        if not isinstance(manifest, dict):
+            return []
+        if manifest.get("format") != STYLE_MANIFEST_FORMAT:
+            return []
+        return [s for s in manifest.get("styles", []) if isinstance(s, str)]
+
+    @staticmethod
+    def _save_style_manifest_at_exit():
+        style = Style.get_instance()
+        if style is None or Style.style_manifest is None:
+            return
+        try:
+            style.save_style_manifest(Style.style_manifest)
+        except OSError:
+            pass
+
+    def _build_manifest_styles(self, path):
+        """Build the ttk styles of a manifest in the current theme.
+        Styles that ttkbootstrap cannot build, such as user styles that
+        were registered with `configure`, are skipped."""
+        ttkstyles = []
+        for ttkstyle in Style.load_style_manifest(path):
+            resolved = Bootstyle.resolve(string=ttkstyle)
+            if hasattr(StyleBuilderTTK, resolved.method_name):
+                ttkstyles.append(ttkstyle)
+        self._build_ttkstyles(ttkstyles)
+
+    @staticmethod
+    def enable_parallel_assets(max_workers=None):
+        """Render the theme image assets in a pool of worker threads
+        when the theme is changed.
+
+        The images are drawn with PIL off the main thread, while the
+        ttk elements and layouts are created on the main thread. The
+        photoimages are updated with the rendered images when all of
+        the styles have been built. The time spent building the styles
+        is available in `Style.build_time`.
+
+        Parameters:
+
+            max_workers (int):
+                The maximum number of worker threads. By default, this
+                is determined by `concurrent.futures.ThreadPoolExecutor`.
+        """
+        Style.disable_parallel_assets()
+        Style.asset_executor = ThreadPoolExecutor(
+            max_workers, thread_name_prefix="ttkbootstrap-assets"
+        )
+
+    @staticmethod
+    def disable_parallel_assets():
+        """Render the theme image assets on the main thread."""
+        if Style.asset_executor is not None:
+            Style.asset_executor.shutdown(wait=True)
+        Style.asset_executor = None
+
+    @staticmethod
+    def disable_asset_cache():
+        """Stop reading and writing image assets to the disk cache.
+        The cached files are not removed; use `AssetCache.clear` to
+        remove them."""
+        Style.asset_cache = None
+
+    def enable_profiling(self):
+        """Record the cost of each style builder method and color;
+        including the wall time, the time spent rendering images with
+        PIL, the number of `ttk::style` commands, and the number of
+        images created.
+
+        If profiling is already enabled, the existing profiler is
+        returned.
+
+        Returns:
+
+            StyleProfiler:
+                The profiler object that holds the measurements.
+        """
+        if self.profiler is None:
+            self.profiler = StyleProfiler()
+            self.tk = TclCallCounter(self.tk, self.profiler)
+        return self.profiler
+
+    def disable_profiling(self):
+        """Stop recording the cost of the style builder methods.
+
+        Returns:
+
+            StyleProfiler:
+                The profiler object that holds the measurements, or
+                `None` if profiling was not enabled.
+        """
+        profiler = self.profiler
+        if isinstance(self.tk, TclCallCounter):
+            self.tk = self.tk._tk
+        self.profiler = None
+        return profiler
+
+    def enable_sliced_dispatch(
+        self, budget=8, on_progress=None, on_complete=None
+    ):
+        """Update the widgets after a theme change in time-sliced
+        batches on the event loop, instead of before `theme_use`
+        returns. The mapped widgets are updated first, and theme changes
+        made while an update is in progress are coalesced into a single
+        update.
+
+        If sliced dispatch is already enabled, the settings of the
+        existing dispatcher are replaced.
+
+        Parameters:
+
+            budget (float):
+                The time budget of each batch in milliseconds.
+
+            on_progress (Callable):
+                Called with the number of updated widgets and the total
+                number of widgets after each batch. Optional.
+
+            on_complete (Callable):
+                Called with no arguments when all widgets have been
+                updated. Optional.
+
+        Returns:
+
+            Dispatcher:
+                The dispatcher object.
+        """
+        if self.dispatcher is None:
+            self.dispatcher = Dispatcher(self.master)
+        self.dispatcher.budget = budget
+        self.dispatcher.on_progress = on_progress
+        self.dispatcher.on_complete = on_complete
+        return self.dispatcher
+
+    def disable_sliced_dispatch(self):
+        """Update the widgets before `theme_use` returns. Any pending
+        widget updates are completed immediately."""
+        if self.dispatcher is not None:
+            self.dispatcher.flush()
+        self.dispatcher = None
+
+    def prebuild_themes(self, *themenames, budget=8, on_complete=None):
+        """Build the styles of other themes in the background, so that
+        changing to one of these themes later is fast. The themes are
+        built in small slices when tkinter is idle, in the order given.
+
+        The styles that are built are the styles that `theme_use` would
+        build; when styles are added while the themes are prebuilt, they
+        are also built. The current theme and the look of the existing
+        widgets are not changed.
+
+        Parameters:
+
+            *themenames (str):
+                The names of the themes to prebuild.
+
+            budget (float):
+                The maximum time of each slice in milliseconds. A single
+                style that takes longer is still completed.
+
+            on_complete (Callable):
+                Called with no arguments when all themes are built.
+                Optional.
+        """
+        for themename in themenames:
+            if themename not in self._theme_names:
+                raise TclError(themename, "is not a valid theme.")
+        self._prebuild_themes = list(themenames)
+        self._prebuild_budget = budget
+        self._prebuild_complete = on_complete
+        if self._prebuild_id is None:
+            self._prebuild_id = self.master.after_idle(self._prebuild_slice)
+
+    def cancel_prebuild(self):
+        """Stop prebuilding themes. The styles that were already built
+        are kept."""
+        if self._prebuild_id is not None:
+            self.master.after_cancel(self._prebuild_id)
+            self._prebuild_id = None
+        self._prebuild_themes = []
+        self._prebuild_complete = None
+
+    def _prebuild_slice(self):
+        """Build styles of the next theme to prebuild until the time
+        budget is used, and schedule the next slice."""
+        self._prebuild_id = None
+        deadline = perf_counter() + self._prebuild_budget / 1000
+        while self._prebuild_themes and perf_counter() < deadline:
+            themename = self._prebuild_themes[0]
+            if themename == self.theme.name or self._prebuild(
+                themename, deadline
+            ):
+                self._prebuild_themes.pop(0)
+        if self._prebuild_themes:
+            self._prebuild_id = self.master.after_idle(self._prebuild_slice)
+        elif self._prebuild_complete is not None:
+            on_complete = self._prebuild_complete
+            self._prebuild_complete = None
+            on_complete()
+
+    def _prebuild(self, themename, deadline):
+        """Build the theme, or the styles it is missing, until the
+        deadline. The theme is current only for the style commands, so
+        the widgets are not notified.
+
+        Returns:
+
+            bool:
+                `True` if the theme has all styles.
+        """
+        current = self.theme
+        self.theme = self._theme_definitions[themename]
+        try:
+            if themename not in self._theme_objects:
+                builder = StyleBuilderTTK(activate=False)
+                self._theme_objects[themename] = builder
+                return False
+            return self._in_theme_settings(
+                themename, self._prebuild_styles, deadline
+            )
+        finally:
+            self.theme = current
+
+    def _prebuild_styles(self, deadline):
+        builder: StyleBuilderTTK = self._get_builder()
+        if Style.lazy_rebuild:
+            ttkstyles = self._style_registry & self.styles_in_use()
+        else:
+            ttkstyles = list(self._style_registry)
+        for ttkstyle in ttkstyles:
+            if perf_counter() >= deadline:
+                return False
+            if not self.style_exists_in_theme(ttkstyle):
+                resolved = Bootstyle.resolve(string=ttkstyle)
+                builder.build_style(resolved.method_name, resolved.color)
+        return True
+
+    @contextmanager
+    def batch_commands(self, origin=None):
+        """A context manager that batches the `ttk::style` commands that
+        change the theme, and evaluates them in tcl as a single script
+        at the end of the block. Commands that read from tcl evaluate
+        the batched commands first. If the context is already active,
+        the commands are added to the existing batch.
+
+        The style builder methods are batched automatically.
+
+        Parameters:
+
+            origin (str):
+                A description of the code in the block, which is added
+                to the error message if a command fails. Optional.
+        """
+        if self._tcl_batch is not None:
+            yield
+            return
+        # insert the batch below the proxies of the profiler or compiler,
+        #   so that they still see each command
+        owner, attr = self, "tk"
+        while hasattr(getattr(owner, attr), "_tk"):
+            owner, attr = getattr(owner, attr), "_tk"
+        interp = getattr(owner, attr)
+        batch = self._tcl_batch = TclBatch(interp)
+        setattr(owner, attr, batch)
+        try:
+            yield
+        except BaseException:
+            # keep the commands made before the error, as without batching
+            try:
+                batch.flush(origin)
+            except TclError:
+                pass
+            raise
+        else:
+            batch.flush(origin)
+        finally:
+            setattr(owner, attr, interp)
+            self._tcl_batch = None
+
+    def _in_theme_settings(self, themename, func, *args):
+        """Call `func` with `args` while `themename` is the current
+        theme of the `ttk::style` commands, without changing the theme
+        of the widgets.
+
+        Returns:
+
+            Any:
+                The return value of `func`.
+        """
+        outcome = []
+
+        def callback():
+            try:
+                outcome.append((True, func(*args)))
+            except BaseException as exc:
+                outcome.append((False, exc))
+
+        command = self.master.register(callback)
+        try:
+            self.tk.call(
+                "ttk::style", "theme", "settings", themename, command
+            )
+        finally:
+            self.master.deletecommand(command)
+        ok, value = outcome[0]
+        if not ok:
+            raise value
+        return value
+
+    def build_deferred_styles(self):
+        """Build the styles that are waiting for a widget to be mapped.
+
+        When `Style.defer_styles` is `True`, a ttk style that does not
+        exist yet is not built when a widget is created with it. The
+        widget is created with the style name, which ttk draws with the
+        layout of the widget class until the style is built, and the
+        style is built when the first widget that uses it is mapped.
+        Widgets in hidden notebook tabs or withdrawn windows do not
+        build their styles until they are shown. Call this method, for
+        example with `after_idle`, to build the remaining styles.
+
+        Returns:
+
+            int:
+                The number of styles that were built.
+        """
+        ttkstyles = list(self._deferred_styles)
+        for ttkstyle in ttkstyles:
+            self._build_deferred_style(ttkstyle)
+        return len(ttkstyles)
+
+    def _defer_style(self, resolved):
+        """Record a style to build when a widget that uses it is
+        mapped. A style is only deferred when ttk has a layout to fall
+        back on until it is built.
+
+        Parameters:
+
+            resolved (ResolvedStyle):
+                The resolved style.
+
+        Returns:
+
+            bool:
+                `True` if the style is deferred.
+        """
+        ttkstyle = resolved.ttkstyle
+        if ttkstyle in self._deferred_styles:
+            return True
+        parts = ttkstyle.split(".")
+        for i in range(1, len(parts)):
+            if self._layout_exists(".".join(parts[i:])):
+                self._deferred_styles[ttkstyle] = resolved
+                return True
+        return False
+
+    def _layout_exists(self, layout):
+        """Return `True` if the current theme has a layout."""
+        key = (self.theme.name, layout)
+        exists = self._fallback_layouts.get(key)
+        if exists is None:
+            try:
+                self.tk.call("ttk::style", "layout", layout)
+                exists = True
+            except TclError:
+                exists = False
+            self._fallback_layouts[key] = exists
+        return exists
+
+    def _watch_deferred(self, widget, ttkstyle):
+        """Build a deferred style when the widget is first mapped."""
+        if ttkstyle not in self._deferred_styles:
+            return
+        if self._deferred_hook is None:
+            self._deferred_hook = self.master.register(
+                self._build_deferred_style
+            )
+            self.tk.eval(
+                f"""
+                namespace eval ::ttkbootstrap {{ variable deferred }}
+                bind all <Map> {{+
+                    if {{[info exists ::ttkbootstrap::deferred(%W)]}} {{
+                        {self._deferred_hook} $::ttkbootstrap::deferred(%W)
+                        unset -nocomplain ::ttkbootstrap::deferred(%W)
+                    }}
+                }}
+                bind all <Destroy> {{+
+                    unset -nocomplain ::ttkbootstrap::deferred(%W)
+                }}
+                """
+            )
+        self.tk.call("set", f"::ttkbootstrap::deferred({widget})", ttkstyle)
+
+    def _build_deferred_style(self, ttkstyle):
+        """Build a deferred style in the current theme."""
+        resolved = self._deferred_styles.pop(ttkstyle, None)
+        if resolved is None or self.style_exists_in_theme(ttkstyle):
+            return
+        builder: StyleBuilderTTK = self._get_builder()
+        builder.build_style(resolved.method_name, resolved.color)
+
+    def _install_popdown_hook(self):
+        """Style the popdown window of a combobox when tk creates it,
+        which is the first time the combobox is posted. The popdown
+        window is created by `ttk::combobox::PopdownWindow`, which is
+        wrapped so that the popdown is styled before it is placed."""
+        command = self.master.register(self._on_popdown_created)
+        self.tk.eval(
+            f"""
+            if {{[info procs ::ttk::combobox::CreatePopdownWindow] eq ""}} {{
+                rename ::ttk::combobox::PopdownWindow \\
+                    ::ttk::combobox::CreatePopdownWindow
+            }}
+            proc ::ttk::combobox::PopdownWindow {{cb}} {{
+                set created [expr {{![winfo exists $cb.popdown]}}]
+                set popdown [::ttk::combobox::CreatePopdownWindow $cb]
+                if {{$created}} {{ {command} $cb }}
+                return $popdown
+            }}
+            """
+        )
+
+    def _on_popdown_created(self, name):
+        """Style a new combobox popdown window and subscribe it to
+        theme changes.
+
+        Parameters:
+
+            name (str):
+                The tcl/tk name of the combobox.
+        """
+        try:
+            widget = self.master.nametowidget(name)
+        except KeyError:
+            return  # not created by tkinter
+        Publisher.subscribe(
+            name=str(widget),
+            func=Bootstyle.update_combobox_popdown_style,
+            channel=Channel.TTK,
+            widget=widget,
+        )
+        self._get_builder().update_combobox_popdown_style(widget)
+
+    def _publish_theme_change(self):
+        """Notify the subscribed widgets that the theme has changed."""
+        if self.dispatcher is None:
+            Publisher.publish_message(Channel.STD)
+            Publisher.publish_message(Channel.TTK)
+        else:
+            self.dispatcher.publish(Channel.STD)
+            self.dispatcher.publish(Channel.TTK)
+
     @staticmethod
     def _get_builder():
         """Get the object that builds the widget styles for the current
@@ -655,6 +1443,60 @@ class Style(ttk.Style):
         """Calls configure of superclass; used by style builder classes."""
         super().configure(style, **kw)
 
+    def element_create(self, elementname, etype, *args, **kw):
+        """Create a new element in the current theme. While the colors
+        of a theme are updated, existing elements are kept, because an
+        element cannot be created twice; their images are updated in
+        place. An existing element whose images were replaced, because
+        they are shared with other styles, is created again under a new
+        name that the layouts of the theme use instead."""
+        elements = self._existing_elements
+        if elements is not None and elementname in elements:
+            alias = self._get_builder()._alias_element(elementname, args)
+            if alias is None:
+                return
+            elementname = alias
+        super().element_create(elementname, etype, *args, **kw)
+
+    def layout(self, style, layoutspec=None):
+        """Define the widget layout of a style, or return it. The
+        elements that were created again under a new name while the
+        colors of the theme were updated are used in the layout."""
+        if layoutspec:
+            builder = self._theme_objects.get(self.theme.name)
+            if builder is not None:
+                layoutspec = builder._alias_layout(layoutspec)
+        return super().layout(style, layoutspec)
+
+    @staticmethod
+    def load_compiled_theme(path):
+        """Load a theme that was compiled with `ttkbootstrap.compile`.
+
+        When the theme is first used, the compiled tcl script is
+        evaluated instead of building the theme; unless the ttkbootstrap
+        version, theme colors, or scaling factor differ from those used
+        to compile it. Call this method *before* the `Style` or `Window`
+        is created to use it for the startup theme.
+
+        Parameters:
+
+            path (str):
+                The path of the compiled theme.
+
+        Returns:
+
+            CompiledTheme:
+                The compiled theme object.
+        """
+        from ttkbootstrap.compile import CompiledTheme
+
+        compiled = CompiledTheme.read(path)
+        Style.compiled_themes[compiled.name] = compiled
+        style = Style.instance
+        if style is not None and compiled.name not in style._theme_names:
+            style.register_theme(compiled.definition())
+        return compiled
+
     def _load_themes(self):
         """Load all ttkbootstrap defined themes"""
         # create a theme definition object for each theme, this will be
@@ -671,6 +1513,9 @@ class Style(ttk.Style):
                     colors=definition["colors"],
                 )
             )
+        for compiled in Style.compiled_themes.values():
+            if compiled.name not in self._theme_names:
+                self.register_theme(compiled.definition())
 
     def _register_ttkstyle(self, ttkstyle):
         """Register that a ttk style name. This ensures that the
@@ -685,16 +1530,47 @@ class Style(ttk.Style):
         self._style_registry.add(ttkstyle)
         theme = self.theme.name
         self._theme_styles[theme].add(ttkstyle)
+        builder: StyleBuilderTTK = self._theme_objects.get(theme)
+        if builder is not None:
+            builder._record_ttkstyle(ttkstyle)
+
+    def _on_scaling_change(self):
+        """Render the size dependent image assets of the current theme
+        again for the new scaling factor. The assets of other themes are
+        updated when the theme is next used."""
+        builder: StyleBuilderTTK = self._theme_objects.get(self.theme.name)
+        if builder is not None:
+            builder.rescale_image_assets()
 
     def _create_ttk_styles_on_theme_change(self):
         """Create existing styles when the theme changes"""
-        for ttkstyle in self._style_registry:
-            if not self.style_exists_in_theme(ttkstyle):
-                color = Bootstyle.ttkstyle_widget_color(ttkstyle)
-                method_name = Bootstyle.ttkstyle_method_name(string=ttkstyle)
-                builder: StyleBuilderTTK = self._get_builder()
-                method: Callable = builder.name_to_method(method_name)
-                method(builder, color)
+        if Style.lazy_rebuild:
+            ttkstyles = self._style_registry & self.styles_in_use()
+        else:
+            ttkstyles = set(self._style_registry)
+        self._build_ttkstyles(ttkstyles)
+
+    def _build_ttkstyles(self, ttkstyles):
+        """Build the ttk styles that do not exist in the current theme,
+        rendering their image assets in parallel if it is enabled.
+
+        Parameters:
+
+            ttkstyles (Iterable[str]):
+                The ttk style names.
+        """
+        start = perf_counter()
+        builder: StyleBuilderTTK = self._get_builder()
+        if Style.asset_executor is not None:
+            builder.defer_image_assets()
+        try:
+            for ttkstyle in ttkstyles:
+                if not self.style_exists_in_theme(ttkstyle):
+                    resolved = Bootstyle.resolve(string=ttkstyle)
+                    builder.build_style(resolved.method_name, resolved.color)
+        finally:
+            builder.realize_image_assets()
+        self.build_time = perf_counter() - start
 
 
 class StyleBuilderTK:
@@ -1042,6 +1918,89 @@ class StyleBuilderTK:
         )
 
 
+def image_renderer(count):
+    """Mark a `StyleBuilderTTK` static method as a pure PIL function
+    that renders a group of `count` image assets. A renderer must not
+    call tkinter, so that it can safely run on a worker thread.
+
+    Parameters:
+
+        count (int):
+            The number of images returned by the renderer.
+    """
+
+    def decorator(func):
+        func.image_count = count
+        return staticmethod(func)
+
+    return decorator
+
+
+class Scaled(NamedTuple):
+    """An image size given in unscaled units. When passed to
+    `StyleBuilderTTK._create_image_assets`, the size is scaled to the
+    screen resolution before the images are rendered, and the images
+    are rendered again if the scaling factor changes."""
+
+    size: Any
+
+
+class BuiltStyle:
+    """The ttk styles and image groups created by a style builder
+    method for a single color, and the color labels that the method
+    read. Used to evict and restore the image assets of the style, and
+    to update the style when the theme colors change."""
+
+    def __init__(self, key=None):
+        """
+        Parameters:
+
+            key (Tuple[str, str]):
+                The builder method name and color label, or `None` for
+                the theme settings.
+        """
+        self.key = key
+        self.ttkstyles = set()
+        self.groups = []  # ImageGroup
+        self.labels = set()  # color labels read by the builder method
+        self.resident = True
+        self.stale = False  # colors changed while evicted
+
+
+class TrackedColors:
+    """A view of a `Colors` object that records the color labels that
+    are read through it."""
+
+    def __init__(self, colors, labels):
+        """
+        Parameters:
+
+            colors (Colors):
+                The theme colors.
+
+            labels (Set[str]):
+                The set that the color labels are added to.
+        """
+        self._colors = colors
+        self._labels = labels
+
+    def get(self, color_label):
+        self._labels.add(color_label)
+        return self._colors.get(color_label)
+
+    # reads `light`, `dark`, or `selectfg` through this view
+    get_foreground = Colors.get_foreground
+
+    def __getattr__(self, name):
+        value = getattr(self._colors, name)
+        if name in self._colors.__dict__:
+            self._labels.add(name)
+        return value
+
+    def __iter__(self):
+        return iter(self._colors)
+
+
 class StyleBuilderTTK:
     """A class containing methods for building new ttk widget styles on
     demand.
@@ -1051,11 +2010,32 @@ class StyleBuilderTTK:
     user.
     """
 
-    def __init__(self):
+    def __init__(self, activate=True):
+        """
+        Parameters:
+
+            activate (bool):
+                Make the theme current after it is created. When
+                `False`, the theme is created without changing the theme
+                of the widgets.
+        """
         self.style: Style = Style.get_instance()
         self.theme_images = {}
+        self.theme_name = self.style.theme.name
+        self._image_jobs = None
+        self._scaled_assets = []  # ( render, params, names )
+        self._built = {}  # BuiltStyle by ( method_name, colorname )
+        self._building = None
+        self._settings = None  # BuiltStyle of the theme settings
+        self._recoloring = None  # ( iterator of ImageGroup, held, names )
+        self._element_aliases = {}  # element created again, by name
+        self._asset_factor = self.scaling_factor()
         self.builder_tk = StyleBuilderTK()
-        self.create_theme()
+        if self.style.profiler is None:
+            self.create_theme(activate)
+        else:
+            with self.style.profiler.record("create_theme", self.theme.name):
+                self.create_theme(activate)
 
     @staticmethod
     def name_to_method(method_name):
@@ -1074,10 +2054,387 @@ class StyleBuilderTTK:
         func = getattr(StyleBuilderTTK, method_name)
         return func
 
+    def build_style(self, method_name, colorname):
+        """Build a ttk style with the builder method named by
+        `method_name`. When profiling is enabled on the `Style`, the
+        cost of the method is recorded. If the style was built before
+        and evicted, its image assets are restored instead.
+
+        The `ttk::style` commands of the method are evaluated as a
+        single tcl script when the method returns.
+
+        Parameters:
+
+            method_name (str):
+                The name of the style builder method.
+
+            colorname (str):
+                The color label passed to the builder method.
+        """
+        key = (method_name, colorname)
+        built = self._built.get(key)
+        if built is not None and not built.resident:
+            if built.stale:
+                self._recolor_style(built)
+            else:
+                self._restore_style(built)
+            return
+        built = self._built[key] = BuiltStyle(key)
+        self._run_builder(built)
+
+    def _run_builder(self, built):
+        """Run the builder method of a style, or the theme settings,
+        while recording the ttk styles, image groups, and color labels
+        that it uses."""
+        building = self._building
+        self._building = built
+        try:
+            if built.key is None:
+                with self.style.batch_commands("create_theme"):
+                    self.update_ttk_theme_settings()
+                return
+            method_name, colorname = built.key
+            method: Callable = self.name_to_method(method_name)
+            profiler: StyleProfiler = self.style.profiler
+            with self.style.batch_commands(f"{method_name}({colorname!r})"):
+                if profiler is None:
+                    method(self, colorname)
+                else:
+                    with profiler.record(method_name, colorname):
+                        method(self, colorname)
+        finally:
+            self._building = building
+
+    def _record_ttkstyle(self, ttkstyle):
+        """Record a ttk style registered by the style that is being
+        built. The style is also found by the builder method and color
+        of its own name, when the name resolves to itself."""
+        built = self._building
+        if built is None:
+            return
+        built.ttkstyles.add(ttkstyle)
+        resolved = Bootstyle.resolve(string=ttkstyle)
+        if resolved.ttkstyle == ttkstyle:
+            self._built.setdefault(
+                (resolved.method_name, resolved.color), built
+            )
+
+    def evict_styles(self, keep=None):
+        """Release the image assets of the styles built by this builder
+        and remove the styles from the theme, so that they are restored
+        when they are requested again.
+
+        Parameters:
+
+            keep (Set[str]):
+                Do not evict the styles that include one of these ttk
+                style names, or one of their parent styles. For example,
+                `my.primary.TButton` keeps `primary.TButton` and
+                `TButton`. By default, all styles are evicted.
+
+        Returns:
+
+            int:
+                The number of styles that were evicted.
+        """
+        registry: ImageRegistry = self.style.image_registry
+        if keep is not None:
+            # a derived style inherits the elements of its parents
+            parents = set()
+            for ttkstyle in keep:
+                parts = ttkstyle.split(".")
+                parents.update(
+                    ".".join(parts[i:]) for i in range(len(parts))
+                )
+            keep = parents
+        theme_styles = self.style._theme_styles[self.theme_name]
+        evicted = []
+        kept_styles = set()
+        for built in set(self._built.values()):
+            if not built.resident:
+                continue
+            if keep is not None and built.ttkstyles & keep:
+                kept_styles.update(built.ttkstyles)
+            else:
+                evicted.append(built)
+        for built in evicted:
+            built.resident = False
+            theme_styles.difference_update(built.ttkstyles - kept_styles)
+            for group in built.groups:
+                if registry.release(group):
+                    self._empty_group(group)
+        return len(evicted)
+
+    def memory_usage(self, sizes=None):
+        """Return the number of photoimages and the pixel memory used by
+        the image assets of this theme.
+
+        Parameters:
+
+            sizes (Dict[str, int]):
+                A dictionary that is updated with the pixel memory of
+                each image by name. Optional.
+
+        Returns:
+
+            Dict[str, int]:
+                The `images`, pixel `bytes`, and the number of
+                `resident_styles` and `evicted_styles`.
+        """
+        sizes = {} if sizes is None else sizes
+        total = 0
+        for name, image in self.theme_images.items():
+            size = image.width() * image.height() * 4
+            sizes[name] = size
+            total += size
+        built = set(self._built.values())
+        resident = sum(1 for b in built if b.resident)
+        return {
+            "images": len(self.theme_images),
+            "bytes": total,
+            "resident_styles": resident,
+            "evicted_styles": len(built) - resident,
+        }
+
+    def color_dependencies(self):
+        """Return the ttk styles of this theme that use each color
+        label.
+
+        Returns:
+
+            Dict[str, Set[str]]:
+                The ttk style names by color label.
+        """
+        dependencies = {}
+        for built in set(self._built.values()):
+            for label in built.labels:
+                dependencies.setdefault(label, set()).update(built.ttkstyles)
+        return dependencies
+
+    def recolor(self, labels):
+        """Update the styles that use the changed color labels to the
+        current colors of the theme. The builder methods of these styles
+        are run again; their image assets are rendered again into the
+        existing photoimages, and their elements, which cannot be
+        created twice, are kept. Evicted styles are updated when they
+        are restored.
+
+        A theme that was installed from a compiled theme is built from
+        python instead, with all of its styles.
+
+        Parameters:
+
+            labels (Set[str]):
+                The color labels that changed.
+
+        Returns:
+
+            int:
+                The number of styles that were updated.
+        """
+        if self._settings is None:
+            return self._build_compiled_theme()
+        records = [self._settings, *set(self._built.values())]
+        count = 0
+        for built in records:
+            if not built.labels & labels:
+                continue
+            if built.resident:
+                self._recolor_style(built)
+                count += 1
+            else:
+                built.stale = True
+        return count
+
+    def _build_compiled_theme(self):
+        """Build the theme settings and the registered styles of a theme
+        that was installed from a compiled theme, with the current
+        colors. The existing elements refer to the compiled images, so
+        they are created again under a new name.
+
+        Returns:
+
+            int:
+                The number of styles that were built.
+        """
+        self._settings = BuiltStyle()
+        elements = self.style._existing_elements
+        self.style._existing_elements = set(self.style.element_names())
+        self._recoloring = (iter(()), False, set())
+        try:
+            self._run_builder(self._settings)
+            for ttkstyle in list(self.style._theme_styles[self.theme_name]):
+                resolved = Bootstyle.resolve(string=ttkstyle)
+                key = (resolved.method_name, resolved.color)
+                if key not in self._built:
+                    self.build_style(*key)
+        finally:
+            self._recoloring = None
+            self.style._existing_elements = elements
+        return len(set(self._built.values())) + 1
+
+    def _recolor_style(self, built):
+        """Run the builder method of a style again with the current
+        colors, updating its image assets in place."""
+        registry: ImageRegistry = self.style.image_registry
+        held = built.resident
+        groups = iter(built.groups)
+        built.groups = []
+        built.labels = set()
+        built.resident = True
+        built.stale = False
+        elements = self.style._existing_elements
+        if elements is None:
+            self.style._existing_elements = set(self.style.element_names())
+        self._recoloring = (groups, held, set())
+        try:
+            self._run_builder(built)
+        finally:
+            self._recoloring = None
+            self.style._existing_elements = elements
+        # image assets that the builder method no longer uses
+        for group in groups:
+            if held and registry.release(group):
+                self._empty_group(group)
+
+    def _recolor_assets(self, render, params):
+        """Render the next image group of a style that is recolored
+        again with `params`, and return the names of its photoimages;
+        or `None` if the builder method requests a different asset."""
+        groups, held, replaced = self._recoloring
+        old = next(groups, None)
+        if old is None:
+            return None
+        registry: ImageRegistry = self.style.image_registry
+        if old.render is not render:
+            if held and registry.release(old):
+                self._empty_group(old)
+            return None
+        scaled = any(isinstance(p, Scaled) for p in params)
+        key = registry.make_key(render, params)
+        if key == registry.make_key(old.render, old.params):
+            group = old
+            render_group = group.evicted or (
+                scaled and group.factor != self.scaling_factor()
+            )
+            if not held:
+                registry.retain(group)
+        else:
+            if held:
+                registry.release(old)
+            group = registry.get(key)
+            if group is not None:
+                # already rendered with these colors for another style
+                render_group = group.evicted or (
+                    scaled and group.factor != self.scaling_factor()
+                )
+                if old.refs <= 0:
+                    registry.discard(old)
+                    if not old.evicted:
+                        self._empty_group(old)
+            elif old.refs <= 0:
+                group = old
+                registry.update(group, render, params)
+                render_group = True
+            else:
+                # held by other styles or themes, which keep their images
+                images = [
+                    tk.PhotoImage(master=self.style.master)
+                    for _ in range(render.image_count)
+                ]
+                names = []
+                for image in images:
+                    name = util.get_image_name(image)
+                    self.theme_images[name] = image
+                    names.append(name)
+                group = registry.add(
+                    key, images, names, render, params, self.scaling_factor()
+                )
+                render_group = True
+            registry.retain(group)
+            if group.names != old.names:
+                replaced.update(group.names)
+            if scaled:
+                if group is old:
+                    self._scaled_assets = [
+                        asset
+                        for asset in self._scaled_assets
+                        if asset[2][0] != group.names[0]
+                    ]
+                else:
+                    for i, asset in enumerate(self._scaled_assets):
+                        if asset[2][0] == old.names[0]:
+                            del self._scaled_assets[i]
+                            break
+                self._scaled_assets.append((render, params, group.names))
+        if render_group:
+            self._rescale_group(group)
+        self._building.groups.append(group)
+        return list(group.names)
+
+    def _alias_element(self, elementname, args):
+        """Return the name under which an existing element is created
+        again while a style is recolored, because its images were
+        replaced with new photoimages; or `None` if the element is
+        kept."""
+        if self._recoloring is None:
+            return None
+        images = set()
+        for arg in args:
+            images.update(arg if isinstance(arg, (list, tuple)) else [arg])
+        images &= self._recoloring[2]
+        if not images:
+            return None
+        alias = f"{min(images)}.{elementname}"
+        self._element_aliases[elementname] = alias
+        return alias
+
+    def _alias_layout(self, layoutspec):
+        """Return a layout specification that uses the elements that were
+        created again under a new name."""
+        if not self._element_aliases:
+            return layoutspec
+        layout = []
+        for elementname, options in layoutspec:
+            options = dict(options or {})
+            if options.get("children"):
+                options["children"] = self._alias_layout(options["children"])
+            layout.append(
+                (self._element_aliases.get(elementname, elementname), options)
+            )
+        return layout
+
+    def _restore_style(self, built):
+        """Render the emptied image assets of an evicted style and
+        register its ttk styles in the theme again."""
+        registry: ImageRegistry = self.style.image_registry
+        built.resident = True
+        for group in built.groups:
+            if registry.retain(group):
+                self._rescale_group(group)
+        for ttkstyle in built.ttkstyles:
+            self.style._register_ttkstyle(ttkstyle)
+
+    def _empty_group(self, group):
+        """Release the pixel memory of a group of photoimages. The
+        photoimages are kept, because the theme elements refer to them
+        by name."""
+        for name in group.names:
+            self.style.master.tk.call(
+                name, "configure", "-width", 1, "-height", 1
+            )
+            self.style.master.tk.call(name, "blank")
+        group.evicted = True
+
     @property
     def colors(self) -> Colors:
-        """A reference to the `Colors` object of the current theme."""
-        return self.style.theme.colors
+        """A reference to the `Colors` object of the current theme.
+        While a style is built, the color labels that are read are
+        recorded for the style."""
+        colors = self.style.theme.colors
+        if self._building is None:
+            return colors
+        return TrackedColors(colors, self._building.labels)
 
     @property
     def theme(self) -> ThemeDefinition:
@@ -1101,26 +2458,337 @@ class StyleBuilderTTK:
             size (Union[int, List, Tuple]):
                 A single integer or an iterable of integers
         """
-        winsys = self.style.master.tk.call("tk", "windowingsystem")
-        if winsys == "aqua":
-            BASELINE = 1.000492368291482
-        else:
-            BASELINE = 1.33398982438864281
-        scaling = self.style.master.tk.call("tk", "scaling")
-        factor = scaling / BASELINE
+        factor = self.scaling_factor()
 
         if isinstance(size, int) or isinstance(size, float):
             return ceil(size * factor)
         elif isinstance(size, tuple) or isinstance(size, list):
             return [ceil(x * factor) for x in size]
 
-    def create_theme(self):
+    def scaling_factor(self):
+        """Return the ratio of the current tk scaling to the baseline
+        scaling of the windowing system.
+
+        Returns:
+
+            float:
+                The scaling factor.
+        """
+        return util.get_scaling_context(self.style.master).factor
+
+    def scaled(self, size):
+        """Mark an image size to be scaled to the screen resolution
+        when the image assets are rendered.
+
+        Parameters:
+
+            size (Union[int, List, Tuple]):
+                A single integer or an iterable of integers.
+
+        Returns:
+
+            Scaled:
+                The unscaled size.
+        """
+        return Scaled(size)
+
+    def _resolve_params(self, params):
+        """Replace the `Scaled` sizes in `params` with the sizes for
+        the current scaling factor."""
+        return tuple(
+            self.scale_size(p.size) if isinstance(p, Scaled) else p
+            for p in params
+        )
+
+    def _create_image_assets(self, render, *params):
+        """Create the photoimages for a group of image assets and return
+        their names.
+
+        The `render` function draws the images with PIL using only the
+        values in `params`. When the asset cache is enabled, the images
+        are loaded from the cache if they were rendered previously with
+        the same inputs; otherwise they are rendered and stored. While
+        the image assets are deferred, blank photoimages are returned
+        and the images are rendered on a worker thread.
+
+        Image assets that were already created with the same `render`
+        function and `params`, by any style or theme, are found in the
+        `Style.image_registry` and their photoimages are shared.
+
+        Parameters:
+
+            render (Callable):
+                A function that accepts `params` and returns a list of
+                PIL images.
+
+            *params:
+                The color and size values used to render the images.
+                Sizes that depend on the screen resolution should be
+                given as `Scaled` values.
+
+        Returns:
+
+            List[str]:
+                A list of PhotoImage names.
+        """
+        if self._recoloring is not None:
+            names = self._recolor_assets(render, params)
+            if names is None:
+                # a different asset, which the existing elements do not use
+                recoloring, self._recoloring = self._recoloring, None
+                try:
+                    names = self._create_image_assets(render, *params)
+                finally:
+                    self._recoloring = recoloring
+                recoloring[2].update(names)
+            return names
+        cache: AssetCache = Style.asset_cache
+        profiler: StyleProfiler = self.style.profiler
+        registry: ImageRegistry = self.style.image_registry
+        scaled = any(isinstance(p, Scaled) for p in params)
+        unscaled_params = params
+        registry_key = registry.make_key(render, params)
+        group = registry.lookup(registry_key)
+        if group is not None:
+            evicted = registry.retain(group)
+            if evicted or (scaled and group.factor != self.scaling_factor()):
+                # the shared images were emptied, or belong to a theme
+                #   that was not rescaled yet
+                self._rescale_group(group)
+            if self._building is not None:
+                self._building.groups.append(group)
+            for name, image in zip(group.names, group.images):
+                self.theme_images[name] = image
+            if scaled:
+                self._scaled_assets.append((render, params, group.names))
+            return list(group.names)
+
+        params = self._resolve_params(params)
+        key = None
+        data = None
+        if cache is not None:
+            key = cache.make_key(
+                render.__name__, self.scaling_factor(), *params
+            )
+            data = cache.get(key)
+        if data is not None:
+            images = [self._create_photo(png) for png in data]
+        elif self._image_jobs is not None:
+            # the images are updated by `realize_image_assets`
+            images = [
+                tk.PhotoImage(master=self.style.master)
+                for _ in range(render.image_count)
+            ]
+            future = Style.asset_executor.submit(
+                self._render_png_assets, render, params
+            )
+            records = profiler.current() if profiler else None
+            self._image_jobs.append((future, images, key, records))
+        else:
+            start = perf_counter()
+            rendered = render(*params)
+            if profiler is not None:
+                profiler.add_render_time(perf_counter() - start)
+            if key is not None:
+                cache.put(key, [AssetCache.to_png(im) for im in rendered])
+            images = [ImageTk.PhotoImage(im) for im in rendered]
+
+        if profiler is not None:
+            profiler.count_images(len(images))
+
+        names = []
+        for image in images:
+            name = util.get_image_name(image)
+            self.theme_images[name] = image
+            names.append(name)
+        group = registry.add(
+            registry_key,
+            images,
+            names,
+            render,
+            unscaled_params,
+            self.scaling_factor(),
+        )
+        registry.retain(group)
+        if self._building is not None:
+            self._building.groups.append(group)
+        if scaled:
+            self._scaled_assets.append((render, unscaled_params, names))
+        return list(names)
+
+    def rescale_image_assets(self):
+        """Render the image assets that depend on the screen resolution
+        again if the scaling factor changed since they were created.
+        The existing photoimages are updated in place, so the elements
+        that use them do not need to be recreated.
+
+        Returns:
+
+            int:
+                The number of image groups that were updated.
+        """
+        factor = self.scaling_factor()
+        if factor == self._asset_factor:
+            return 0
+        self._asset_factor = factor
+        cache: AssetCache = Style.asset_cache
+        executor: ThreadPoolExecutor = Style.asset_executor
+        registry: ImageRegistry = self.style.image_registry
+        jobs = []
+        for render, params, names in self._scaled_assets:
+            group = registry.get(registry.make_key(render, params))
+            if group is not None:
+                if group.evicted or group.factor == factor:
+                    # rendered when restored, or shared and updated
+                    continue
+                group.factor = factor
+            params = self._resolve_params(params)
+            key = None
+            data = None
+            if cache is not None:
+                key = cache.make_key(render.__name__, factor, *params)
+                data = cache.get(key)
+            if data is None and executor is not None:
+                data = executor.submit(self._render_png_assets, render, params)
+            elif data is None:
+                data, _ = self._render_png_assets(render, params)
+            jobs.append((names, key, data))
+
+        for names, key, data in jobs:
+            if not isinstance(data, list):
+                data, _ = data.result()
+                if key is not None:
+                    cache.put(key, data)
+            elif key is not None:
+                cache.put(key, data)
+            for name, png in zip(names, data):
+                self._update_photo(name, png)
+        return len(jobs)
+
+    def _rescale_group(self, group):
+        """Render a group of shared image assets again for the current
+        scaling factor, and update their photoimages in place."""
+        render = group.render
+        group.factor = self.scaling_factor()
+        group.evicted = False
+        params = self._resolve_params(group.params)
+        cache: AssetCache = Style.asset_cache
+        key = None
+        data = None
+        if cache is not None:
+            key = cache.make_key(render.__name__, group.factor, *params)
+            data = cache.get(key)
+        if data is None:
+            data, _ = self._render_png_assets(render, params)
+            if key is not None:
+                cache.put(key, data)
+        for name, png in zip(group.names, data):
+            self._update_photo(name, png)
+
+    def _update_photo(self, name, png):
+        """Replace the contents of an existing photoimage with png data,
+        resizing the photoimage to fit."""
+        self.style.master.tk.call(
+            name,
+            "configure",
+            "-width",
+            0,
+            "-height",
+            0,
+            "-data",
+            AssetCache.to_photo_data(png),
+            "-format",
+            "png",
+        )
+
+    def _create_photo(self, png):
+        """Create a photoimage from png data."""
+        return tk.PhotoImage(
+            master=self.style.master,
+            data=AssetCache.to_photo_data(png),
+            format="png",
+        )
+
+    @staticmethod
+    def _render_png_assets(render, params):
+        """Render a group of images and encode them as png data. This
+        method is called on a worker thread.
+
+        Returns:
+
+            Tuple[List[bytes], float]:
+                The png data of each image and the render time in
+                seconds.
+        """
+        start = perf_counter()
+        data = [AssetCache.to_png(im) for im in render(*params)]
+        return data, perf_counter() - start
+
+    def defer_image_assets(self):
+        """Render the image assets created after this call on the worker
+        threads of `Style.asset_executor`. Until `realize_image_assets`
+        is called, the photoimages of these assets are blank."""
+        self._image_jobs = []
+
+    def realize_image_assets(self):
+        """Wait for the deferred image assets to be rendered and update
+        their photoimages. This must be called on the main thread."""
+        jobs = self._image_jobs
+        self._image_jobs = None
+        if not jobs:
+            return
+        cache: AssetCache = Style.asset_cache
+        profiler: StyleProfiler = self.style.profiler
+        for future, images, key, records in jobs:
+            data, seconds = future.result()
+            if profiler is not None and records:
+                profiler.add_render_time(seconds, records)
+            if key is not None and cache is not None:
+                cache.put(key, data)
+            for image, png in zip(images, data):
+                image.configure(
+                    data=AssetCache.to_photo_data(png), format="png"
+                )
+
+    @image_renderer(2)
+    def _render_solid_assets(color, hsize, vsize):
+        """Draw a horizontal and a vertical image filled with a solid
+        `color`.
+
+        Returns:
+
+            List[Image.Image]:
+                The ( horizontal, vertical ) images.
+        """
+        return [
+            Image.new("RGB", tuple(hsize), color),
+            Image.new("RGB", tuple(vsize), color),
+        ]
+
+    def create_theme(self, activate=True):
         """Create and style a new ttk theme. A wrapper around internal
-        style methods.
+        style methods. If a compatible compiled theme was loaded, it is
+        installed instead.
+
+        Parameters:
+
+            activate (bool):
+                Make the theme current. When `False`, the theme is only
+                current for the style commands that create it.
         """
+        compiled = Style.compiled_themes.get(self.theme.name)
+        if compiled is not None and compiled.is_compatible(self):
+            compiled.install(self.style, activate)
+            return
         self.style.theme_create(self.theme.name, TTK_CLAM)
-        ttk.Style.theme_use(self.style, self.theme.name)
-        self.update_ttk_theme_settings()
+        self._settings = BuiltStyle()
+        if activate:
+            ttk.Style.theme_use(self.style, self.theme.name)
+            self._run_builder(self._settings)
+        else:
+            self.style._in_theme_settings(
+                self.theme.name, self._run_builder, self._settings
+            )
 
     def update_ttk_theme_settings(self):
         """This method is called internally every time the theme is
@@ -1293,12 +2961,12 @@ class StyleBuilderTTK:
             h_ttkstyle = f"{colorname}.{HSTYLE}"
             v_ttkstyle = f"{colorname}.{VSTYLE}"
 
+        h_name, v_name = self._create_image_assets(
+            self._render_solid_assets, background, hsize, vsize
+        )
+
         # horizontal separator
         h_element = h_ttkstyle.replace(".TS", ".S")
-        h_img = ImageTk.PhotoImage(Image.new("RGB", hsize, background))
-        h_name = util.get_image_name(h_img)
-        self.theme_images[h_name] = h_img
-
         self.style.element_create(f"{h_element}.separator", "image", h_name)
         self.style.layout(
             h_ttkstyle, [(f"{h_element}.separator", {"sticky": tk.EW})]
@@ -1306,9 +2974,6 @@ class StyleBuilderTTK:
 
         # vertical separator
         v_element = v_ttkstyle.replace(".TS", ".S")
-        v_img = ImageTk.PhotoImage(Image.new("RGB", vsize, background))
-        v_name = util.get_image_name(v_img)
-        self.theme_images[v_name] = v_img
         self.style.element_create(f"{v_element}.separator", "image", v_name)
         self.style.layout(
             v_ttkstyle, [(f"{v_element}.separator", {"sticky": tk.NS})]
@@ -1322,6 +2987,9 @@ class StyleBuilderTTK:
 
         Parameters:
 
+            thickness (Union[int, Scaled]):
+                The size of the image.
+
             colorname (str):
                 The color label used to style the widget.
 
@@ -1346,8 +3014,24 @@ class StyleBuilderTTK:
 
         barcolor_light = Colors.update_hsv(barcolor, sd=-0.2, vd=value_delta)
 
-        # horizontal progressbar
-        img = Image.new("RGBA", (100, 100), barcolor_light)
+        h_name, v_name = self._create_image_assets(
+            self._render_striped_progressbar_assets,
+            thickness,
+            barcolor,
+            barcolor_light,
+        )
+        return h_name, v_name
+
+    @image_renderer(2)
+    def _render_striped_progressbar_assets(thickness, barcolor, lightcolor):
+        """Draw the horizontal and vertical striped progressbar images.
+
+        Returns:
+
+            List[Image.Image]:
+                The ( horizontal, vertical ) images.
+        """
+        img = Image.new("RGBA", (100, 100), lightcolor)
         draw = ImageDraw.Draw(img)
         draw.polygon(
             xy=[(0, 0), (48, 0), (100, 52), (100, 100)],
@@ -1356,14 +3040,7 @@ class StyleBuilderTTK:
         draw.polygon(xy=[(0, 52), (48, 100), (0, 100)], fill=barcolor)
 
         _resized = img.resize((thickness, thickness), Image.LANCZOS)
-        h_img = ImageTk.PhotoImage(_resized)
-        h_name = h_img._PhotoImage__photo.name
-        v_img = ImageTk.PhotoImage(_resized.rotate(90))
-        v_name = v_img._PhotoImage__photo.name
-
-        self.theme_images[h_name] = h_img
-        self.theme_images[v_name] = v_img
-        return h_name, v_name
+        return [_resized, _resized.rotate(90)]
 
     def create_striped_progressbar_style(self, colorname=DEFAULT):
         """Create a striped style for the ttk.Progressbar widget.
@@ -1397,7 +3074,9 @@ class StyleBuilderTTK:
             bordercolor = troughcolor
 
         # ( horizontal, vertical )
-        images = self.create_striped_progressbar_assets(thickness, colorname)
+        images = self.create_striped_progressbar_assets(
+            self.scaled(12), colorname
+        )
 
         # horizontal progressbar
         h_element = h_ttkstyle.replace(".TP", ".P")
@@ -1595,7 +3274,7 @@ class StyleBuilderTTK:
                 A tuple of PhotoImage names to be used in the image
                 layout when building the style.
         """
-        size = self.scale_size(size)
+        size = self.scaled(size)
         if self.is_light_theme:
             disabled_color = self.colors.border
             if colorname == LIGHT:
@@ -1614,68 +3293,39 @@ class StyleBuilderTTK:
         pressed_color = Colors.update_hsv(normal_color, vd=-0.1)
         hover_color = Colors.update_hsv(normal_color, vd=0.1)
 
-        # normal state
-        _normal = Image.new("RGBA", (100, 100))
-        draw = ImageDraw.Draw(_normal)
-        draw.ellipse((0, 0, 95, 95), fill=normal_color)
-        normal_img = ImageTk.PhotoImage(
-            _normal.resize((size, size), Image.LANCZOS)
-        )
-        normal_name = util.get_image_name(normal_img)
-        self.theme_images[normal_name] = normal_img
-
-        # pressed state
-        _pressed = Image.new("RGBA", (100, 100))
-        draw = ImageDraw.Draw(_pressed)
-        draw.ellipse((0, 0, 95, 95), fill=pressed_color)
-        pressed_img = ImageTk.PhotoImage(
-            _pressed.resize((size, size), Image.LANCZOS)
-        )
-        pressed_name = util.get_image_name(pressed_img)
-        self.theme_images[pressed_name] = pressed_img
-
-        # hover state
-        _hover = Image.new("RGBA", (100, 100))
-        draw = ImageDraw.Draw(_hover)
-        draw.ellipse((0, 0, 95, 95), fill=hover_color)
-        hover_img = ImageTk.PhotoImage(
-            _hover.resize((size, size), Image.LANCZOS)
+        # ( normal, pressed, hover, disabled )
+        slider_names = self._create_image_assets(
+            self._render_scale_assets,
+            size,
+            normal_color,
+            pressed_color,
+            hover_color,
+            disabled_color,
         )
-        hover_name = util.get_image_name(hover_img)
-        self.theme_images[hover_name] = hover_img
-
-        # disabled state
-        _disabled = Image.new("RGBA", (100, 100))
-        draw = ImageDraw.Draw(_disabled)
-        draw.ellipse((0, 0, 95, 95), fill=disabled_color)
-        disabled_img = ImageTk.PhotoImage(
-            _disabled.resize((size, size), Image.LANCZOS)
+        # ( horizontal, vertical )
+        track_names = self._create_image_assets(
+            self._render_solid_assets,
+            track_color,
+            self.scaled((40, 5)),
+            self.scaled((5, 40)),
         )
-        disabled_name = util.get_image_name(disabled_img)
-        self.theme_images[disabled_name] = disabled_img
+        return (*slider_names, *track_names)
 
-        # vertical track
-        h_track_img = ImageTk.PhotoImage(
-            Image.new("RGB", self.scale_size((40, 5)), track_color)
-        )
-        h_track_name = util.get_image_name(h_track_img)
-        self.theme_images[h_track_name] = h_track_img
+    @image_renderer(4)
+    def _render_scale_assets(size, normal, pressed, hover, disabled):
+        """Draw a slider image for each state color.
 
-        # horizontal track
-        v_track_img = ImageTk.PhotoImage(
-            Image.new("RGB", self.scale_size((5, 40)), track_color)
-        )
-        v_track_name = util.get_image_name(v_track_img)
-        self.theme_images[v_track_name] = v_track_img
+        Returns:
 
-        return (
-            normal_name,
-            pressed_name,
-            hover_name,
-            disabled_name,
-            h_track_name,
-            v_track_name,
-        )
+            List[Image.Image]:
+                The ( normal, pressed, hover, disabled ) images.
+        """
+        images = []
+        for color in [normal, pressed, hover, disabled]:
+            canvas = create_canvas((size, size), (100, 100))
+            canvas.ellipse((0, 0, 95, 95), fill=color)
+            images.append(canvas.image())
+        return images
 
     def create_scale_style(self, colorname=DEFAULT):
         """Create a style for the ttk.Scale widget.
@@ -1880,45 +3530,40 @@ class StyleBuilderTTK:
                 hovered.
         """
 
-        def draw_arrow(color: str):
-
-            img = Image.new("RGBA", (11, 11))
-            draw = ImageDraw.Draw(img)
-            size = self.scale_size([11, 11])
-
-            draw.line([2, 6, 2, 9], fill=color)
-            draw.line([3, 5, 3, 8], fill=color)
-            draw.line([4, 4, 4, 7], fill=color)
-            draw.line([5, 3, 5, 6], fill=color)
-            draw.line([6, 4, 6, 7], fill=color)
-            draw.line([7, 5, 7, 8], fill=color)
-            draw.line([8, 6, 8, 9], fill=color)
-
-            img = img.resize(size, Image.CUBIC)
-
-            up_img = ImageTk.PhotoImage(img)
-            up_name = util.get_image_name(up_img)
-            self.theme_images[up_name] = up_img
-
-            down_img = ImageTk.PhotoImage(img.rotate(180))
-            down_name = util.get_image_name(down_img)
-            self.theme_images[down_name] = down_img
+        size = self.scaled([11, 11])
+        normal_names = self._create_image_assets(
+            self._render_arrow_assets, size, arrowcolor
+        )
+        pressed_names = self._create_image_assets(
+            self._render_arrow_assets, size, pressed
+        )
+        active_names = self._create_image_assets(
+            self._render_arrow_assets, size, active
+        )
+        return normal_names, pressed_names, active_names
 
-            left_img = ImageTk.PhotoImage(img.rotate(90))
-            left_name = util.get_image_name(left_img)
-            self.theme_images[left_name] = left_img
+    @image_renderer(4)
+    def _render_arrow_assets(size, color):
+        """Draw the arrow images for each direction.
 
-            right_img = ImageTk.PhotoImage(img.rotate(-90))
-            right_name = util.get_image_name(right_img)
-            self.theme_images[right_name] = right_img
+        Returns:
 
-            return up_name, down_name, left_name, right_name
+            List[Image.Image]:
+                The ( up, down, left, right ) arrow images.
+        """
+        img = Image.new("RGBA", (11, 11))
+        draw = ImageDraw.Draw(img)
 
-        normal_names = draw_arrow(arrowcolor)
-        pressed_names = draw_arrow(pressed)
-        active_names = draw_arrow(active)
+        draw.line([2, 6, 2, 9], fill=color)
+        draw.line([3, 5, 3, 8], fill=color)
+        draw.line([4, 4, 4, 7], fill=color)
+        draw.line([5, 3, 5, 6], fill=color)
+        draw.line([6, 4, 6, 7], fill=color)
+        draw.line([7, 5, 7, 8], fill=color)
+        draw.line([8, 6, 8, 9], fill=color)
 
-        return normal_names, pressed_names, active_names
+        img = img.resize(size, Image.BICUBIC)
+        return [img, img.rotate(180), img.rotate(90), img.rotate(-90)]
 
     def create_round_scrollbar_assets(self, thumbcolor, pressed, active):
         """Create image assets to be used when building the round
@@ -1936,38 +3581,44 @@ class StyleBuilderTTK:
                 The color value to use when the thumb is active or
                 hovered.
         """
-        vsize = self.scale_size([9, 28])
-        hsize = self.scale_size([28, 9])
+        vsize = self.scaled([9, 28])
+        hsize = self.scaled([28, 9])
+
+        # ( h_normal, h_pressed, h_active, v_normal, v_pressed, v_active )
+        return tuple(
+            self._create_image_assets(
+                self._render_round_scrollbar_assets,
+                hsize,
+                vsize,
+                thumbcolor,
+                pressed,
+                active,
+            )
+        )
 
-        def rounded_rect(size, fill):
-            x = size[0] * 10
-            y = size[1] * 10
-            img = Image.new("RGBA", (x, y))
-            draw = ImageDraw.Draw(img)
-            radius = min([x, y]) // 2
-            draw.rounded_rectangle([0, 0, x - 1, y - 1], radius, fill)
-            image = ImageTk.PhotoImage(img.resize(size, Image.CUBIC))
-            name = util.get_image_name(image)
-            self.theme_images[name] = image
-            return name
+    @image_renderer(6)
+    def _render_round_scrollbar_assets(hsize, vsize, thumbcolor, pressed, active):
+        """Draw a horizontal and a vertical rounded thumb image for each
+        state color.
 
-        # create images
-        h_normal_img = rounded_rect(hsize, thumbcolor)
-        h_pressed_img = rounded_rect(hsize, pressed)
-        h_active_img = rounded_rect(hsize, active)
+        Returns:
 
-        v_normal_img = rounded_rect(vsize, thumbcolor)
-        v_pressed_img = rounded_rect(vsize, pressed)
-        v_active_img = rounded_rect(vsize, active)
+            List[Image.Image]:
+                The horizontal images followed by the vertical images.
+        """
 
-        return (
-            h_normal_img,
-            h_pressed_img,
-            h_active_img,
-            v_normal_img,
-            v_pressed_img,
-            v_active_img,
-        )
+        def rounded_rect(size, fill):
+            canvas = create_canvas(size, size)
+            radius = min(size) / 2
+            canvas.rounded_rectangle(
+                [0, 0, size[0] - 1, size[1] - 1], radius, fill
+            )
+            return canvas.image()
+
+        colors = [thumbcolor, pressed, active]
+        h_images = [rounded_rect(hsize, color) for color in colors]
+        v_images = [rounded_rect(vsize, color) for color in colors]
+        return h_images + v_images
 
     def create_round_scrollbar_style(self, colorname=DEFAULT):
         """Create a round style for the ttk.Scrollbar widget.
@@ -2133,35 +3784,35 @@ class StyleBuilderTTK:
                 The color value to use when the thumb is active or
                 hovered.
         """
-        vsize = self.scale_size([9, 28])
-        hsize = self.scale_size([28, 9])
-
-        def draw_rect(size, fill):
-            x = size[0] * 10
-            y = size[1] * 10
-            img = Image.new("RGBA", (x, y), fill)
-            image = ImageTk.PhotoImage(img.resize(size), Image.CUBIC)
-            name = util.get_image_name(image)
-            self.theme_images[name] = image
-            return name
+        vsize = self.scaled([9, 28])
+        hsize = self.scaled([28, 9])
+
+        # ( h_normal, h_pressed, h_active, v_normal, v_pressed, v_active )
+        return tuple(
+            self._create_image_assets(
+                self._render_scrollbar_assets,
+                hsize,
+                vsize,
+                thumbcolor,
+                pressed,
+                active,
+            )
+        )
 
-        # create images
-        h_normal_img = draw_rect(hsize, thumbcolor)
-        h_pressed_img = draw_rect(hsize, pressed)
-        h_active_img = draw_rect(hsize, active)
+    @image_renderer(6)
+    def _render_scrollbar_assets(hsize, vsize, thumbcolor, pressed, active):
+        """Draw a horizontal and a vertical thumb image for each state
+        color.
 
-        v_normal_img = draw_rect(vsize, thumbcolor)
-        v_pressed_img = draw_rect(vsize, pressed)
-        v_active_img = draw_rect(vsize, active)
+        Returns:
 
-        return (
-            h_normal_img,
-            h_pressed_img,
-            h_active_img,
-            v_normal_img,
-            v_pressed_img,
-            v_active_img,
-        )
+            List[Image.Image]:
+                The horizontal images followed by the vertical images.
+        """
+        colors = [thumbcolor, pressed, active]
+        h_images = [Image.new("RGBA", tuple(hsize), c) for c in colors]
+        v_images = [Image.new("RGBA", tuple(vsize), c) for c in colors]
+        return h_images + v_images
 
     def create_scrollbar_style(self, colorname=DEFAULT):
         """Create a standard style for the ttk.Scrollbar widget.
@@ -2664,10 +4315,8 @@ class StyleBuilderTTK:
             ],
         )
 
-        try:
+        if "Treeitem.indicator" not in self.style.element_names():
             self.style.element_create("Treeitem.indicator", "from", TTK_ALT)
-        except:
-            pass
 
         # register ttkstyles
         self.style._register_ttkstyle(body_style)
@@ -2913,7 +4562,7 @@ class StyleBuilderTTK:
             Tuple[str]:
                 A tuple of PhotoImage names.
         """
-        size = self.scale_size([24, 15])
+        size = self.scaled([24, 15])
         if any([colorname == DEFAULT, colorname == ""]):
             colorname = PRIMARY
 
@@ -2935,42 +4584,63 @@ class StyleBuilderTTK:
             on_border = self.colors.light
             on_indicator = on_border
 
-        # toggle off
-        _off = Image.new("RGBA", (226, 130))
-        draw = ImageDraw.Draw(_off)
-        draw.rectangle(
-            xy=[1, 1, 225, 129], outline=off_border, width=6, fill=off_fill
+        # ( off, on, disabled )
+        return tuple(
+            self._create_image_assets(
+                self._render_square_toggle_assets,
+                size,
+                off_border,
+                off_fill,
+                off_indicator,
+                on_border,
+                on_fill,
+                on_indicator,
+                disabled_fg,
+            )
         )
-        draw.rectangle([18, 18, 110, 110], fill=off_indicator)
 
-        off_img = ImageTk.PhotoImage(_off.resize(size, Image.LANCZOS))
-        off_name = util.get_image_name(off_img)
-        self.theme_images[off_name] = off_img
+    @image_renderer(3)
+    def _render_square_toggle_assets(
+        size,
+        off_border,
+        off_fill,
+        off_indicator,
+        on_border,
+        on_fill,
+        on_indicator,
+        disabled_fg,
+    ):
+        """Draw the square toggle images.
+
+        Returns:
 
-        # toggle on
-        toggle_on = Image.new("RGBA", (226, 130))
-        draw = ImageDraw.Draw(toggle_on)
-        draw.rectangle(
-            xy=[1, 1, 225, 129], outline=on_border, width=6, fill=on_fill
+            List[Image.Image]:
+                The ( off, on, disabled ) images.
+        """
+        # toggle off
+        _off = create_canvas(size, (226, 130))
+        _off.rectangle(
+            [1, 1, 225, 129], outline=off_border, width=6, fill=off_fill
         )
-        draw.rectangle([18, 18, 110, 110], fill=on_indicator)
-        _on = toggle_on.transpose(Image.ROTATE_180)
-        on_img = ImageTk.PhotoImage(_on.resize(size, Image.LANCZOS))
-        on_name = util.get_image_name(on_img)
-        self.theme_images[on_name] = on_img
+        _off.rectangle([18, 18, 110, 110], fill=off_indicator)
 
-        # toggle disabled
-        _disabled = Image.new("RGBA", (226, 130))
-        draw = ImageDraw.Draw(_disabled)
-        draw.rectangle([1, 1, 225, 129], outline=disabled_fg, width=6)
-        draw.rectangle([18, 18, 110, 110], fill=disabled_fg)
-        disabled_img = ImageTk.PhotoImage(
-            _disabled.resize(size, Image.LANCZOS)
+        # toggle on
+        _on = create_canvas(size, (226, 130))
+        _on.rectangle(
+            [1, 1, 225, 129], outline=on_border, width=6, fill=on_fill
         )
-        disabled_name = util.get_image_name(disabled_img)
-        self.theme_images[disabled_name] = disabled_img
+        _on.rectangle([18, 18, 110, 110], fill=on_indicator)
 
-        return off_name, on_name, disabled_name
+        # toggle disabled
+        _disabled = create_canvas(size, (226, 130))
+        _disabled.rectangle([1, 1, 225, 129], outline=disabled_fg, width=6)
+        _disabled.rectangle([18, 18, 110, 110], fill=disabled_fg)
+
+        return [
+            _off.image(),
+            _on.image().transpose(Image.ROTATE_180),
+            _disabled.image(),
+        ]
 
     def create_toggle_style(self, colorname=DEFAULT):
         """Create a round toggle style for the ttk.Checkbutton widget.
@@ -2994,7 +4664,7 @@ class StyleBuilderTTK:
             Tuple[str]:
                 A tuple of PhotoImage names.
         """
-        size = self.scale_size([24, 15])
+        size = self.scaled([24, 15])
 
         if any([colorname == DEFAULT, colorname == ""]):
             colorname = PRIMARY
@@ -3018,51 +4688,73 @@ class StyleBuilderTTK:
             on_border = self.colors.light
             on_indicator = on_border
 
+        # ( off, on, disabled )
+        return tuple(
+            self._create_image_assets(
+                self._render_round_toggle_assets,
+                size,
+                off_border,
+                off_fill,
+                off_indicator,
+                on_border,
+                on_fill,
+                on_indicator,
+                disabled_fg,
+            )
+        )
+
+    @image_renderer(3)
+    def _render_round_toggle_assets(
+        size,
+        off_border,
+        off_fill,
+        off_indicator,
+        on_border,
+        on_fill,
+        on_indicator,
+        disabled_fg,
+    ):
+        """Draw the round toggle images.
+
+        Returns:
+
+            List[Image.Image]:
+                The ( off, on, disabled ) images.
+        """
         # toggle off
-        _off = Image.new("RGBA", (226, 130))
-        draw = ImageDraw.Draw(_off)
-        draw.rounded_rectangle(
-            xy=[1, 1, 225, 129],
+        _off = create_canvas(size, (226, 130))
+        _off.rounded_rectangle(
+            [1, 1, 225, 129],
             radius=(128 / 2),
             outline=off_border,
             width=6,
             fill=off_fill,
         )
-        draw.ellipse([20, 18, 112, 110], fill=off_indicator)
-        off_img = ImageTk.PhotoImage(_off.resize(size, Image.LANCZOS))
-        off_name = util.get_image_name(off_img)
-        self.theme_images[off_name] = off_img
+        _off.ellipse([20, 18, 112, 110], fill=off_indicator)
 
         # toggle on
-        _on = Image.new("RGBA", (226, 130))
-        draw = ImageDraw.Draw(_on)
-        draw.rounded_rectangle(
-            xy=[1, 1, 225, 129],
+        _on = create_canvas(size, (226, 130))
+        _on.rounded_rectangle(
+            [1, 1, 225, 129],
             radius=(128 / 2),
             outline=on_border,
             width=6,
             fill=on_fill,
         )
-        draw.ellipse([20, 18, 112, 110], fill=on_indicator)
-        _on = _on.transpose(Image.ROTATE_180)
-        on_img = ImageTk.PhotoImage(_on.resize(size, Image.LANCZOS))
-        on_name = util.get_image_name(on_img)
-        self.theme_images[on_name] = on_img
+        _on.ellipse([20, 18, 112, 110], fill=on_indicator)
 
         # toggle disabled
-        _disabled = Image.new("RGBA", (226, 130))
-        draw = ImageDraw.Draw(_disabled)
-        draw.rounded_rectangle(
-            xy=[1, 1, 225, 129], radius=(128 / 2), outline=disabled_fg, width=6
-        )
-        draw.ellipse([20, 18, 112, 110], fill=disabled_fg)
-        disabled_img = ImageTk.PhotoImage(
-            _disabled.resize(size, Image.LANCZOS)
+        _disabled = create_canvas(size, (226, 130))
+        _disabled.rounded_rectangle(
+            [1, 1, 225, 129], radius=(128 / 2), outline=disabled_fg, width=6
         )
-        disabled_name = util.get_image_name(disabled_img)
-        self.theme_images[disabled_name] = disabled_img
+        _disabled.ellipse([20, 18, 112, 110], fill=disabled_fg)
 
-        return off_name, on_name, disabled_name
+        return [
+            _off.image(),
+            _on.image().transpose(Image.ROTATE_180),
+            _disabled.image(),
+        ]
 
     def create_round_toggle_style(self, colorname=DEFAULT):
         """Create a round toggle style for the ttk.Checkbutton widget.
@@ -3085,7 +4777,10 @@ class StyleBuilderTTK:
         # ( off, on, disabled )
         images = self.create_round_toggle_assets(colorname)
 
-        try:
+        # This method is used as the default Toggle style, so the
+        #   element may have been created by the Toggle or Round Toggle
+        #   style already
+        if f"{ttkstyle}.indicator" not in self.style.element_names():
             width = self.scale_size(28)
             borderpad = self.scale_size(4)
             self.style.element_create(
@@ -3098,12 +4793,6 @@ class StyleBuilderTTK:
                 border=borderpad,
                 sticky=tk.W,
             )
-        except:
-            """This method is used as the default Toggle style, so it
-            is neccessary to catch Tcl Errors when it tries to create
-            and element that was already created by the Toggle or
-            Round Toggle style"""
-            pass
 
         self.style._build_configure(
             ttkstyle,
@@ -3459,7 +5148,7 @@ class StyleBuilderTTK:
         on_fill = prime_color
         off_fill = self.colors.bg
         on_indicator = self.colors.selectfg
-        size = self.scale_size([14, 14])
+        size = self.scaled([14, 14])
         off_border = Colors.make_transparent(0.4, self.colors.fg, self.colors.bg)
         disabled = Colors.make_transparent(0.3, self.colors.fg, self.colors.bg)
 
@@ -3467,41 +5156,53 @@ class StyleBuilderTTK:
             if colorname == LIGHT:
                 on_indicator = self.colors.dark
 
+        # ( off, on, disabled )
+        return tuple(
+            self._create_image_assets(
+                self._render_radiobutton_assets,
+                size,
+                off_border,
+                off_fill,
+                on_fill,
+                on_indicator,
+                disabled,
+                colorname == LIGHT and self.is_light_theme,
+            )
+        )
+
+    @image_renderer(3)
+    def _render_radiobutton_assets(
+        size, off_border, off_fill, on_fill, on_indicator, disabled, outlined
+    ):
+        """Draw the radiobutton images. When `outlined` is `True`, the
+        selected image is drawn with an outline instead of a fill.
+
+        Returns:
+
+            List[Image.Image]:
+                The ( off, on, disabled ) images.
+        """
         # radio off
-        _off = Image.new("RGBA", (134, 134))
-        draw = ImageDraw.Draw(_off)
-        draw.ellipse(
-            xy=[1, 1, 133, 133], outline=off_border, width=6, fill=off_fill
+        _off = create_canvas(size, (134, 134))
+        _off.ellipse(
+            [1, 1, 133, 133], outline=off_border, width=6, fill=off_fill
         )
-        off_img = ImageTk.PhotoImage(_off.resize(size, Image.LANCZOS))
-        off_name = util.get_image_name(off_img)
-        self.theme_images[off_name] = off_img
 
         # radio on
-        _on = Image.new("RGBA", (134, 134))
-        draw = ImageDraw.Draw(_on)
-        if colorname == LIGHT and self.is_light_theme:
-            draw.ellipse(xy=[1, 1, 133, 133], outline=off_border, width=6)
+        _on = create_canvas(size, (134, 134))
+        if outlined:
+            _on.ellipse([1, 1, 133, 133], outline=off_border, width=6)
         else:
-            draw.ellipse(xy=[1, 1, 133, 133], fill=on_fill)
-        draw.ellipse([40, 40, 94, 94], fill=on_indicator)
-        on_img = ImageTk.PhotoImage(_on.resize(size, Image.LANCZOS))
-        on_name = util.get_image_name(on_img)
-        self.theme_images[on_name] = on_img
+            _on.ellipse([1, 1, 133, 133], fill=on_fill)
+        _on.ellipse([40, 40, 94, 94], fill=on_indicator)
 
         # radio disabled
-        _disabled = Image.new("RGBA", (134, 134))
-        draw = ImageDraw.Draw(_disabled)
-        draw.ellipse(
-            xy=[1, 1, 133, 133], outline=disabled, width=3, fill=off_fill
-        )
-        disabled_img = ImageTk.PhotoImage(
-            _disabled.resize(size, Image.LANCZOS)
+        _disabled = create_canvas(size, (134, 134))
+        _disabled.ellipse(
+            [1, 1, 133, 133], outline=disabled, width=3, fill=off_fill
         )
-        disabled_name = util.get_image_name(disabled_img)
-        self.theme_images[disabled_name] = disabled_img
 
-        return off_name, on_name, disabled_name
+        return [_off.image(), _on.image(), _disabled.image()]
 
     def create_radiobutton_style(self, colorname=DEFAULT):
         """Create a style for the ttk.Radiobutton widget.
@@ -3586,11 +5287,23 @@ class StyleBuilderTTK:
             str:
                 The PhotoImage name.
         """
-        fill = foreground
-        image = Image.new("RGBA", (210, 220))
-        draw = ImageDraw.Draw(image)
+        size = self.scaled([21, 22])
+        (tk_name,) = self._create_image_assets(
+            self._render_date_button_assets, size, foreground
+        )
+        return tk_name
 
-        draw.rounded_rectangle(
+    @image_renderer(1)
+    def _render_date_button_assets(size, fill):
+        """Draw the calendar image of the date button.
+
+        Returns:
+
+            List[Image.Image]:
+                A list containing the calendar image.
+        """
+        canvas = create_canvas(size, (210, 220))
+        canvas.rounded_rectangle(
             [10, 30, 200, 210], radius=20, outline=fill, width=10
         )
 
@@ -3614,13 +5327,9 @@ class StyleBuilderTTK:
             [110, 170, 130, 190],
         ]
         for xy in calendar_image_coordinates:
-            draw.rectangle(xy=xy, fill=fill)
+            canvas.rectangle(xy, fill=fill)
 
-        size = self.scale_size([21, 22])
-        tk_img = ImageTk.PhotoImage(image.resize(size, Image.LANCZOS))
-        tk_name = util.get_image_name(tk_img)
-        self.theme_images[tk_name] = tk_img
-        return tk_name
+        return [canvas.image()]
 
     def create_date_button_style(self, colorname=DEFAULT):
         """Create a date button style for the ttk.Button widget.
@@ -4048,45 +5757,12 @@ class StyleBuilderTTK:
             Tuple[str]:
                 A tuple of PhotoImage names.
         """
-        # set platform specific checkfont
-        winsys = self.style.tk.call("tk", "windowingsystem")
-        indicator = "✓"
-        if winsys == "win32":
-            # Windows font
-            fnt = ImageFont.truetype("seguisym.ttf", 120)
-            font_offset = -20
-            # TODO consider using ImageFont.getsize for offsets
-        elif winsys == "x11":
-            # Linux fonts
-            try:
-                # this should be available on most Linux distros
-                fnt = ImageFont.truetype("FreeSerif.ttf", 130)
-                font_offset = 10
-            except:
-                try:
-                    # this should be available as a backup on Linux 
-                    # distros that don't have the FreeSerif.ttf file
-                    fnt = ImageFont.truetype("DejaVuSans.ttf", 160)
-                    font_offset = -15
-                except:
-                    # If all else fails, use the default ImageFont
-                    # this won't actually show anything in practice 
-                    # because of how I'm scaling the image, but it 
-                    # will prevent the program from crashing. I need 
-                    # a better solution for a missing font
-                    ImageFont.load_default()
-                    font_offset = 0        
-                    indicator = "x"
-        else:
-            # Mac OS font
-            fnt = ImageFont.truetype("LucidaGrande.ttc", 120)
-            font_offset = -10
+        winsys = util.get_scaling_context(self.style.master).winsys
 
         prime_color = self.colors.get(colorname)
         on_border = prime_color
         on_fill = prime_color
         off_fill = self.colors.bg
-        off_border = self.colors.selectbg
         off_border = Colors.make_transparent(0.4, self.colors.fg, self.colors.bg)
         disabled_bg = Colors.make_transparent(0.3, self.colors.fg, self.colors.bg)
 
@@ -4099,53 +5775,106 @@ class StyleBuilderTTK:
         else:
             check_color = self.colors.selectfg
 
-        size = self.scale_size([14, 14])
+        size = self.scaled([14, 14])
+
+        # ( off, on, disabled )
+        return tuple(
+            self._create_image_assets(
+                self._render_checkbutton_assets,
+                size,
+                winsys,
+                off_border,
+                off_fill,
+                on_border,
+                on_fill,
+                check_color,
+                disabled_bg,
+            )
+        )
+
+    @image_renderer(3)
+    def _render_checkbutton_assets(
+        size,
+        winsys,
+        off_border,
+        off_fill,
+        on_border,
+        on_fill,
+        check_color,
+        disabled_bg,
+    ):
+        """Draw the checkbutton images using the check mark glyph of a
+        font that is available on the windowing system.
+
+        Returns:
+
+            List[Image.Image]:
+                The ( off, on, disabled ) images.
+        """
+        # platform specific check fonts; ( file, size, offset )
+        indicator = "✓"
+        if winsys == "win32":
+            # Windows font
+            checkfonts = [("seguisym.ttf", 120, -20)]
+        elif winsys == "x11":
+            # Linux fonts; FreeSerif should be available on most Linux
+            # distros, DejaVuSans is a backup for those that don't have
+            # the FreeSerif.ttf file
+            checkfonts = [
+                ("FreeSerif.ttf", 130, 10),
+                ("DejaVuSans.ttf", 160, -15),
+            ]
+        else:
+            # Mac OS font
+            checkfonts = [("LucidaGrande.ttc", 120, -10)]
+
+        for checkfont in checkfonts:
+            if load_font(*checkfont[:2]) is not None:
+                break
+        else:
+            # If all else fails, use the default ImageFont to prevent
+            # the program from crashing.
+            checkfont = (None, 0, 0)
+            indicator = "x"
+        font_offset = checkfont[2]
 
         # checkbutton off
-        checkbutton_off = Image.new("RGBA", (134, 134))
-        draw = ImageDraw.Draw(checkbutton_off)
-        draw.rounded_rectangle(
+        checkbutton_off = create_canvas(size, (134, 134))
+        checkbutton_off.rounded_rectangle(
             [2, 2, 132, 132],
             radius=16,
             outline=off_border,
             width=6,
             fill=off_fill,
         )
-        off_img = ImageTk.PhotoImage(
-            checkbutton_off.resize(size, Image.LANCZOS)
-        )
-        off_name = util.get_image_name(off_img)
-        self.theme_images[off_name] = off_img
 
         # checkbutton on
-        checkbutton_on = Image.new("RGBA", (134, 134))
-        draw = ImageDraw.Draw(checkbutton_on)
-        draw.rounded_rectangle(
+        checkbutton_on = create_canvas(size, (134, 134))
+        checkbutton_on.rounded_rectangle(
             [2, 2, 132, 132],
             radius=16,
             fill=on_fill,
             outline=on_border,
             width=3,
         )
-
-        draw.text((20, font_offset), indicator, font=fnt, fill=check_color)
-        on_img = ImageTk.PhotoImage(checkbutton_on.resize(size, Image.LANCZOS))
-        on_name = util.get_image_name(on_img)
-        self.theme_images[on_name] = on_img
+        checkbutton_on.text(
+            (20, font_offset),
+            indicator,
+            checkfont[:2] if checkfont[0] else None,
+            fill=check_color,
+        )
 
         # checkbutton disabled
-        checkbutton_disabled = Image.new("RGBA", (134, 134))
-        draw = ImageDraw.Draw(checkbutton_disabled)
-        draw.rounded_rectangle(
+        checkbutton_disabled = create_canvas(size, (134, 134))
+        checkbutton_disabled.rounded_rectangle(
             [2, 2, 132, 132], radius=16, outline=disabled_bg, width=3
         )
-        disabled_img = ImageTk.PhotoImage(
-            checkbutton_disabled.resize(size, Image.LANCZOS)
-        )
-        disabled_name = util.get_image_name(disabled_img)
-        self.theme_images[disabled_name] = disabled_img
 
-        return off_name, on_name, disabled_name
+        return [
+            checkbutton_off.image(),
+            checkbutton_on.image(),
+            checkbutton_disabled.image(),
+        ]
 
     def create_menubutton_style(self, colorname=DEFAULT):
         """Create a solid style for the ttk.Menubutton widget.
@@ -4395,9 +6124,21 @@ class StyleBuilderTTK:
             str:
                 The PhotoImage name.
         """
-        from math import ceil
+        box = self.scaled(1)
+        (_name,) = self._create_image_assets(
+            self._render_sizegrip_assets, box, color
+        )
+        return _name
 
-        box = self.scale_size(1)
+    @image_renderer(1)
+    def _render_sizegrip_assets(box, color):
+        """Draw the sizegrip image with squares of size `box`.
+
+        Returns:
+
+            List[Image.Image]:
+                A list containing the sizegrip image.
+        """
         pad = box * 2
         chunk = box + pad  # 4
 
@@ -4427,10 +6168,7 @@ class StyleBuilderTTK:
 
         draw.rectangle((pad, chunk * 2 + pad, chunk, chunk * 3), fill=color)
 
-        _img = ImageTk.PhotoImage(im)
-        _name = util.get_image_name(_img)
-        self.theme_images[_name] = _img
-        return _name
+        return [im]
 
     def create_sizegrip_style(self, colorname=DEFAULT):
         """Create a style for the ttk.Sizegrip widget.
@@ -4472,20 +6210,26 @@ class StyleBuilderTTK:
 
     def update_combobox_popdown_style(self, widget):
         """Update the legacy ttk.Combobox elements. This method is
-        called every time the theme is changed in order to ensure
-        that the legacy tkinter components embedded in this ttk widget
-        are styled appropriate to the current theme.
+        called when the popdown window is created, and every time the
+        theme is changed, in order to ensure that the legacy tkinter
+        components embedded in this ttk widget are styled appropriate
+        to the current theme.
 
         The ttk.Combobox contains several elements that are not styled
         using the ttk theme engine. This includes the **popdownwindow**
         and the **scrollbar**. Both of these widgets are configured
-        manually using calls to tcl/tk.
+        manually using calls to tcl/tk. Nothing is done if the popdown
+        window has not been created yet.
 
         Parameters:
 
             widget (ttk.Combobox):
                 The combobox element to be updated.
         """
+        popdown = f"{widget}.popdown"
+        if not widget.tk.call("winfo", "exists", popdown):
+            return
+
         if self.is_light_theme:
             bordercolor = self.colors.border
         else:
@@ -4501,7 +6245,6 @@ class StyleBuilderTTK:
         tk_settings.extend(["-selectforeground", self.colors.selectfg])
 
         # set popdown style
-        popdown = widget.tk.eval(f"ttk::combobox::PopdownWindow {widget}")
         widget.tk.call(f"{popdown}.f.l", "configure", *tk_settings)
 
         # set scrollbar style
@@ -4576,7 +6319,260 @@ class Keywords:
     TYPE_PATTERN = re.compile("|".join(TYPES))
 
 
+class ResolvedStyle(NamedTuple):
+    """The parts of a bootstyle or ttkstyle string resolved for a
+    widget class. This record is created by `Bootstyle.resolve`."""
+
+    color: str
+    type: str
+    orient: str
+    widget_class: str
+    ttkstyle: str
+    method_name: str
+
+
+# widget class keywords of the widgets that have an `orient` option
+ORIENT_CLASSES = {
+    "floodgauge",
+    "panedwindow",
+    "progressbar",
+    "scale",
+    "scrollbar",
+    "separator",
+}
+
+RESOLVER_CACHE_SIZE = 1024
+
+
 class Bootstyle:
+
+    # tk class names by python class; used to avoid a `winfo_class`
+    #   call for every style lookup.
+    _widget_classes = {}
+
+    @staticmethod
+    def resolve(widget=None, string="", **kwargs):
+        """Resolve a bootstyle or ttkstyle string into the ttk style
+        name, the keywords it is made of, and the name of the
+        `StyleBuilderTTK` method that builds it.
+
+        The keywords of a string are parsed only once, and the result
+        is memoized by widget class, string, and orientation. Use
+        `Bootstyle.cache_info` to check the cache statistics.
+
+        Parameters:
+
+            widget (Widget):
+                The widget object.
+
+            string (str):
+                A keyword string to parse.
+
+            **kwargs:
+                Other keyword arguments to parse widget orientation.
+
+        Returns:
+
+            ResolvedStyle:
+                The resolved style record.
+        """
+        style_string = "".join(string).lower()
+        _, _, orient, widget_class = Bootstyle._tokenize(style_string)
+        if not widget_class and widget is not None:
+            widget_class = Bootstyle._class_keyword(
+                Bootstyle.widget_class_name(widget).lower()
+            )
+        if not orient:
+            orient = Bootstyle._orient_from_widget(widget, kwargs)
+        return Bootstyle._resolve(widget_class, style_string, orient)
+
+    @staticmethod
+    def _prepare_ttk_style(widget, string, kwargs):
+        """Resolve and build the ttk style of a widget that is about to
+        be created, so that the style can be passed to the creation
+        command.
+
+        This is only possible when the tk class name of the widget is
+        already known for its python class, and when the orientation
+        does not depend on the default configuration of the widget. An
+        existing style that is passed by name is used as is. When
+        `Style.defer_styles` is `True`, a missing style may be deferred
+        instead of built.
+
+        Parameters:
+
+            widget (Widget):
+                The widget object, before the tk widget is created.
+
+            string (str):
+                The style, bootstyle, or `default`.
+
+            kwargs (Dict[str, Any]):
+                The constructor keyword arguments.
+
+        Returns:
+
+            Union[str, None]:
+                The ttk style name, or `None` if the style must be
+                resolved after the widget is created.
+        """
+        style: Style = Style.get_instance()
+        if style is None or "class_" in kwargs:
+            return None
+        if isinstance(string, str) and style.style_exists_in_theme(string):
+            return string
+        class_name = Bootstyle._widget_classes.get(type(widget))
+        if class_name is None:
+            return None
+
+        style_string = "".join(string).lower()
+        _, _, orient, widget_class = Bootstyle._tokenize(style_string)
+        class_keyword = Bootstyle._class_keyword(class_name.lower())
+        if not widget_class:
+            widget_class = class_keyword
+        if not orient:
+            if "orient" in kwargs:
+                orient = Bootstyle._orient_from_widget(None, kwargs)
+            elif class_keyword in ORIENT_CLASSES:
+                return None
+        resolved = Bootstyle._resolve(widget_class, style_string, orient)
+        if not resolved.ttkstyle:
+            return None
+        if not style.style_exists_in_theme(resolved.ttkstyle):
+            if not (Style.defer_styles and style._defer_style(resolved)):
+                builder: StyleBuilderTTK = style._get_builder()
+                builder.build_style(resolved.method_name, resolved.color)
+        return resolved.ttkstyle
+
+    @staticmethod
+    def cache_info():
+        """Return the statistics of the caches used to resolve bootstyle
+        strings.
+
+        Returns:
+
+            Dict[str, Dict[str, int]]:
+                The hits, misses, maxsize and currsize of the keyword
+                (`tokens`) and style (`styles`) caches.
+        """
+        return {
+            "tokens": Bootstyle._tokenize.cache_info()._asdict(),
+            "styles": Bootstyle._resolve.cache_info()._asdict(),
+        }
+
+    @staticmethod
+    def cache_clear():
+        """Clear the caches used to resolve bootstyle strings."""
+        Bootstyle._tokenize.cache_clear()
+        Bootstyle._resolve.cache_clear()
+        Bootstyle._widget_classes.clear()
+
+    @staticmethod
+    def widget_class_name(widget):
+        """Return the tk class name of the widget, such as _TButton_.
+        The name is looked up once per python class, unless the widget
+        was created with a custom class name.
+
+        Parameters:
+
+            widget (Widget):
+                The widget object.
+
+        Returns:
+
+            str:
+                The tk class name.
+        """
+        try:
+            # set by the constructor when `class_` or `className` is used
+            return widget.__dict__["_bootstyle_class"]
+        except KeyError:
+            pass
+        widget_type = type(widget)
+        try:
+            return Bootstyle._widget_classes[widget_type]
+        except KeyError:
+            name = widget.winfo_class()
+            Bootstyle._widget_classes[widget_type] = name
+            return name
+
+    @staticmethod
+    @lru_cache(maxsize=RESOLVER_CACHE_SIZE)
+    def _tokenize(style_string):
+        """Find the color, type, orient and class keywords of a
+        lowercase keyword string."""
+
+        def search(pattern):
+            match = re.search(pattern, style_string)
+            return "" if match is None else match.group(0)
+
+        return (
+            search(Keywords.COLOR_PATTERN),
+            search(Keywords.TYPE_PATTERN),
+            search(Keywords.ORIENT_PATTERN),
+            search(Keywords.CLASS_PATTERN),
+        )
+
+    @staticmethod
+    def _class_keyword(class_name):
+        """Find the widget class keyword in a lowercase tk class name."""
+        return Bootstyle._tokenize(class_name)[3]
+
+    @staticmethod
+    def _orient_from_widget(widget, kwargs):
+        """Find the orientation from the constructor keyword arguments or
+        from the configuration of a widget that has an orientation."""
+        if "orient" in kwargs:
+            _orient = kwargs["orient"]
+            if _orient == "h":
+                return "horizontal"
+            elif _orient == "v":
+                return "vertical"
+            else:
+                return _orient
+        if widget is None:
+            return ""
+        class_name = Bootstyle.widget_class_name(widget).lower()
+        if Bootstyle._class_keyword(class_name) not in ORIENT_CLASSES:
+            return ""
+        try:
+            return str(widget.cget("orient"))
+        except:
+            return ""
+
+    @staticmethod
+    @lru_cache(maxsize=RESOLVER_CACHE_SIZE)
+    def _resolve(widget_class, style_string, widget_orient):
+        """Build the resolved style record; memoized by `resolve`."""
+        color, widget_type, _, _ = Bootstyle._tokenize(style_string)
+
+        _color = f"{color}." if color else ""
+        _type = f"{widget_type.title()}." if widget_type else ""
+        _orient = f"{widget_orient.title()}." if widget_orient else ""
+
+        if widget_class.startswith("t"):
+            _class = widget_class.title()
+        else:
+            _class = f"T{widget_class.title()}"
+
+        ttkstyle = f"{_color}{_type}{_orient}{_class}"
+
+        # the builder method is looked up from the ttkstyle name
+        _, method_type, _, method_class = Bootstyle._tokenize(
+            ttkstyle.lower()
+        )
+        if not method_type and not method_class:
+            method_name = ""
+        else:
+            method_type = f"_{method_type}" if method_type else ""
+            method_class = f"_{method_class}" if method_class else ""
+            method_name = f"create{method_type}{method_class}_style"
+
+        return ResolvedStyle(
+            color, widget_type, widget_orient, widget_class, ttkstyle,
+            method_name,
+        )
+
     @staticmethod
     def ttkstyle_widget_class(widget=None, string=""):
         """Find and return the widget class
@@ -4595,21 +6591,16 @@ class Bootstyle:
                 A widget class keyword.
         """
         # find widget class from string pattern
-        match = re.search(Keywords.CLASS_PATTERN, string.lower())
-        if match is not None:
-            widget_class = match.group(0)
+        widget_class = Bootstyle._tokenize(string.lower())[3]
+        if widget_class:
             return widget_class
 
         # find widget class from tkinter/tcl method
         if widget is None:
             return ""
-        _class = widget.winfo_class()
-        match = re.search(Keywords.CLASS_PATTERN, _class.lower())
-        if match is not None:
-            widget_class = match.group(0)
-            return widget_class
-        else:
-            return ""
+        return Bootstyle._class_keyword(
+            Bootstyle.widget_class_name(widget).lower()
+        )
 
     @staticmethod
     def ttkstyle_widget_type(string):
@@ -4625,12 +6616,7 @@ class Bootstyle:
             str:
                 A widget type keyword.
         """
-        match = re.search(Keywords.TYPE_PATTERN, string.lower())
-        if match is None:
-            return ""
-        else:
-            widget_type = match.group(0)
-            return widget_type
+        return Bootstyle._tokenize(string.lower())[1]
 
     @staticmethod
     def ttkstyle_widget_orient(widget=None, string="", **kwargs):
@@ -4654,33 +6640,10 @@ class Bootstyle:
                 A widget orientation keyword.
         """
         # string method (priority)
-        match = re.search(Keywords.ORIENT_PATTERN, string)
-        widget_orient = ""
-
-        if match is not None:
-            widget_orient = match.group(0)
-            return widget_orient
-
-        # orient from kwargs
-        if "orient" in kwargs:
-            _orient = kwargs.pop("orient")
-            if _orient == "h":
-                widget_orient = "horizontal"
-            elif _orient == "v":
-                widget_orient = "vertical"
-            else:
-                widget_orient = _orient
-            return widget_orient
-
-        # orient from settings
-        if widget is None:
+        widget_orient = Bootstyle._tokenize(string.lower())[2]
+        if widget_orient:
             return widget_orient
-        try:
-            widget_orient = str(widget.cget("orient"))
-        except:
-            pass
-
-        return widget_orient
+        return Bootstyle._orient_from_widget(widget, kwargs)
 
     @staticmethod
     def ttkstyle_widget_color(string):
@@ -4696,12 +6659,7 @@ class Bootstyle:
             str:
                 A color keyword.
         """
-        _color = re.search(Keywords.COLOR_PATTERN, string.lower())
-        if _color is None:
-            return ""
-        else:
-            widget_color = _color.group(0)
-            return widget_color
+        return Bootstyle._tokenize(string.lower())[0]
 
     @staticmethod
     def ttkstyle_name(widget=None, string="", **kwargs):
@@ -4723,30 +6681,7 @@ class Bootstyle:
             str:
                 A ttk style name
         """
-        style_string = "".join(string).lower()
-        widget_color = Bootstyle.ttkstyle_widget_color(style_string)
-        widget_type = Bootstyle.ttkstyle_widget_type(style_string)
-        widget_orient = Bootstyle.ttkstyle_widget_orient(
-            widget, style_string, **kwargs
-        )
-        widget_class = Bootstyle.ttkstyle_widget_class(widget, style_string)
-
-        if widget_color:
-            widget_color = f"{widget_color}."
-
-        if widget_type:
-            widget_type = f"{widget_type.title()}."
-
-        if widget_orient:
-            widget_orient = f"{widget_orient.title()}."
-
-        if widget_class.startswith("t"):
-            widget_class = widget_class.title()
-        else:
-            widget_class = f"T{widget_class.title()}"
-
-        ttkstyle = f"{widget_color}{widget_type}{widget_orient}{widget_class}"
-        return ttkstyle
+        return Bootstyle.resolve(widget, string, **kwargs).ttkstyle
 
     @staticmethod
     def ttkstyle_method_name(widget=None, string=""):
@@ -4828,9 +6763,25 @@ class Bootstyle:
             else:
                 style = ""
 
+            # create the widget with its style in a single command when the
+            #    style can be resolved without the widget
+            ttkstyle = Bootstyle._prepare_ttk_style(
+                self, style or bootstyle or "default", kwargs
+            )
+            if ttkstyle:
+                func(self, *args, style=ttkstyle, **kwargs)
+                style_obj: Style = Style.get_instance()
+                style_obj._track_widget_style(self, ttkstyle)
+                style_obj._watch_deferred(self, ttkstyle)
+                return
+
             # instantiate the widget
             func(self, *args, **kwargs)
 
+            # a custom class name must not be cached for the python class
+            if "class_" in kwargs:
+                self._bootstyle_class = self.winfo_class()
+
             # must be called AFTER instantiation in order to use winfo_class
             #    in the `get_ttkstyle_name` method
 
@@ -4892,6 +6843,11 @@ class Bootstyle:
             # update widget configuration
             func(self, **kwargs)
 
+            if "style" in kwargs:
+                style: Style = Style.get_instance()
+                if style is not None:
+                    style._track_widget_style(self, kwargs["style"])
+
         return configure
 
     @staticmethod
@@ -4928,30 +6884,20 @@ class Bootstyle:
             return ""
 
         # build style if not existing (example: theme changed)
-        ttkstyle = Bootstyle.ttkstyle_name(widget, style_string, **kwargs)
+        resolved = Bootstyle.resolve(widget, style_string, **kwargs)
+        ttkstyle = resolved.ttkstyle
         if not style.style_exists_in_theme(ttkstyle):
-            widget_color = Bootstyle.ttkstyle_widget_color(ttkstyle)
-            method_name = Bootstyle.ttkstyle_method_name(widget, ttkstyle)
-            builder: StyleBuilderTTK = style._get_builder()
-            builder_method = builder.name_to_method(method_name)
-            builder_method(builder, widget_color)
-
-        # subscribe popdown style to theme changes
-        try:
-            if widget.winfo_class() == "TCombobox":
+            if (
+                Style.defer_styles
+                and widget is not None
+                and not widget.winfo_ismapped()
+                and style._defer_style(resolved)
+            ):
+                # built when the widget is mapped
+                style._watch_deferred(widget, ttkstyle)
+            else:
                 builder: StyleBuilderTTK = style._get_builder()
-                winfo_id = hex(widget.winfo_id())
-                winfo_pathname = widget.winfo_pathname(winfo_id)
-                Publisher.subscribe(
-                    name=winfo_pathname,
-                    func=lambda w=widget: builder.update_combobox_popdown_style(
-                        w
-                    ),
-                    channel=Channel.STD,
-                )
-                builder.update_combobox_popdown_style(widget)
-        except:
-            pass
+                builder.build_style(resolved.method_name, resolved.color)
 
         return ttkstyle
 
@@ -5005,6 +6951,19 @@ class Bootstyle:
             # override widget destroy method (quit for tk.Tk)
             widget.destroy = Bootstyle.override_widget_destroy_method
 
+    @staticmethod
+    def update_combobox_popdown_style(widget):
+        """Update the popdown window of a ttk.Combobox with the builder
+        of the current theme.
+
+        Parameters:
+
+            widget (ttk.Combobox):
+                The combobox widget.
+        """
+        builder: StyleBuilderTTK = Style._get_builder()
+        builder.update_combobox_popdown_style(widget)
+
     @staticmethod
     def update_tk_widget_style(widget):
         """Lookup the widget name and call the appropriate update
@@ -5051,11 +7010,16 @@ class Bootstyle:
             # instantiate the widget
             func(self, *args, **kwargs)
 
+            # a custom class name must not be cached for the python class
+            if "class_" in kwargs or "className" in kwargs:
+                self._bootstyle_class = self.winfo_class()
+
             if autostyle:
                 Publisher.subscribe(
                     name=str(self),
-                    func=lambda w=self: Bootstyle.update_tk_widget_style(w),
+                    func=Bootstyle.update_tk_widget_style,
                     channel=Channel.STD,
+                    widget=self,
                 )
                 Bootstyle.update_tk_widget_style(self)
 
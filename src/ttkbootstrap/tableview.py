@@ -1,8 +1,14 @@
+import locale
+import re
+import weakref
 import tkinter as tk
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 from math import ceil
-from datetime import datetime
+from itertools import chain
+from bisect import bisect_left, bisect_right
+from array import array
+from datetime import date, datetime, time, timezone
 from tkinter import font
 from ttkbootstrap import utility
 from typing import Any, Dict, List, Union
@@ -13,6 +19,8 @@ DOWNARROW = "⬇"
 ASCENDING = 0
 DESCENDING = 1
 
+_DIGITS = re.compile(r"(\d+)")
+
 
 class TableColumn:
     """Represents a column in a Tableview object"""
@@ -190,9 +198,10 @@ class TableColumn:
         if index is None:
             return
 
-        for row in self._table.tablerows:
-            row.values.pop(index)
-            row.refresh()
+        table = self._table
+        table._store.delete_column(index)
+        for position, iid in table._rowiids.items():
+            self.view.item(iid, values=table._store.get_row(position))
 
         # actual columns
         cols = list(self.view.cget("columns"))
@@ -208,6 +217,12 @@ class TableColumn:
 
         # remove cid mapping
         self._table.cidmap.pop(self._cid)
+        self._table._sortcolumns = [
+            (c, s) for c, s in self._table._sortcolumns if c is not self
+        ]
+        self._table._rowfilters = [
+            f for f in self._table._rowfilters if f.column is not self
+        ]
 
         # reconfigure the tableview column and displaycolumns
         self.view.configure(columns=cols, displaycolumns=dcols)
@@ -235,38 +250,940 @@ class TableColumn:
         self._settings_column.pop("id")
 
 
+class ColumnStore:
+    """Stores the records of a Tableview by column. A column is a typed
+    array while all of its values are integers, or all are floats, and
+    a list otherwise. A record is addressed by its integer position in
+    the store, which does not change when the records are sorted,
+    filtered, or deleted.
+
+    Deleted records keep their position and values until the store is
+    compacted, which removes them and numbers the remaining records
+    from zero.
+
+    The sort index of a column is built when it is first requested, and
+    kept until the values of the column change. The search index is
+    updated with the records that change.
+    """
+
+    def __init__(self):
+        self.columns = []
+        self.size = 0
+        self.version = 0  # incremented when the records change
+        self._sort_indexes = {}  # sort index by column index
+        self._value_indexes = {}  # positions by value, by column index
+        self._search_index = SearchIndex(self)
+
+    def __len__(self):
+        return self.size
+
+    def clear(self):
+        """Remove all records and columns."""
+        self.columns = []
+        self.size = 0
+        self._changed()
+        self._search_index.invalidate()
+
+    def extend(self, rowdata):
+        """Append records to the store. Missing values are stored as
+        empty strings.
+
+        Parameters:
+
+            rowdata (List[Iterable]):
+                The values of each record.
+
+        Returns:
+
+            range:
+                The positions of the new records.
+        """
+        rows = [v if isinstance(v, (list, tuple)) else list(v) for v in rowdata]
+        start = self.size
+        if not rows:
+            return range(start, start)
+        width = max(len(values) for values in rows)
+        while len(self.columns) < width:
+            self.columns.append([""] * start)
+        for index, column in enumerate(self.columns):
+            values = [v[index] if index < len(v) else "" for v in rows]
+            self.columns[index] = _extend_column(column, values)
+        self.size += len(rows)
+        self._changed()
+        self._search_index.invalidate(range(start, self.size))
+        return range(start, self.size)
+
+    def compact(self, positions):
+        """Remove the records that are not in `positions`. The remaining
+        records keep their order and are numbered from zero. The column
+        indexes are updated instead of built again.
+
+        Parameters:
+
+            positions (Iterable[int]):
+                The positions of the records to keep.
+
+        Returns:
+
+            array:
+                The new position of each previous record position, or
+                -1 for the records that were removed.
+        """
+        keep = sorted(positions)
+        mapping = array("q", [-1]) * self.size
+        for new, old in enumerate(keep):
+            mapping[old] = new
+        for index, column in enumerate(self.columns):
+            values = [column[p] for p in keep]
+            if isinstance(column, array):
+                values = array(column.typecode, values)
+            self.columns[index] = values
+        self.size = len(keep)
+        self.version += 1
+        for sortindex in self._sort_indexes.values():
+            sortindex.compact(keep, mapping)
+        for valueindex in self._value_indexes.values():
+            for value, positions in list(valueindex.items()):
+                positions = [mapping[p] for p in positions if mapping[p] >= 0]
+                if positions:
+                    valueindex[value] = positions
+                else:
+                    del valueindex[value]
+        self._search_index.compact(keep)
+        return mapping
+
+    def column(self, index):
+        """Return the values of a column, or `None` if no record has a
+        value for it.
+
+        Parameters:
+
+            index (int):
+                The column index.
+
+        Returns:
+
+            Union[array, List, None]:
+                The column values by record position.
+        """
+        if index is None or index >= len(self.columns):
+            return None
+        return self.columns[index]
+
+    def get_row(self, position):
+        """Return the values of a record.
+
+        Parameters:
+
+            position (int):
+                The record position.
+
+        Returns:
+
+            Tuple[Any, ...]:
+                The record values.
+        """
+        return tuple(column[position] for column in self.columns)
+
+    def set_row(self, position, values):
+        """Replace the values of a record.
+
+        Parameters:
+
+            position (int):
+                The record position.
+
+            values (Iterable):
+                The new record values.
+        """
+        values = list(values)
+        while len(self.columns) < len(values):
+            self.columns.append([""] * self.size)
+        for index in range(len(self.columns)):
+            value = values[index] if index < len(values) else ""
+            self.set_value(position, index, value)
+
+    def set_value(self, position, index, value):
+        """Replace a single value. A typed column is converted to a list
+        if the value does not match its type.
+
+        Parameters:
+
+            position (int):
+                The record position.
+
+            index (int):
+                The column index.
+
+            value (Any):
+                The new value.
+        """
+        self._changed(index)
+        column = self.columns[index]
+        if isinstance(column, array):
+            if _array_typecode([value]) == column.typecode:
+                try:
+                    column[position] = value
+                except OverflowError:
+                    column = self.columns[index] = column.tolist()
+                    column[position] = value
+            else:
+                column = self.columns[index] = column.tolist()
+                column[position] = value
+        else:
+            column[position] = value
+        self._search_index.invalidate([position])
+
+    def fill_columns(self, width, fillvalue=""):
+        """Add columns to the store, up to `width`, that hold `fillvalue`
+        for every record.
+
+        Parameters:
+
+            width (int):
+                The number of columns.
+
+            fillvalue (Any):
+                The value of the new columns.
+        """
+        if len(self.columns) >= width:
+            return
+        while len(self.columns) < width:
+            self.columns.append([fillvalue] * self.size)
+        self._changed()
+        self._search_index.invalidate()
+
+    def delete_column(self, index):
+        """Remove a column from every record.
+
+        Parameters:
+
+            index (int):
+                The column index.
+        """
+        if index < len(self.columns):
+            del self.columns[index]
+            self._changed()
+            self._search_index.invalidate()
+
+    def search(self, query):
+        """Return the positions of the records with a value that
+        contains the query. The search is not case sensitive.
+
+        Parameters:
+
+            query (str):
+                The text to search for.
+
+        Returns:
+
+            List[int]:
+                The matching record positions, in position order.
+        """
+        return self._search_index.search(query)
+
+    def sort_index(self, index):
+        """Return the sort index of a column.
+
+        Parameters:
+
+            index (int):
+                The column index.
+
+        Returns:
+
+            SortIndex:
+                The sort order of the column values.
+        """
+        sortindex = self._sort_indexes.get(index)
+        if sortindex is None:
+            sortindex = SortIndex(self.column(index), self.size)
+            self._sort_indexes[index] = sortindex
+        return sortindex
+
+    def value_index(self, index):
+        """Return the positions of the records by value for a column.
+        Unhashable values are indexed by their string.
+
+        Parameters:
+
+            index (int):
+                The column index.
+
+        Returns:
+
+            Dict[Any, List[int]]:
+                The record positions of each distinct value.
+        """
+        valueindex = self._value_indexes.get(index)
+        if valueindex is None:
+            valueindex = {}
+            column = self.column(index)
+            if column is None:
+                column = [""] * self.size
+            for position, value in enumerate(column):
+                try:
+                    positions = valueindex.get(value)
+                except TypeError:
+                    value = str(value)
+                    positions = valueindex.get(value)
+                if positions is None:
+                    valueindex[value] = [position]
+                else:
+                    positions.append(position)
+            self._value_indexes[index] = valueindex
+        return valueindex
+
+    def _changed(self, index=None):
+        """Discard the column indexes after the values of a column, or
+        of all columns, change."""
+        self.version += 1
+        if index is None:
+            self._sort_indexes.clear()
+            self._value_indexes.clear()
+        else:
+            self._sort_indexes.pop(index, None)
+            self._value_indexes.pop(index, None)
+
+
+class SearchIndex:
+    """The text search index of a `ColumnStore`.
+
+    The values of each record are joined into a single lowercase text
+    when the store is first searched. The results of recent queries are
+    kept; a query that contains a recent query only searches the
+    records that matched it, so that each character typed in the search
+    bar refines the previous result instead of searching every record.
+    """
+
+    CACHE_SIZE = 32  # number of query results kept
+
+    def __init__(self, store):
+        """
+        Parameters:
+
+            store (ColumnStore):
+                The store of the records.
+        """
+        self._store = store
+        self._texts = None  # lowercase text by record position
+        self._results = {}  # matching positions by recent query
+
+    def search(self, query):
+        """Return the positions of the records with a value that
+        contains the query.
+
+        Parameters:
+
+            query (str):
+                The text to search for.
+
+        Returns:
+
+            List[int]:
+                The matching record positions, in position order.
+        """
+        query = str(query).lower()
+        results = self._results
+        hits = results.pop(query, None)
+        if hits is None:
+            texts = self._record_texts()
+            candidates = None
+            for previous, positions in results.items():
+                if previous in query:
+                    if candidates is None or len(positions) < len(candidates):
+                        candidates = positions
+            if candidates is None:
+                hits = [p for p, text in enumerate(texts) if query in text]
+            else:
+                hits = [p for p in candidates if query in texts[p]]
+            if len(results) >= self.CACHE_SIZE:
+                del results[next(iter(results))]
+        results[query] = hits
+        return hits
+
+    def invalidate(self, positions=None):
+        """Update the index after the records change.
+
+        Parameters:
+
+            positions (Iterable[int]):
+                The positions of the records that were added or changed.
+                If `None`, the index is built again when it is next
+                searched.
+        """
+        self._results.clear()
+        if self._texts is None:
+            return
+        if positions is None:
+            self._texts = None
+            return
+        texts = self._texts
+        for position in positions:
+            text = self._text(position)
+            if position < len(texts):
+                texts[position] = text
+            else:
+                texts.append(text)
+
+    def compact(self, keep):
+        """Keep the texts of the records that remain after the store is
+        compacted.
+
+        Parameters:
+
+            keep (List[int]):
+                The previous positions of the remaining records, in
+                order.
+        """
+        self._results.clear()
+        if self._texts is not None:
+            texts = self._texts
+            self._texts = [texts[p] for p in keep]
+
+    def _record_texts(self):
+        """Return the text of each record, and build them if needed."""
+        if self._texts is None:
+            columns = self._store.columns
+            if columns:
+                values = zip(*(map(str, column) for column in columns))
+                # a separator that is never typed, so that a query does
+                # not match across two values
+                self._texts = ["\x1f".join(v).lower() for v in values]
+            else:
+                self._texts = [""] * self._store.size
+        return self._texts
+
+    def _text(self, position):
+        columns = self._store.columns
+        return "\x1f".join(str(c[position]) for c in columns).lower()
+
+
+class SortIndex:
+    """The sort order of the values of a column.
+
+    The values are compared as numbers if they are all numbers or
+    numeric strings, as dates if they are all dates or ISO format
+    date strings, and otherwise as strings in natural order, so that
+    "item 2" is before "item 10", using the collation of the current
+    locale. Empty values, `None` and "", are last in both directions.
+
+    Attributes:
+
+        order (List[int]):
+            The positions of the records with a value, in ascending
+            order. Equal values are in position order.
+
+        missing (List[int]):
+            The positions of the records without a value.
+
+        ranks (array):
+            The rank of the value of each record position; equal values
+            have the same rank, and empty values have the highest rank.
+    """
+
+    __slots__ = (
+        "order", "missing", "ranks", "_descending", "_keys", "_starts",
+        "_convert",
+    )
+
+    def __init__(self, column, size):
+        """
+        Parameters:
+
+            column (Union[array, List, None]):
+                The column values by record position.
+
+            size (int):
+                The number of records.
+        """
+        ranks, keys, convert = _column_ranks(column, size)
+        buckets = [[] for _ in range(len(keys) + 1)]
+        for position, rank in enumerate(ranks):
+            buckets[rank].append(position)
+        self.missing = buckets.pop()
+        self.order = list(chain.from_iterable(buckets))
+        self.ranks = ranks
+        self._descending = None
+        self._keys = keys
+        self._convert = convert
+        # the index in `order` of the first position of each rank
+        self._starts = [0]
+        for bucket in buckets:
+            self._starts.append(self._starts[-1] + len(bucket))
+
+    def positions(self, descending=False):
+        """Return the record positions in sort order.
+
+        Parameters:
+
+            descending (bool):
+                Sort in descending order.
+
+        Returns:
+
+            List[int]:
+                The sorted record positions.
+        """
+        if descending:
+            return self.order[::-1] + self.missing
+        return self.order + self.missing
+
+    def keys(self, descending=False):
+        """Return the sort key of each record position, for a stable
+        sort of a subset of the records.
+
+        Parameters:
+
+            descending (bool):
+                Return the keys for the descending order.
+
+        Returns:
+
+            array:
+                The sort keys by record position.
+        """
+        if not descending:
+            return self.ranks
+        if self._descending is None:
+            top = len(self.order) and self.ranks[self.order[-1]]
+            self._descending = array(
+                "q", [top - r if r <= top else r for r in self.ranks]
+            )
+        return self._descending
+
+    def compact(self, keep, mapping):
+        """Remove the records that are not kept after the store is
+        compacted, and number the others by their new positions.
+
+        Parameters:
+
+            keep (List[int]):
+                The previous positions of the remaining records, in
+                order.
+
+            mapping (array):
+                The new position of each previous position, or -1.
+        """
+        self.order = [mapping[p] for p in self.order if mapping[p] >= 0]
+        self.missing = [mapping[p] for p in self.missing if mapping[p] >= 0]
+        ranks = self.ranks
+        self.ranks = array("q", [ranks[p] for p in keep])
+        self._descending = None
+        counts = [0] * (len(self._keys) + 1)
+        for rank in self.ranks:
+            counts[rank] += 1
+        self._starts = [0]
+        for count in counts[:-1]:
+            self._starts.append(self._starts[-1] + count)
+
+    def compare(self, operator, value):
+        """Return the positions of the records whose value compares to
+        `value` with the operator. The value is converted to the type
+        of the column values; empty values never match.
+
+        Parameters:
+
+            operator (str):
+                One of "<", "<=", ">", ">=".
+
+            value (Any):
+                The value to compare with.
+
+        Returns:
+
+            List[int]:
+                The matching record positions, in sort order.
+        """
+        if operator not in ("<", "<=", ">", ">="):
+            raise ValueError(f"'{operator}' is not a range operator")
+        keys = self._keys
+        try:
+            key = self._convert(value)
+            if operator == "<":
+                first, last = 0, bisect_left(keys, key)
+            elif operator == "<=":
+                first, last = 0, bisect_right(keys, key)
+            elif operator == ">":
+                first, last = bisect_right(keys, key), len(keys)
+            else:
+                first, last = bisect_left(keys, key), len(keys)
+        except (TypeError, ValueError, OverflowError):
+            # the value cannot be compared with the column values
+            return []
+        return self.order[self._starts[first] : self._starts[last]]
+
+
+class RowFilter:
+    """A condition on the values of a table column. Row filters are
+    added with `Tableview.add_row_filter`, or with a filter expression
+    in the search bar.
+
+    The filters of a table are combined in order. Filters that are
+    joined with "and" are combined first, and the results of these
+    groups are joined with "or".
+
+    Attributes:
+
+        column (TableColumn):
+            The column of the values.
+
+        operator (str):
+            One of "=", "!=", "in", "<", "<=", ">", ">=", "contains".
+
+        value (Any):
+            The value to compare with; a list of values for the "in"
+            operator.
+
+        combine (str):
+            How the filter is joined with the previous filters; "and"
+            or "or".
+    """
+
+    OPERATORS = ("=", "!=", "in", "<", "<=", ">", ">=", "contains")
+
+    def __init__(self, column, operator, value, combine="and"):
+        """
+        Parameters:
+
+            column (TableColumn):
+                The column of the values.
+
+            operator (str):
+                One of "=", "!=", "in", "<", "<=", ">", ">=", "contains".
+                Equality finds the value and its numeric or string form,
+                so "12" matches 12. The range operators compare numbers,
+                dates, and text as in `SortIndex`. Empty values, `None`,
+                "", and NaN, never match "!=" or the range operators.
+                "contains" is not case sensitive.
+
+            value (Any):
+                The value to compare with; a list of values for the "in"
+                operator.
+
+            combine (str):
+                How the filter is joined with the previous filters;
+                "and" or "or".
+        """
+        if operator not in self.OPERATORS:
+            raise ValueError(f"'{operator}' is not a valid filter operator")
+        if combine not in ("and", "or"):
+            raise ValueError(f"'{combine}' is not a valid filter combination")
+        self.column = column
+        self.operator = operator
+        self.value = value
+        self.combine = combine
+        self._positions = None
+        self._version = None
+
+    def positions(self, store):
+        """Return the positions of the records that match the filter.
+        The result is kept until the records change.
+
+        Parameters:
+
+            store (ColumnStore):
+                The table records.
+
+        Returns:
+
+            Set[int]:
+                The matching record positions.
+        """
+        if self._positions is not None and self._version == store.version:
+            return self._positions
+
+        index = self.column.tableindex
+        operator = self.operator
+        if operator in ("=", "!=", "in"):
+            valueindex = store.value_index(index)
+            values = self.value if operator == "in" else [self.value]
+            matches = set()
+            for value in values:
+                for variant in _value_variants(value):
+                    try:
+                        matches.update(valueindex.get(variant, ()))
+                    except TypeError:
+                        matches.update(valueindex.get(str(variant), ()))
+            if operator == "!=":
+                matches = set(range(store.size)).difference(
+                    matches, store.sort_index(index).missing
+                )
+        elif operator == "contains":
+            text = str(self.value).lower()
+            matches = set()
+            for value, positions in store.value_index(index).items():
+                if text in str(value).lower():
+                    matches.update(positions)
+        else:
+            matches = set(store.sort_index(index).compare(operator, self.value))
+
+        self._positions = matches
+        self._version = store.version
+        return matches
+
+
+def _array_typecode(values):
+    """Return the array typecode for the values, or `None` if they are
+    not all integers or all floats."""
+    types = set(map(type, values))
+    if types == {int}:
+        return "q"
+    if types == {float}:
+        return "d"
+    return None
+
+
+def _extend_column(column, values):
+    """Append the values to a column and return the column, which is a
+    new list when the values do not fit its array type."""
+    typecode = _array_typecode(values)
+    if isinstance(column, array):
+        if typecode == column.typecode:
+            try:
+                column.extend(array(typecode, values))
+                return column
+            except OverflowError:
+                pass
+        column = column.tolist()
+    elif not column and typecode is not None:
+        try:
+            return array(typecode, values)
+        except OverflowError:
+            pass
+    column.extend(values)
+    return column
+
+
+def _column_ranks(column, size):
+    """Return the rank of the value of each record position, the sort
+    key of each rank, and the function that converts a value to its
+    sort key. Empty values have the rank after the highest rank. Only
+    the distinct values of the column are converted and sorted."""
+    if column is None:
+        return array("q", bytes(8 * size)), [], None
+    try:
+        distinct = set(column)
+    except TypeError:
+        # unhashable values are compared as strings
+        column = [v if v is None else str(v) for v in column]
+        distinct = set(column)
+    # NaN cannot be ordered; it is sorted with the empty values
+    values = [v for v in distinct if v is not None and v == v and v != ""]
+
+    keys = None
+    for convert in (_number_key, _date_key):
+        try:
+            keys = [convert(v) for v in values]
+            break
+        except (TypeError, ValueError, OverflowError):
+            pass
+    if keys is None:
+        convert = _string_key
+        keys = [_string_key(v) for v in values]
+
+    ranks = {}
+    rankkeys = []
+    for i in sorted(range(len(keys)), key=keys.__getitem__):
+        key = keys[i]
+        if not rankkeys or key != rankkeys[-1]:
+            rankkeys.append(key)
+        ranks[values[i]] = len(rankkeys) - 1
+    top = len(rankkeys)
+    get = ranks.get
+    return array("q", [get(v, top) for v in column]), rankkeys, convert
+
+
+def _number_key(value):
+    """Return a number as its sort key; numeric strings are converted."""
+    if isinstance(value, str):
+        value = float(value)
+    elif not isinstance(value, (int, float)):
+        raise TypeError(value)
+    if value != value:
+        raise ValueError(value)
+    return value
+
+
+def _date_key(value):
+    """Return a date as a naive datetime sort key in UTC; ISO format
+    date strings are converted."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.strip())
+    elif not isinstance(value, date):
+        raise TypeError(value)
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, time())
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _string_key(value):
+    """Return the natural order sort key of a string; the numbers in
+    the string are compared as numbers."""
+    parts = _DIGITS.split(str(value))
+    return tuple(
+        int(part) if i % 2 else locale.strxfrm(part.casefold())
+        for i, part in enumerate(parts)
+    )
+
+
+def _value_variants(value):
+    """Return the value and its numeric or string form."""
+    if isinstance(value, str):
+        for convert in (int, float):
+            try:
+                return [value, convert(value)]
+            except ValueError:
+                pass
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        return [value, str(value)]
+    return [value]
+
+
+_FILTER_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<string>"[^"]*"|'[^']*')
+        | (?P<operator><=|>=|!=|==|=|<|>|~)
+        | (?P<punct>[(),])
+        | (?P<word>[^\s"'(),<>=!~]+)
+    )""",
+    re.VERBOSE,
+)
+_FILTER_OPERATORS = {"==": "=", "~": "contains"}
+_FILTER_COMBINE = {
+    "and": "and", "&": "and", "&&": "and", "or": "or", "|": "or", "||": "or"
+}
+
+
+def _parse_filter_expression(text, columns):
+    """Parse a filter expression into a list of (column, operator,
+    value, combine) tuples, or return `None` if the text is not a filter
+    expression.
+
+    An expression is a list of conditions joined by "and" or "or". A
+    condition is a column header, an operator, and a value, or a list
+    of values in parentheses for the "in" operator. Headers and values
+    with spaces are quoted. For example:
+
+        Quantity >= 10 and Status in (open, pending) or "Company Name" ~ acme
+    """
+    tokens = []
+    position = 0
+    text = text.strip()
+    while position < len(text):
+        match = _FILTER_TOKEN.match(text, position)
+        if match is None:
+            return None
+        kind = match.lastgroup
+        token = match.group(kind)
+        if kind == "string":
+            token = token[1:-1]
+        tokens.append((kind, token))
+        position = match.end()
+
+    def value(i):
+        if i < len(tokens) and tokens[i][0] in ("word", "string"):
+            return tokens[i][1]
+        raise IndexError
+
+    filters = []
+    combine = "and"
+    i = 0
+    try:
+        while True:
+            column = columns.get(value(i).lower())
+            kind, token = tokens[i + 1]
+            if kind == "operator":
+                operator = _FILTER_OPERATORS.get(token, token)
+            elif kind == "word" and token.lower() in ("in", "contains"):
+                operator = token.lower()
+            else:
+                return None
+            if column is None:
+                return None
+            i += 2
+            if operator == "in":
+                if tokens[i] != ("punct", "("):
+                    return None
+                values = [value(i + 1)]
+                i += 2
+                while tokens[i] == ("punct", ","):
+                    values.append(value(i + 1))
+                    i += 2
+                if tokens[i] != ("punct", ")"):
+                    return None
+                filters.append((column, operator, values, combine))
+            else:
+                filters.append((column, operator, value(i), combine))
+            i += 1
+            if i == len(tokens):
+                return filters
+            kind, token = tokens[i]
+            combine = _FILTER_COMBINE.get(token.lower())
+            if kind != "word" or combine is None:
+                return None
+            i += 1
+    except IndexError:
+        return None
+
+
 class TableRow:
-    """Represents a row in a Tableview object"""
+    """Represents a row in a Tableview object.
 
-    _cnt = 0
+    A row object is a lightweight handle for a record in the table data,
+    which is stored by column. Row objects are created on demand, and
+    there is one handle per record while it is referenced, so that it
+    can follow the record when the table data is compacted.
+    """
 
-    def __init__(self, tableview, values):
+    __slots__ = ("_table", "_position", "__weakref__")
+
+    def __new__(cls, tableview, position):
+        row = tableview._rowhandles.get(position)
+        if row is None:
+            row = super().__new__(cls)
+            tableview._rowhandles[position] = row
+        return row
+
+    def __init__(self, tableview, position):
         """
         Parameters:
 
             tableview (Tableview):
                 The Tableview widget that contains this row
 
-            values (List[Any, ...]):
-                A list of values to display in the row
+            position (int):
+                The position of the record in the table data
         """
-        self.view: ttk.Treeview = tableview.view
-        self._values = values
-        self._iid = None
-        self._sort = TableRow._cnt + 1
         self._table = tableview
+        self._position = position
 
-        # increment cnt
-        TableRow._cnt += 1
+    def __eq__(self, other):
+        return (
+            isinstance(other, TableRow)
+            and other._table is self._table
+            and other._position == self._position
+        )
+
+    def __hash__(self):
+        return hash(self._position)
+
+    @property
+    def view(self) -> ttk.Treeview:
+        """The `Treeview` of the table"""
+        return self._table.view
 
     @property
     def values(self):
-        """The table row values"""
-        return self._values
+        """The table row values, as a tuple. Assign a new sequence to
+        change them."""
+        return self._table._store.get_row(self._position)
 
     @values.setter
     def values(self, values):
-        self._values = values
+        self._table._store.set_row(self._position, values)
         self.refresh()
 
     @property
@@ -274,12 +1191,20 @@ class TableRow:
         """A unique record identifier"""
         return str(self._iid)
 
+    @property
+    def _iid(self):
+        return self._table._rowiids.get(self._position)
+
     def configure(self, opt=None, **kwargs):
         """Configure the row. If opt is provided, the
         current value is returned, otherwise, sets the widget
         options specified in kwargs. See the documentation for
         `Tableview.insert_row` for configurable options.
 
+        In virtual mode, only the `values` and `tags` options are
+        supported, because the treeview items are reused for other
+        rows when the table is scrolled.
+
         Parameters:
 
             opt (str):
@@ -289,6 +1214,8 @@ class TableRow:
                 Optional keyword arguments used to configure the
                 row.
         """
+        if self._table._virtual:
+            return self._configure_virtual(opt, kwargs)
         if self._iid is None:
             self.build()
 
@@ -300,6 +1227,34 @@ class TableRow:
         else:
             self.view.item(self.iid, **kwargs)
 
+    def _configure_virtual(self, opt, kwargs):
+        """Configure the row in virtual mode. The row tags are kept by
+        the table and applied to the treeview item whenever the row is
+        in view."""
+        table = self._table
+        for name in kwargs if opt is None else [opt]:
+            if name not in ("values", "tags"):
+                raise ValueError(
+                    f"'{name}' cannot be configured in virtual mode"
+                )
+        if opt == "values":
+            return self.values
+        if opt == "tags":
+            return table._virtual_tags.get(self._position, ())
+        if "values" in kwargs:
+            self.values = kwargs["values"]
+        if "tags" in kwargs:
+            tags = kwargs["tags"]
+            tags = tuple(tags.split() if isinstance(tags, str) else tags)
+            if tags:
+                table._virtual_tags[self._position] = tags
+            else:
+                table._virtual_tags.pop(self._position, None)
+            if self._iid is not None:
+                if "striped" in self.view.item(self._iid, "tags"):
+                    tags += ("striped",)
+                self.view.item(self._iid, tags=tags)
+
     def show(self, striped=False):
         """Show the row in the data table view"""
         if self._iid is None:
@@ -320,11 +1275,7 @@ class TableRow:
 
     def delete(self):
         """Delete the row from the dataset"""
-        if self.iid:
-            self._table.iidmap.pop(self.iid)
-            self._table._tablerows.remove(self)
-            self._table.load_table_data()
-            self.view.delete(self.iid)
+        self._table._delete_positions([self._position])
 
     def hide(self):
         """Remove the row from the data table view"""
@@ -340,8 +1291,9 @@ class TableRow:
         the resulting item id (iid).
         """
         if self._iid is None:
-            self._iid = self.view.insert("", END, values=self.values)
-            self._table.iidmap[self.iid] = self
+            iid = self.view.insert("", END, values=self.values)
+            self._table._rowiids[self._position] = iid
+            self._table.iidmap[iid] = self
 
 
 class TableEvent:
@@ -366,6 +1318,10 @@ class Tableview(ttk.Frame):
     to be loaded very quickly even with hundreds of thousands of
     records.
 
+    For very large unpaginated tables, use the virtual option. Only the
+    rows that fit in the viewport have a `Treeview` item; the items are
+    reused for other records as the table is scrolled.
+
     All table columns are sortable. Clicking a column header will toggle
     between sorting "ascending" and "descending".
 
@@ -438,6 +1394,8 @@ class Tableview(ttk.Frame):
         pagesize=10,
         height=10,
         delimiter=",",
+        virtual=False,
+        searchdelay=None,
     ):
         """
         Parameters:
@@ -477,9 +1435,11 @@ class Tableview(ttk.Frame):
                 Press the <Return> key to initiate a search. Searching
                 with an empty string will reset the search criteria, or
                 pressing the reset button to the right of the search
-                bar. Currently, the search method looks for any row
-                that contains the search text. The filtered results
-                are displayed in the table view.
+                bar. The search method looks for any row that contains
+                the search text, unless the text is a filter expression
+                such as `UserCount >= 10 and CompanyName ~ co`; see
+                `Tableview.filter_rows`. The filtered results are
+                displayed in the table view.
 
             autofit (bool):
                 If `True`, the table columns will be automatically sized
@@ -516,42 +1476,72 @@ class Tableview(ttk.Frame):
             delimiter (str):
                 The character to use as a delimiter when exporting data
                 to CSV.
+
+            virtual (bool):
+                If `True`, only the records in the viewport are loaded
+                into the `Treeview`, and a scrollbar is created that
+                scrolls through all records. Sorting, searching,
+                filtering, and selection apply to all records. This
+                option is intended for tables with a very large number
+                of records, and cannot be combined with pagination.
+
+            searchdelay (int):
+                If provided, the table is searched as you type in the
+                search bar, after no key is pressed for `searchdelay`
+                milliseconds. Otherwise, the search starts when the
+                <Return> key is pressed.
         """
         super().__init__(master)
         self._tablecols = []
-        self._tablerows = []
+        self._store = ColumnStore()  # the record values by column
+        self._tablerows = []  # record positions in table order
         self._tablerows_filtered = []
-        self._viewdata = []
+        self._viewdata = []  # row objects in view
+        self._rowiids = {}  # maps record position to iid
+        self._rowhandles = weakref.WeakValueDictionary()  # row by position
         self._rowindex = tk.IntVar(value=0)
         self._pageindex = tk.IntVar(value=1)
         self._pagelimit = tk.IntVar(value=0)
         self._height = height
         self._pagesize = tk.IntVar(value=pagesize)
-        self._paginated = paginated
+        self._paginated = paginated and not virtual
+        self._virtual = virtual
+        self._virtual_pool = []  # treeview items reused for the rows in view
+        self._virtual_rowcount = height  # rows that fit in the viewport
+        self._virtual_selected = set()  # selected record positions
+        self._virtual_tags = {}  # row tags by record position
         self._searchable = searchable
         self._stripecolor = stripecolor
         self._autofit = autofit
         self._autoalign = autoalign
         self._filtered = False
         self._sorted = False
+        self._sortcolumns = []  # ( column, direction ) of the sort
+        self._rowfilters = []  # RowFilter objects
         self._searchcriteria = tk.StringVar()
         self._rightclickmenu_cell = None
         self._delimiter = delimiter
+        self._searchdelay = searchdelay
+        self._searchafter = None
+        self._searchtext = ""  # text of the last search or scheduled search
         self._iidmap = {}  # maps iid to row object
         self._cidmap = {}  # maps cid to col object
 
         self.view: ttk.Treeview = None
+        self.vbar: ttk.Scrollbar = None
         self._build_tableview_widget(coldata, rowdata, bootstyle)
 
     @property
     def tablerows(self):
-        """A list of all tablerow objects"""
-        return self._tablerows
+        """A list of all tablerow objects. The row objects are created
+        when the list is requested."""
+        return [TableRow(self, p) for p in self._tablerows]
 
     @property
     def tablerows_filtered(self):
-        """A list of filtered tablerow objects"""
-        return self._tablerows_filtered
+        """A list of filtered tablerow objects. The row objects are
+        created when the list is requested."""
+        return [TableRow(self, p) for p in self._tablerows_filtered]
 
     @property
     def tablerows_visible(self):
@@ -580,6 +1570,11 @@ class Tableview(ttk.Frame):
         """Indicates whether the table is currently filtered"""
         return self._filtered
 
+    @property
+    def row_filters(self) -> List[RowFilter]:
+        """A list of the row filters applied to the table"""
+        return list(self._rowfilters)
+
     @property
     def searchcriteria(self):
         """The criteria used to filter the records when the search
@@ -589,6 +1584,7 @@ class Tableview(ttk.Frame):
     @searchcriteria.setter
     def searchcriteria(self, value):
         self._searchcriteria.set(value)
+        self._searchtext = value
 
     @property
     def pagesize(self):
@@ -637,6 +1633,13 @@ class Tableview(ttk.Frame):
         except:
             super().configure(cnf, **kwargs)
 
+    def destroy(self):
+        """Cancel a pending search and destroy the widget"""
+        if self._searchafter is not None:
+            self.after_cancel(self._searchafter)
+            self._searchafter = None
+        super().destroy()
+
     # DATA HANDLING
 
     def build_table_data(self, coldata, rowdata):
@@ -673,8 +1676,8 @@ class Tableview(ttk.Frame):
                 self.insert_column(i, **col)
 
         # build the table rows
-        for values in rowdata:
-            self.insert_row(values=values)
+        rowdata = [values for values in rowdata if len(values) > 0]
+        self._tablerows.extend(self._store.extend(rowdata))
 
         # load the table data
         self.load_table_data()
@@ -718,23 +1721,11 @@ class Tableview(ttk.Frame):
             TableRow:
                 A table row object.
         """
-        rowcount = len(self._tablerows)
-
-        # validate the index
         if len(values) == 0:
             return
-        if index == END:
-            index = -1
-        elif index > rowcount - 1:
-            index = -1
-
-        record = TableRow(self, values)
-        if rowcount == 0 or index == -1:
-            self._tablerows.append(record)
-        else:
-            self._tablerows.insert(index, record)
-
-        return record
+        position = self._store.extend([values])[0]
+        self._insert_position(index, position)
+        return TableRow(self, position)
 
     def insert_rows(self, index, rowdata):
         """Insert row after index for each row in *row. If index does
@@ -761,8 +1752,9 @@ class Tableview(ttk.Frame):
         """
         if len(rowdata) == 0:
             return
-        for values in reversed(rowdata):
-            self.insert_row(index, values)
+        rowdata = [values for values in rowdata if len(values) > 0]
+        for position in reversed(self._store.extend(rowdata)):
+            self._insert_position(index, position)
 
     def delete_column(self, index=None, cid=None, visible=True):
         """Delete the specified column based on the column index or the
@@ -869,9 +1861,7 @@ class Tableview(ttk.Frame):
                 record.delete()
             # original index
             else:
-                for record in self.tablerows:
-                    if record.self._sort == index:
-                        record.delete()
+                self._delete_positions([index])
 
     def delete_rows(self, indices=None, iids=None, visible=True):
         """Delete rows specified by indices or iids.
@@ -881,19 +1871,27 @@ class Tableview(ttk.Frame):
         """
         # remove records by iid
         if iids is not None:
-            for iid in iids:
-                self.delete_row(iid=iid)
+            rows = [self.iidmap.get(iid) for iid in iids]
+            self._delete_positions([row._position for row in rows])
         # remove records by index
         elif indices is not None:
             for index in indices:
                 self.delete_row(index=index, visible=visible)
         # remove ALL records
         else:
+            self._store.clear()
+            for row in self._rowhandles.values():
+                row._position = None
+            self._rowhandles.clear()
             self._tablerows.clear()
             self._tablerows_filtered.clear()
             self._viewdata.clear()
+            self._rowiids.clear()
             self._cidmap.clear()
             self._iidmap.clear()
+            self._virtual_pool.clear()
+            self._virtual_selected.clear()
+            self._virtual_tags.clear()
             records = self.view.get_children("")
             self.view.delete(*records)
         # route to new page if no records visible
@@ -1012,16 +2010,21 @@ class Tableview(ttk.Frame):
         The table will need to be completely rebuilt after using this
         method.
         """
-        TableRow._cnt
         self.delete_rows()
         self.cidmap.clear()
         self.tablecolumns.clear()
+        self._sortcolumns.clear()
+        self._rowfilters.clear()
         self.view.configure(columns=[], displaycolumns=[])
 
     def unload_table_data(self):
         """Unload all data from the table"""
         for row in self.tablerows_visible:
-            row.hide()
+            if self._virtual:
+                # the treeview item is reused for another row
+                self._rowiids.pop(row._position, None)
+            else:
+                row.hide()
         self.tablerows_visible.clear()
 
     def load_table_data(self, clear_filters=False):
@@ -1033,7 +2036,13 @@ class Tableview(ttk.Frame):
                 Specifies that the table filters should be cleared
                 before loading the data into the view.
         """
-        if len(self.tablerows) == 0:
+        if self._virtual:
+            if clear_filters:
+                self.reset_table()
+            self._load_virtual_rows()
+            return
+
+        if len(self._tablerows) == 0:
             return
 
         if clear_filters:
@@ -1061,7 +2070,8 @@ class Tableview(ttk.Frame):
         pagelimit = self._pagelimit.get()
         self._pageindex.set(min([pagelimit, pageindex]))
 
-        for i, row in enumerate(rowdata):
+        for i, position in enumerate(rowdata):
+            row = TableRow(self, position)
             if self._stripecolor is not None and i % 2 == 0:
                 row.show(True)
             else:
@@ -1080,18 +2090,14 @@ class Tableview(ttk.Frame):
             fillvalue (Any):
                 A value to insert into an empty column
         """
-        rowcount = len(self._tablerows)
-        if rowcount == 0:
+        if len(self._tablerows) == 0:
             return
         colcount = len(self._tablecols)
-        for row in self._tablerows:
-            var = colcount - len(row._values)
-            if var <= 0:
-                return
-            else:
-                for _ in range(var):
-                    row._values.append(fillvalue)
-                row.configure(values=row._values)
+        if len(self._store.columns) >= colcount:
+            return
+        self._store.fill_columns(colcount, fillvalue)
+        for position, iid in self._rowiids.items():
+            self.view.item(iid, values=self._store.get_row(position))
 
     # CONFIGURATION
 
@@ -1174,9 +2180,9 @@ class Tableview(ttk.Frame):
         if visible:
             return self._viewdata
         elif filtered:
-            return self._tablerows_filtered
+            return self.tablerows_filtered
         else:
-            return self._tablerows
+            return self.tablerows
 
     def get_row(self, index=None, visible=False, filtered=False, iid=None) -> TableRow:
         """Returns the `TableRow` object from an index or the iid.
@@ -1221,12 +2227,12 @@ class Tableview(ttk.Frame):
                 return None
         elif filtered:
             try:
-                return self.tablerows_filtered[index]
+                return TableRow(self, self._tablerows_filtered[index])
             except IndexError:
                 return None
         else:
             try:
-                return self.tablerows[index]
+                return TableRow(self, self._tablerows[index])
             except IndexError:
                 return None
 
@@ -1293,9 +2299,16 @@ class Tableview(ttk.Frame):
 
     # COLUMN SORTING
 
-    def sort_column_data(self, event=None, cid=None, sort=None):
+    def sort_column_data(self, event=None, cid=None, sort=None, append=False):
         """Sort the table rows by the specified column. This method
-        may be trigged by an event or manually.
+        may be trigged by an event or manually. Clicking a column
+        header with the shift key pressed adds the column to the
+        current sort.
+
+        Numbers, dates, and text are each compared by their type, and
+        empty values are sorted last. See `SortIndex` for details. The
+        sort order of a column is computed once and reused until the
+        column data changes.
 
         Parameters:
 
@@ -1308,53 +2321,52 @@ class Tableview(ttk.Frame):
 
             sort (int):
                 Determines the sort direction. 0 = ASCENDING. 1 = DESCENDING.
+
+            append (bool):
+                Add the column to the columns that the table is sorted
+                by, instead of replacing them. Rows with equal values in
+                the previous sort columns are sorted by this column.
         """
         if event is not None:
             eo = self._get_event_objects(event)
             column = eo.column
-            index = column.tableindex
         elif cid is not None:
             column: TableColumn = self.cidmap.get(int(cid))
-            index = column.tableindex
         else:
             return
 
-        # update table data
-        if self.is_filtered:
-            tablerows = self.tablerows_filtered
-        else:
-            tablerows = self.tablerows
-
         if sort is not None:
             columnsort = sort
         else:
-            columnsort = self.tablecolumns[index].columnsort
+            columnsort = column.columnsort
 
         if columnsort == ASCENDING:
-            self._tablecols[index].columnsort = DESCENDING
+            column.columnsort = DESCENDING
         else:
-            self._tablecols[index].columnsort = ASCENDING
+            column.columnsort = ASCENDING
+
+        if not append:
+            self._sortcolumns = [(column, columnsort)]
+        elif column in [c for c, _ in self._sortcolumns]:
+            self._sortcolumns = [
+                (c, columnsort if c is column else s)
+                for c, s in self._sortcolumns
+            ]
+        else:
+            self._sortcolumns.append((column, columnsort))
 
-        try:
-            sortedrows = sorted(
-                tablerows, reverse=columnsort, key=lambda x: x.values[index]
-            )
-        except:
-            # when data is missing, or sometimes with numbers
-            # this is still not right, but it works most of the time
-            # fix sometime down the road when I have time 
-            self.fill_empty_columns()
-            sortedrows = sorted(
-                tablerows, reverse=columnsort, key=lambda x: int(x.values[index])
-            )
+        # update table data; the unfiltered rows are always sorted, so
+        #   that the sort is kept when the filters change
+        self._tablerows = self._sorted_positions(self._tablerows)
         if self.is_filtered:
-            self._tablerows_filtered = sortedrows
-        else:
-            self._tablerows = sortedrows
+            self._tablerows_filtered = self._sorted_positions(
+                self._tablerows_filtered
+            )
 
         # update headers
         self._column_sort_header_reset()
-        self._column_sort_header_update(column.cid)
+        for c, _ in self._sortcolumns:
+            self._column_sort_header_update(c.cid)
 
         self.unload_table_data()
         self.load_table_data()
@@ -1365,6 +2377,7 @@ class Tableview(ttk.Frame):
     def reset_row_filters(self):
         """Remove all row level filters; unhide all rows."""
         self._filtered = False
+        self._rowfilters = []
         self.searchcriteria = ""
         self.unload_table_data()
         self.load_table_data()
@@ -1386,13 +2399,11 @@ class Tableview(ttk.Frame):
     def reset_table(self):
         """Remove all table data filters and column sorts"""
         self._filtered = False
+        self._rowfilters = []
         self.searchcriteria = ""
-        try:
-            sortedrows = sorted(self.tablerows, key=lambda x: x._sort)
-        except IndexError:
-            self.fill_empty_columns()
-            sortedrows = sorted(self.tablerows, key=lambda x: x._sort)
-        self._tablerows = sortedrows
+        # record positions are in insert order
+        self._tablerows = sorted(self._tablerows)
+        self._sortcolumns = []
         self.unload_table_data()
 
         # reset the columns
@@ -1407,6 +2418,10 @@ class Tableview(ttk.Frame):
         column exactly matches the provided value. This method may
         be triggered by a window event or by specifying the column id.
 
+        The condition is added to the row filters of the table, so
+        filtering several columns shows the records that match all of
+        them. Also see `Tableview.add_row_filter`.
+
         Parameters:
 
             event (Event):
@@ -1421,27 +2436,117 @@ class Tableview(ttk.Frame):
         """
         if event is not None:
             eo = self._get_event_objects(event)
-            index = eo.column.tableindex
-            value = value or eo.row.values[index]
+            column = eo.column
+            value = value or eo.row.values[column.tableindex]
         elif cid is not None:
             column: TableColumn = self.cidmap.get(cid)
-            index = column.tableindex
         else:
             return
 
-        self._filtered = True
-        self.tablerows_filtered.clear()
-        self.unload_table_data()
+        self._rowfilters.append(RowFilter(column, "=", value))
+        self._apply_row_filters()
 
-        for row in self.tablerows:
-            if row.values[index] == value:
-                self.tablerows_filtered.append(row)
+    def add_row_filter(self, cid, operator, value, combine="and"):
+        """Add a condition on the values of a column to the row filters,
+        and show the records that match the filters.
 
-        self._rowindex.set(0)
-        self.load_table_data()
+        Filters are combined in order. Filters joined with "and" are
+        combined first, and these groups are joined with "or". Each
+        filter uses an index of the column values, which is kept until
+        the table data changes, and the results of the filters are
+        combined as sets of records.
+
+        Parameters:
+
+            cid (int):
+                A unique column identifier; typically the numerical
+                index of the column within the original dataset.
+
+            operator (str):
+                One of "=", "!=", "in", "<", "<=", ">", ">=", "contains".
+                See `RowFilter` for details.
+
+            value (Any):
+                The value to compare with; a list of values for the "in"
+                operator.
+
+            combine (str):
+                How the filter is joined with the previous filters;
+                "and" or "or".
+
+        Returns:
+
+            RowFilter:
+                The row filter, which may be passed to
+                `Tableview.remove_row_filter`.
+        """
+        column: TableColumn = self.cidmap.get(int(cid))
+        if column is None:
+            raise ValueError(f"{cid} is not a valid column identifier")
+        rowfilter = RowFilter(column, operator, value, combine)
+        self._rowfilters.append(rowfilter)
+        self._apply_row_filters()
+        return rowfilter
+
+    def remove_row_filter(self, rowfilter):
+        """Remove a filter from the row filters, and show the records
+        that match the remaining filters.
+
+        Parameters:
+
+            rowfilter (RowFilter):
+                The row filter returned by `Tableview.add_row_filter`.
+        """
+        self._rowfilters.remove(rowfilter)
+        self._apply_row_filters()
+
+    def filter_rows(self, expression):
+        """Replace the row filters with the conditions of a filter
+        expression. This is also used by the search bar; text that is
+        not a filter expression is searched for instead.
+
+        An expression is a list of conditions joined by "and" or "or".
+        A condition is a column header, an operator, and a value, or a
+        list of values in parentheses for the "in" operator. Headers
+        and values with spaces must be quoted. The operator `~` is the
+        same as "contains".
+
+        ```python
+        dt.filter_rows('UserCount >= 10 and CompanyName ~ "co"')
+        dt.filter_rows("LicenseNumber in (A123, A136) or UserCount < 5")
+        ```
+
+        Parameters:
+
+            expression (str):
+                The filter expression.
+
+        Returns:
+
+            bool:
+                `True` if the expression is valid and was applied.
+        """
+        columns = {c.headertext.lower(): c for c in self._tablecols}
+        filters = _parse_filter_expression(expression, columns)
+        if not filters:
+            return False
+        self._rowfilters = [RowFilter(*f) for f in filters]
+        self._apply_row_filters()
+        return True
 
     def filter_to_selected_rows(self):
         """Hide all records except for the selected rows"""
+        if self._virtual:
+            selected = self._virtual_selected
+            if len(selected) == 0:
+                return  # nothing is selected
+            rows = self._virtual_rows()
+            self._filtered = True
+            self._tablerows_filtered = [r for r in rows if r in selected]
+            self._rowindex.set(0)
+            self.load_table_data()
+            return
+
         criteria = self.view.selection()
         if len(criteria) == 0:
             return  # nothing is selected
@@ -1450,18 +2555,31 @@ class Tableview(ttk.Frame):
             for row in self.tablerows_visible:
                 if row.iid not in criteria:
                     row.hide()
-                    self.tablerows_filtered.remove(row)
+                    self._tablerows_filtered.remove(row._position)
         else:
             self._filtered = True
-            self.tablerows_filtered.clear()
-            for row in self.tablerows_visible:
-                if row.iid in criteria:
-                    self.tablerows_filtered.append(row)
+            self._tablerows_filtered = [
+                row._position
+                for row in self.tablerows_visible
+                if row.iid in criteria
+            ]
         self._rowindex.set(0)
         self.load_table_data()
 
     def hide_selected_rows(self):
         """Hide the currently selected rows"""
+        if self._virtual:
+            selected = self._virtual_selected
+            if not self.is_filtered:
+                self._filtered = True
+                self._tablerows_filtered = self._tablerows.copy()
+            self._tablerows_filtered = [
+                r for r in self._tablerows_filtered if r not in selected
+            ]
+            selected.clear()
+            self.load_table_data()
+            return
+
         selected = self.view.selection()
         view_cnt = len(self._viewdata)
         hide_cnt = len(selected)
@@ -1470,15 +2588,14 @@ class Tableview(ttk.Frame):
         tablerows = []
         for row in self.tablerows_visible:
             if row.iid in selected:
-                tablerows.append(row)
+                tablerows.append(row._position)
 
         if not self.is_filtered:
             self._filtered = True
-            self._tablerows_filtered = self.tablerows.copy()
+            self._tablerows_filtered = self._tablerows.copy()
 
-        for row in tablerows:
-            if self.is_filtered:
-                self.tablerows_filtered.remove(row)
+        for position in tablerows:
+            self._tablerows_filtered.remove(position)
 
         if hide_cnt == view_cnt:
             # assuming that if the count of the records on the page are
@@ -1540,7 +2657,7 @@ class Tableview(ttk.Frame):
     def export_all_records(self):
         """Export all records to a csv file"""
         headers = [col.headertext for col in self.tablecolumns]
-        records = [row.values for row in self.tablerows]
+        records = [self._store.get_row(p) for p in self._tablerows]
         self.save_data_to_csv(headers, records, self._delimiter)
 
     def export_current_page(self):
@@ -1552,11 +2669,7 @@ class Tableview(ttk.Frame):
     def export_current_selection(self):
         """Export rows currently selected to csv file"""
         headers = [col.headertext for col in self.tablecolumns]
-        selected = self.view.selection()
-        records = []
-        for iid in selected:
-            record: TableRow = self.iidmap.get(iid)
-            records.append(record.values)
+        records = [row.values for row in self._selected_rows()]
         self.save_data_to_csv(headers, records, self._delimiter)
 
     def export_records_in_filter(self):
@@ -1564,7 +2677,7 @@ class Tableview(ttk.Frame):
         headers = [col.headertext for col in self.tablecolumns]
         if not self.is_filtered:
             return
-        records = [row.values for row in self.tablerows_filtered]
+        records = [self._store.get_row(p) for p in self._tablerows_filtered]
         self.save_data_to_csv(headers, records, self._delimiter)
 
     def save_data_to_csv(self, headers, records, delimiter=","):
@@ -1606,17 +2719,16 @@ class Tableview(ttk.Frame):
 
     def move_selected_rows_to_top(self):
         """Move the selected rows to the top of the data set"""
-        selected = self.view.selection()
+        selected = [row._position for row in self._selected_rows()]
         if len(selected) == 0:
             return
 
         if self.is_filtered:
-            tablerows = self.tablerows_filtered.copy()
+            tablerows = self._tablerows_filtered.copy()
         else:
-            tablerows = self.tablerows.copy()
+            tablerows = self._tablerows.copy()
 
-        for i, iid in enumerate(selected):
-            row = self.iidmap.get(iid)
+        for i, row in enumerate(selected):
             tablerows.remove(row)
             tablerows.insert(i, row)
 
@@ -1631,17 +2743,16 @@ class Tableview(ttk.Frame):
 
     def move_selected_rows_to_bottom(self):
         """Move the selected rows to the bottom of the dataset"""
-        selected = self.view.selection()
+        selected = [row._position for row in self._selected_rows()]
         if len(selected) == 0:
             return
 
         if self.is_filtered:
-            tablerows = self.tablerows_filtered.copy()
+            tablerows = self._tablerows_filtered.copy()
         else:
-            tablerows = self.tablerows.copy()
+            tablerows = self._tablerows.copy()
 
-        for iid in selected:
-            row = self.iidmap.get(iid)
+        for row in selected:
             tablerows.remove(row)
             tablerows.append(row)
 
@@ -1656,17 +2767,16 @@ class Tableview(ttk.Frame):
 
     def move_selected_row_up(self):
         """Move the selected rows up one position in the dataset"""
-        selected = self.view.selection()
+        selected = [row._position for row in self._selected_rows()]
         if len(selected) == 0:
             return
 
         if self.is_filtered:
             tablerows = self._tablerows_filtered.copy()
         else:
-            tablerows = self.tablerows.copy()
+            tablerows = self._tablerows.copy()
 
-        for iid in selected:
-            row = self.iidmap.get(iid)
+        for row in selected:
             index = tablerows.index(row) - 1
             tablerows.remove(row)
             tablerows.insert(index, row)
@@ -1682,7 +2792,7 @@ class Tableview(ttk.Frame):
 
     def move_row_down(self):
         """Move the selected rows down one position in the dataset"""
-        selected = self.view.selection()
+        selected = [row._position for row in self._selected_rows()]
         if len(selected) == 0:
             return
 
@@ -1691,8 +2801,7 @@ class Tableview(ttk.Frame):
         else:
             tablerows = self._tablerows
 
-        for iid in selected:
-            row = self.iidmap.get(iid)
+        for row in selected:
             index = tablerows.index(row) + 1
             tablerows.remove(row)
             tablerows.insert(index, row)
@@ -1891,7 +3000,7 @@ class Tableview(ttk.Frame):
         if len(self._tablerows) == 0:
             return
 
-        values = self._tablerows[0]._values
+        values = self._store.get_row(self._tablerows[0])
         for i, value in enumerate(values):
             if str(value).isnumeric():
                 self.view.column(i, anchor=E)
@@ -2036,20 +3145,91 @@ class Tableview(ttk.Frame):
         Currently, this search locates any records that contain the
         specified text; it is also case insensitive.
         """
+        if self._searchafter is not None:
+            self.after_cancel(self._searchafter)
+            self._searchafter = None
         criteria = self._searchcriteria.get()
+        self._searchtext = criteria
+        if self.filter_rows(criteria):
+            return
+        self._rowfilters = []
+        hits = self._store.search(criteria)
         self._filtered = True
-        self.tablerows_filtered.clear()
         self.unload_table_data()
-        for row in self.tablerows:
-            for col in row.values:
-                if str(criteria).lower() in str(col).lower():
-                    self.tablerows_filtered.append(row)
-                    break
+        if len(hits) == len(self._store):
+            self._tablerows_filtered = self._tablerows.copy()
+        else:
+            included = bytearray(len(self._store))
+            for position in hits:
+                included[position] = 1
+            self._tablerows_filtered = [
+                p for p in self._tablerows if included[p]
+            ]
+        self._rowindex.set(0)
+        self.load_table_data()
+
+    def _apply_row_filters(self):
+        """Show the records that match the row filters"""
+        self.unload_table_data()
+        if not self._rowfilters:
+            self._filtered = False
+        else:
+            # join the "and" groups with "or"
+            groups = []
+            for rowfilter in self._rowfilters:
+                if not groups or rowfilter.combine == "or":
+                    groups.append([])
+                groups[-1].append(rowfilter.positions(self._store))
+            matches = set()
+            for sets in groups:
+                sets.sort(key=len)
+                matches |= sets[0].intersection(*sets[1:])
+            self._filtered = True
+            self._tablerows_filtered = [
+                p for p in self._tablerows if p in matches
+            ]
         self._rowindex.set(0)
         self.load_table_data()
 
+    def _search_keyrelease(self, event):
+        """Search the table data after a pause in typing. Keys that do
+        not change the search text are ignored."""
+        criteria = self._searchcriteria.get()
+        if criteria == self._searchtext:
+            return
+        self._searchtext = criteria
+        if self._searchafter is not None:
+            self.after_cancel(self._searchafter)
+        self._searchafter = self.after(
+            self._searchdelay, self._search_table_data, None
+        )
+
     # PRIVATE METHODS - SORTING
 
+    def _sorted_positions(self, positions):
+        """Return the record positions sorted by the sort columns"""
+        store = self._store
+        sortcolumns = [
+            (c.tableindex, s == DESCENDING) for c, s in self._sortcolumns
+        ]
+        if not sortcolumns:
+            return positions
+
+        # sort by the last column with its cached order
+        index, descending = sortcolumns[-1]
+        ordered = store.sort_index(index).positions(descending)
+        if len(positions) < len(store):
+            included = bytearray(len(store))
+            for position in positions:
+                included[position] = 1
+            ordered = [p for p in ordered if included[p]]
+
+        # then by the other columns with a stable sort of their ranks
+        for index, descending in reversed(sortcolumns[:-1]):
+            keys = store.sort_index(index).keys(descending)
+            ordered.sort(key=keys.__getitem__)
+        return ordered
+
     def _column_sort_header_reset(self):
         """Remove the sort character from the column headers"""
         for col in self.tablecolumns:
@@ -2062,6 +3242,203 @@ class Tableview(ttk.Frame):
         headertext = f"{column.headertext} {arrow}"
         self.view.heading(column.cid, text=headertext)
 
+    # PRIVATE METHODS - VIRTUAL ROWS
+
+    def _selected_rows(self):
+        """Return the selected rows. In virtual mode, this includes the
+        selected rows that are not in view."""
+        if self._virtual:
+            selected = self._virtual_selected
+            return [
+                TableRow(self, p) for p in self._virtual_rows() if p in selected
+            ]
+        return [self.iidmap.get(iid) for iid in self.view.selection()]
+
+    def _insert_position(self, index, position):
+        """Insert a record position into the table order at index"""
+        rowcount = len(self._tablerows)
+        if index == END:
+            index = -1
+        elif index > rowcount - 1:
+            index = -1
+
+        if rowcount == 0 or index == -1:
+            self._tablerows.append(position)
+        else:
+            self._tablerows.insert(index, position)
+
+    def _delete_positions(self, positions):
+        """Remove records from the dataset in a single pass"""
+        positions = set(positions)
+        self._tablerows = [p for p in self._tablerows if p not in positions]
+        self._tablerows_filtered = [
+            p for p in self._tablerows_filtered if p not in positions
+        ]
+        self._virtual_selected.difference_update(positions)
+        for position in positions:
+            self._virtual_tags.pop(position, None)
+        self._viewdata[:] = [
+            row for row in self._viewdata if row._position not in positions
+        ]
+        iids = [self._rowiids.pop(p) for p in positions if p in self._rowiids]
+        if self._store.size > 2 * len(self._tablerows):
+            self._compact_store()
+        self.load_table_data()
+        if self._virtual:
+            # the treeview items are reused for other records
+            return
+        for iid in iids:
+            self._iidmap.pop(iid, None)
+        if iids:
+            self.view.delete(*iids)
+
+    def _compact_store(self):
+        """Remove the deleted records from the table data, and number the
+        remaining records and their row objects by their new positions"""
+        mapping = self._store.compact(self._tablerows)
+        self._tablerows = [mapping[p] for p in self._tablerows]
+        self._tablerows_filtered = [
+            mapping[p] for p in self._tablerows_filtered
+        ]
+        self._rowiids = {mapping[p]: iid for p, iid in self._rowiids.items()}
+        self._virtual_selected = {mapping[p] for p in self._virtual_selected}
+        self._virtual_tags = {
+            mapping[p]: tags for p, tags in self._virtual_tags.items()
+        }
+        handles = list(self._rowhandles.items())
+        self._rowhandles.clear()
+        for position, row in handles:
+            position = mapping[position]
+            if position < 0:
+                row._position = None
+            else:
+                row._position = position
+                self._rowhandles[position] = row
+
+    def _virtual_rows(self):
+        """The record positions that can be scrolled into view"""
+        if self._filtered:
+            return self._tablerows_filtered
+        return self._tablerows
+
+    def _load_virtual_rows(self):
+        """Show the rows that are in view in the reused treeview items,
+        starting at the row index."""
+        rows = self._virtual_rows()
+        rowcount = len(rows)
+        count = self._virtual_rowcount
+        start = max(0, min(self._rowindex.get(), rowcount - count))
+        self._rowindex.set(start)
+        self.unload_table_data()
+        rowdata = rows[start : start + count]
+
+        # add or remove treeview items to match the rows in view
+        pool = self._virtual_pool
+        while len(pool) < len(rowdata):
+            pool.append(self.view.insert("", END))
+        while len(pool) > len(rowdata):
+            iid = pool.pop()
+            self._iidmap.pop(iid, None)
+            self.view.delete(iid)
+
+        selected = []
+        for i, (iid, position) in enumerate(zip(pool, rowdata)):
+            tags = list(self._virtual_tags.get(position, ()))
+            if self._stripecolor is not None and (start + i) % 2 == 0:
+                tags.append("striped")
+            row = TableRow(self, position)
+            self.view.item(iid, values=row.values, tags=tags)
+            self._rowiids[position] = iid
+            self._iidmap[iid] = row
+            self._viewdata.append(row)
+            if position in self._virtual_selected:
+                selected.append(iid)
+        self.view.selection_set(selected)
+
+        if rowcount == 0:
+            self.vbar.set(0, 1)
+        else:
+            self.vbar.set(start / rowcount, (start + len(rowdata)) / rowcount)
+
+    def _virtual_yview(self, *args):
+        """Callback for the vertical scrollbar in virtual mode"""
+        rowcount = len(self._virtual_rows())
+        if args[0] == MOVETO:
+            start = round(float(args[1]) * rowcount)
+        elif args[2] == PAGES:
+            start = self._rowindex.get() + int(args[1]) * self._virtual_rowcount
+        else:
+            start = self._rowindex.get() + int(args[1])
+        self._rowindex.set(max(0, start))
+        self.load_table_data()
+
+    def _virtual_mousewheel(self, event):
+        """Callback for mousewheel events in virtual mode"""
+        if event.num == 4 or event.delta > 0:
+            self._virtual_yview(SCROLL, -3, UNITS)
+        else:
+            self._virtual_yview(SCROLL, 3, UNITS)
+        return "break"
+
+    def _virtual_keypress(self, event):
+        """Move the focus beyond the rows in view with the arrow and
+        page keys in virtual mode"""
+        pool = self._virtual_pool
+        focus = self.view.focus()
+        if focus not in pool:
+            return
+        if event.keysym == "Up" and focus == pool[0]:
+            delta = -1
+        elif event.keysym == "Down" and focus == pool[-1]:
+            delta = 1
+        elif event.keysym == "Prior":
+            delta = -len(pool)
+        elif event.keysym == "Next":
+            delta = len(pool)
+        else:
+            return
+
+        # scroll the new focus row into view and select it
+        rowcount = len(self._virtual_rows())
+        start = self._rowindex.get()
+        index = max(0, min(start + pool.index(focus) + delta, rowcount - 1))
+        if index < start:
+            start = index
+        elif index >= start + len(pool):
+            start = index - len(pool) + 1
+        self._virtual_selected.clear()
+        self._virtual_selected.add(self._virtual_rows()[index])
+        self._rowindex.set(start)
+        self.load_table_data()
+        iid = pool[index - self._rowindex.get()]
+        self.view.focus(iid)
+        self.view.see(iid)
+        return "break"
+
+    def _virtual_select(self, _):
+        """Track the selected rows in view; the selection of the rows
+        that are not in view is unchanged."""
+        selection = set(self.view.selection())
+        for iid in self._virtual_pool:
+            position = self._iidmap.get(iid)._position
+            if iid in selection:
+                self._virtual_selected.add(position)
+            else:
+                self._virtual_selected.discard(position)
+
+    def _virtual_resize(self, event):
+        """Fit the number of rows in view to the height of the view"""
+        if not self._virtual_pool:
+            return
+        bbox = self.view.bbox(self._virtual_pool[0])
+        if not bbox:
+            return
+        _, y, _, rowheight = bbox
+        count = max(1, (event.height - y) // rowheight)
+        if count != self._virtual_rowcount:
+            self._virtual_rowcount = count
+            self.load_table_data()
+
     # PRIVATE METHODS - WIDGET BUILDERS
 
     def _build_tableview_widget(self, coldata, rowdata, bootstyle):
@@ -2069,6 +3446,12 @@ class Tableview(ttk.Frame):
         if self._searchable:
             self._build_search_frame()
 
+        if self._virtual:
+            self.vbar = ttk.Scrollbar(
+                master=self, command=self._virtual_yview, orient=VERTICAL
+            )
+            self.vbar.pack(fill=Y, side=RIGHT)
+
         self.view = ttk.Treeview(
             master=self,
             columns=[x for x in range(len(coldata))],
@@ -2105,6 +3488,8 @@ class Tableview(ttk.Frame):
         searchterm.pack(fill=X, side=LEFT, expand=YES)
         searchterm.bind("<Return>", self._search_table_data)
         searchterm.bind("<KP_Enter>", self._search_table_data)
+        if self._searchdelay is not None:
+            searchterm.bind("<KeyRelease>", self._search_keyrelease)
         if not self._paginated:
             ttk.Button(
                 frame,
@@ -2235,6 +3620,14 @@ class Tableview(ttk.Frame):
         # add trace to track pagesize changes
         self._pagesize.trace_add("write", self._trace_pagesize)
 
+        if self._virtual:
+            self.view.bind("<Configure>", self._virtual_resize, "+")
+            self.view.bind("<<TreeviewSelect>>", self._virtual_select, "+")
+            for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                self.view.bind(sequence, self._virtual_mousewheel)
+            for sequence in ("<Up>", "<Down>", "<Prior>", "<Next>"):
+                self.view.bind(sequence, self._virtual_keypress)
+
     # def _select_pagesize(self, event):
     #     cbo: ttk.Combobox = self.nametowidget(event.widget)
     #     cbo.select_clear()
@@ -2254,7 +3647,8 @@ class Tableview(ttk.Frame):
         """Callback for left-click events"""
         region = self.view.identify_region(event.x, event.y)
         if region == "heading":
-            self.sort_column_data(event)
+            # the shift key adds the column to the sort
+            self.sort_column_data(event, append=bool(event.state & 0x0001))
 
     def _table_rightclick(self, event):
         """Callback for right-click events"""
@@ -2481,6 +3875,10 @@ class TableCellRightClickMenu(tk.Menu):
 
     def delete_selected_rows(self):
         """Delete the selected rows"""
+        if self.master._virtual:
+            rows = self.master._selected_rows()
+            self.master._delete_positions([row._position for row in rows])
+            return
         iids = self.view.selection()
         if len(iids) > 0:
             # setting to prev should be in master?
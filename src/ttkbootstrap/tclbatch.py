@@ -0,0 +1,158 @@
+"""
+    This module contains a proxy for the tcl interpreter that collects
+    the `ttk::style` commands that change a theme, and sends them to tcl
+    as a single script.
+
+    The style builder methods make many separate `configure`, `map`,
+    `layout`, and `element create` calls; each one is a round trip from
+    python to tcl. While a style is built, these commands are batched and
+    evaluated together when the style is complete, or before any command
+    that reads from tcl, so that the results are always consistent.
+"""
+import re
+from tkinter import TclError
+
+# the ascii characters that are escaped in a tcl word: all except letters,
+#   digits, and punctuation that has no special meaning
+_SPECIAL = re.compile(r"[^A-Za-z0-9_.,:/@%+=\-\x80-\U0010ffff]")
+
+
+class TclBatch:
+    """A proxy for the tcl interpreter that batches the `ttk::style`
+    commands that do not return a value. All other commands, and all
+    other attributes, are passed on to the interpreter after the batched
+    commands are evaluated."""
+
+    def __init__(self, tk):
+        """
+        Parameters:
+
+            tk (_tkinter.tkapp):
+                The tcl interpreter.
+        """
+        self._tk = tk
+        self._commands = []
+
+    def call(self, *args):
+        if _is_batchable(args):
+            self._commands.append(tcl_command(args))
+            return ""
+        self.flush()
+        return self._tk.call(*args)
+
+    def eval(self, script):
+        self.flush()
+        return self._tk.eval(script)
+
+    def flush(self, origin=None):
+        """Evaluate the batched commands.
+
+        Parameters:
+
+            origin (str):
+                A description of the code that made the commands, such
+                as the name of the builder method, which is added to the
+                error message if a command fails. Optional.
+        """
+        if not self._commands:
+            return
+        script = "\n".join(self._commands)
+        self._commands = []
+        try:
+            self._tk.eval(script)
+        except TclError as exc:
+            message = str(exc)
+            command = self._failed_command()
+            if command:
+                message += f'\n    while executing "{command}"'
+            if origin:
+                message += f"\n    in {origin}"
+            raise TclError(message) from exc
+
+    def discard(self):
+        """Remove the batched commands without evaluating them."""
+        self._commands = []
+
+    def _failed_command(self):
+        """Return the command that failed in the last evaluation."""
+        try:
+            info = str(self._tk.globalgetvar("errorInfo"))
+        except TclError:
+            return ""
+        _, _, executing = info.partition("while executing\n")
+        return executing.split("\n", 1)[0].strip('"')
+
+    def __getattr__(self, name):
+        return getattr(self._tk, name)
+
+
+def _is_batchable(args):
+    """Return `True` for the `ttk::style` commands that change the theme
+    and do not return a value."""
+    if len(args) < 4 or args[0] != "ttk::style":
+        return False
+    command = args[1]
+    if command in ("configure", "map"):
+        # style followed by option value pairs; otherwise a query
+        return len(args) >= 5 and len(args) % 2 == 1
+    if command == "layout":
+        return len(args) == 4 and args[3] is not None
+    return command == "element" and args[2] == "create"
+
+
+def tcl_quote(value):
+    """Return a tcl word that evaluates to `value` as it is passed to tcl
+    by `tk.call`. Special characters are escaped with a backslash, so
+    that no variable, command, or backslash substitution takes place.
+
+    Parameters:
+
+        value (Any):
+            A string, number, or a list or tuple of these values.
+
+    Returns:
+
+        str:
+            The tcl word.
+    """
+    if isinstance(value, str):
+        text = value
+    elif isinstance(value, (list, tuple)):
+        text = " ".join(tcl_quote(v) for v in value)
+    elif isinstance(value, bool):
+        text = "1" if value else "0"
+    elif isinstance(value, (bytes, bytearray)):
+        text = bytes(value).decode("latin-1")
+    else:
+        text = str(value)
+    if not text:
+        return "{}"
+    return _SPECIAL.sub(_escape, text)
+
+
+def tcl_command(args):
+    """Return a tcl command that has the same effect as `tk.call(*args)`.
+    As with `tk.call`, the arguments after the first `None` are ignored.
+
+    Parameters:
+
+        args (Tuple):
+            The command and its arguments.
+
+    Returns:
+
+        str:
+            The tcl command.
+    """
+    words = []
+    for arg in args:
+        if arg is None:
+            break
+        words.append(tcl_quote(arg))
+    return " ".join(words)
+
+
+def _escape(match):
+    char = match.group(0)
+    # a backslash before a newline would join the lines
+    return "\\n" if char == "\n" else "\\" + char
@@ -1,3 +1,6 @@
+import weakref
+
+
 def enable_high_dpi_awareness(root=None, scaling=None):
     """Enable high dpi awareness.
 
@@ -52,17 +55,118 @@ def enable_high_dpi_awareness(root=None, scaling=None):
 
     try:
         if root and scaling:
-            root.tk.call('tk', 'scaling', scaling)
+            get_scaling_context(root).set_scaling(scaling)
     except:
         pass
 
+
+class ScalingContext:
+    """The scaling factor and windowing system of a tcl interpreter.
+
+    The values are queried from tcl once and cached, so that sizes can
+    be scaled without a round trip to tcl. Use `set_scaling` to change
+    the scaling factor, or `refresh` after the scaling factor was changed
+    by other means (for example, when the window is moved to a monitor
+    with a different resolution); subscribers are notified when the
+    factor changes.
+
+    Use `get_scaling_context` to get the context of a widget.
+    """
+
+    BASELINE = 1.33398982438864281
+    AQUA_BASELINE = 1.000492368291482
+
+    def __init__(self, root):
+        """
+        Parameters:
+
+            root (tk.Tk):
+                The root widget of the interpreter.
+        """
+        self._tk = root.tk
+        self._subscribers = []
+        self.winsys = self._tk.call('tk', 'windowingsystem')
+        self.scaling = float(self._tk.call('tk', 'scaling'))
+
+    @property
+    def factor(self):
+        """The ratio of the scaling to the baseline scaling of the
+        windowing system."""
+        if self.winsys == 'aqua':
+            return self.scaling / self.AQUA_BASELINE
+        return self.scaling / self.BASELINE
+
+    def set_scaling(self, scaling):
+        """Set the tk scaling factor and notify the subscribers if it
+        changed.
+
+        Parameters:
+
+            scaling (float):
+                The number of pixels per point.
+        """
+        self._tk.call('tk', 'scaling', scaling)
+        self.refresh()
+
+    def refresh(self):
+        """Query the tk scaling factor and notify the subscribers if it
+        changed.
+
+        Returns:
+
+            bool:
+                `True` if the scaling factor changed.
+        """
+        scaling = float(self._tk.call('tk', 'scaling'))
+        if scaling == self.scaling:
+            return False
+        self.scaling = scaling
+        for func in list(self._subscribers):
+            func()
+        return True
+
+    def subscribe(self, func):
+        """Call `func` with no arguments when the scaling changes."""
+        if func not in self._subscribers:
+            self._subscribers.append(func)
+
+    def unsubscribe(self, func):
+        """Stop calling `func` when the scaling changes."""
+        if func in self._subscribers:
+            self._subscribers.remove(func)
+
+
+_scaling_contexts = weakref.WeakKeyDictionary()
+
+
+def get_scaling_context(widget):
+    """Return the scaling context of the interpreter that owns the
+    widget. The context is created on first use.
+
+    Parameters:
+
+        widget (Widget):
+            Any widget of the application.
+
+    Returns:
+
+        ScalingContext:
+            The scaling context.
+    """
+    root = widget._root()
+    context = _scaling_contexts.get(root)
+    if context is None:
+        context = _scaling_contexts[root] = ScalingContext(root)
+    return context
+
+
 def get_image_name(image):
     """Extract and return the tcl/tk image name from a PhotoImage 
     object.
     
     Parameters:
 
-        image (ImageTk.PhotoImage):
+        image (Union[ImageTk.PhotoImage, tkinter.PhotoImage]):
             A photoimage object.
 
     Returns:
@@ -70,7 +174,11 @@ def get_image_name(image):
         str:
             The tcl/tk name of the photoimage object.
     """
-    return image._PhotoImage__photo.name
+    try:
+        return image._PhotoImage__photo.name
+    except AttributeError:
+        # tkinter.PhotoImage
+        return image.name
 
 def scale_size(widget, size):
     """Scale the size based on the scaling factor of tkinter. 
@@ -90,9 +198,8 @@ def scale_size(widget, size):
         Union[int, List]:
             An integer or list of integers representing the new size.
     """
-    BASELINE = 1.33398982438864281
-    scaling = widget.tk.call('tk', 'scaling')
-    factor = scaling / BASELINE
+    scaling = get_scaling_context(widget).scaling
+    factor = scaling / ScalingContext.BASELINE
 
     if isinstance(size, int):
         return int(size * factor)
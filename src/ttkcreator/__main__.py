@@ -60,15 +60,22 @@ class ThemeCreator(ttk.Window):
 
     def create_temp_theme(self, *_):
         """Creates a temp theme using the current configure settings and
-        changes the theme in tkinter to that new theme.
+        changes the theme in tkinter to that new theme. Once the temp
+        theme exists, its colors are updated in place.
         """
-        themename = "temp_" + str(uuid4()).replace("-", "")[:10]
         colors = {}
         for row in self.color_rows:
             colors[row.label["text"]] = row.color_value
-        definition = ThemeDefinition(themename, colors, self.style.theme.type)
-        self.style.register_theme(definition)
-        self.style.theme_use(themename)
+        themename = self.style.theme.name
+        if themename.startswith("temp_"):
+            self.style.update_theme_colors(themename, **colors)
+        else:
+            themename = "temp_" + str(uuid4()).replace("-", "")[:10]
+            definition = ThemeDefinition(
+                themename, colors, self.style.theme.type
+            )
+            self.style.register_theme(definition)
+            self.style.theme_use(themename)
         self.update_color_patches()
 
     def change_base_theme(self, *_):
@@ -0,0 +1,268 @@
+"""
+    A headless benchmark of window creation, theme changes, and publisher
+    fan-out with a large number of styled widgets.
+
+    Each widget count is measured in a fresh interpreter, because the
+    `Style` object is a singleton and caches the styles it has built.
+    The widgets are a fixed mix of ttk and legacy tk widgets that cycles
+    through every bootstyle and color, so runs are comparable between
+    releases.
+
+    Usage (on a system without a display, run it under Xvfb):
+
+        xvfb-run -a python tests/benchmarks/theme_switch.py
+        python tests/benchmarks/theme_switch.py --counts 100 1000 --cycles 2
+        python tests/benchmarks/theme_switch.py --output results.json
+
+    The results are written as json to stdout or to `--output`.
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tkinter as tk
+from datetime import datetime, timezone
+from time import perf_counter
+
+import ttkbootstrap as ttk
+from ttkbootstrap.constants import *
+from ttkbootstrap.publisher import Channel, Publisher
+from ttkbootstrap.themes.standard import STANDARD_THEMES
+
+DEFAULT_COUNTS = [100, 1000, 10000]
+COLUMNS = 50
+COLORS = [
+    "",
+    PRIMARY,
+    SECONDARY,
+    SUCCESS,
+    INFO,
+    WARNING,
+    DANGER,
+    LIGHT,
+    DARK,
+]
+
+# ttk widget class and the style types that apply to it
+TTK_SPECS = [
+    (ttk.Button, ["", OUTLINE, LINK]),
+    (ttk.Checkbutton, ["", "round-toggle", "square-toggle", TOOLBUTTON,
+                       f"{OUTLINE}-{TOOLBUTTON}"]),
+    (ttk.Radiobutton, ["", TOOLBUTTON, f"{OUTLINE}-{TOOLBUTTON}"]),
+    (ttk.Menubutton, ["", OUTLINE]),
+    (ttk.Label, ["", INVERSE]),
+    (ttk.Frame, [""]),
+    (ttk.Labelframe, [""]),
+    (ttk.Entry, [""]),
+    (ttk.Combobox, [""]),
+    (ttk.Spinbox, [""]),
+    (ttk.Progressbar, [HORIZONTAL, VERTICAL, f"{STRIPED}-{HORIZONTAL}"]),
+    (ttk.Scale, [HORIZONTAL, VERTICAL]),
+    (ttk.Scrollbar, [HORIZONTAL, VERTICAL, f"{ROUND}-{VERTICAL}"]),
+    (ttk.Separator, [HORIZONTAL, VERTICAL]),
+    (ttk.Sizegrip, [""]),
+    (ttk.Treeview, [""]),
+    (ttk.Notebook, [""]),
+    (ttk.Panedwindow, [HORIZONTAL]),
+    (ttk.Floodgauge, [HORIZONTAL]),
+]
+
+TK_SPECS = [
+    tk.Button,
+    tk.Label,
+    tk.Frame,
+    tk.Checkbutton,
+    tk.Radiobutton,
+    tk.Entry,
+    tk.Scale,
+    tk.Listbox,
+    tk.Menubutton,
+    tk.LabelFrame,
+    tk.Canvas,
+    tk.Spinbox,
+    tk.Text,
+]
+
+
+def widget_specs():
+    """Return the list of widget factories and options that is cycled
+    to create the widgets; one ttk widget for each bootstyle and color,
+    followed by the legacy tk widgets.
+
+    Returns:
+
+        List[Tuple[Callable, Dict]]:
+            The widget class and its keyword arguments.
+    """
+    specs = []
+    for widget_class, types in TTK_SPECS:
+        for bootstyle in types:
+            for color in COLORS:
+                value = "-".join(x for x in (color, bootstyle) if x)
+                specs.append((widget_class, {"bootstyle": value}))
+    for widget_class in TK_SPECS:
+        specs.append((widget_class, {}))
+    return specs
+
+
+def timed(func, *args):
+    """Call `func` and return the elapsed time in seconds."""
+    start = perf_counter()
+    func(*args)
+    return perf_counter() - start
+
+
+def create_widgets(master, count):
+    """Create `count` widgets in a grid on `master`."""
+    specs = widget_specs()
+    for i in range(count):
+        widget_class, kwargs = specs[i % len(specs)]
+        widget = widget_class(master, **kwargs)
+        widget.grid(row=i // COLUMNS, column=i % COLUMNS)
+    master.update_idletasks()
+
+
+def change_theme(app, themename):
+    app.style.theme_use(themename)
+    app.update_idletasks()
+
+
+def measure(count, cycles, startup, publishes):
+    """Run the benchmark for a single widget count in this interpreter.
+
+    Returns:
+
+        Dict[str, Any]:
+            The timings in seconds.
+    """
+    themes = list(STANDARD_THEMES)
+    others = [t for t in themes if t != startup]
+    result = {"widgets": count}
+
+    start = perf_counter()
+    app = ttk.Window(themename=startup)
+    app.update_idletasks()
+    result["window_create"] = perf_counter() - start
+
+    frame = ttk.Frame(app)
+    frame.pack()
+    result["widget_create"] = timed(create_widgets, frame, count)
+
+    # first change to a theme that has not been built
+    result["first_theme_use"] = timed(change_theme, app, others[0])
+
+    # cycle the remaining themes; the first cycle builds each theme
+    # and the following cycles switch between existing themes
+    result["theme_cycles"] = []
+    for cycle in range(cycles):
+        switches = {}
+        for themename in others[1:] + [startup, others[0]]:
+            switches[themename] = timed(change_theme, app, themename)
+        values = list(switches.values())
+        result["theme_cycles"].append(
+            {
+                "cycle": cycle,
+                "total": sum(values),
+                "mean": sum(values) / len(values),
+                "max": max(values),
+                "themes": switches,
+            }
+        )
+
+    # publisher fan-out to every subscriber without a theme change
+    result["subscribers"] = Publisher.subscriber_count()
+    for channel in (Channel.STD, Channel.TTK):
+        times = [
+            timed(Publisher.publish_message, channel)
+            for _ in range(publishes)
+        ]
+        result[f"publish_{channel.name.lower()}"] = min(times)
+
+    result["ttk_styles"] = len(app.style._style_registry)
+    app.destroy()
+    return result
+
+
+def run_child(count, args):
+    """Run the benchmark for a widget count in a new interpreter and
+    return its result."""
+    command = [
+        sys.executable,
+        __file__,
+        "--child",
+        str(count),
+        "--cycles",
+        str(args.cycles),
+        "--theme",
+        args.theme,
+        "--publishes",
+        str(args.publishes),
+    ]
+    output = subprocess.run(
+        command, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output)
+
+
+def environment():
+    try:
+        from importlib.metadata import version
+
+        ttkb_version = version("ttkbootstrap")
+    except Exception:
+        ttkb_version = "unknown"
+    return {
+        "ttkbootstrap": ttkb_version,
+        "python": platform.python_version(),
+        "tk": str(tk.TkVersion),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--counts", type=int, nargs="+", default=DEFAULT_COUNTS,
+        help="the widget counts to measure",
+    )
+    parser.add_argument(
+        "--cycles", type=int, default=3,
+        help="the number of cycles through all standard themes",
+    )
+    parser.add_argument(
+        "--theme", default="litera", help="the startup theme",
+    )
+    parser.add_argument(
+        "--publishes", type=int, default=5,
+        help="the number of publish repetitions; the fastest is reported",
+    )
+    parser.add_argument("--output", help="write the results to this file")
+    parser.add_argument("--child", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        result = measure(args.child, args.cycles, args.theme, args.publishes)
+        json.dump(result, sys.stdout)
+        return
+
+    report = {
+        "environment": environment(),
+        "settings": {
+            "cycles": args.cycles,
+            "theme": args.theme,
+            "themes": list(STANDARD_THEMES),
+        },
+        "results": [run_child(count, args) for count in args.counts],
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+    Headless checks of the disk cache in `ttkbootstrap.assetcache`.
+
+    The checks store placeholder data in a temporary directory; the
+    cache does not read the png data it stores.
+
+    Usage:
+
+        python tests/checks/check_assetcache.py
+"""
+import os
+import tempfile
+from pathlib import Path
+
+from ttkbootstrap.assetcache import AssetCache
+
+
+def _disk_size(cache):
+    paths = Path(cache.directory).rglob("*.assets")
+    return sum(p.stat().st_size for p in paths)
+
+
+def check_get_and_put():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = AssetCache(directory)
+        key = cache.make_key("checkbutton", "#ffffff", 1.0)
+        assert cache.make_key("checkbutton", "#ffffff", 1.0) == key
+        assert cache.make_key("checkbutton", "#000000", 1.0) != key
+        assert cache.get(key) is None
+        cache.put(key, [b"first", b"", b"second"])
+        assert cache.get(key) == [b"first", b"", b"second"]
+        assert (cache.hits, cache.misses) == (1, 1)
+
+
+def check_size_after_replace():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = AssetCache(directory)
+        assert cache.size() == 0
+        key = cache.make_key("entry")
+        cache.put(key, [b"x" * 100])
+        assert cache.size() == _disk_size(cache)
+        cache.put(key, [b"x" * 40])
+        assert cache.size() == _disk_size(cache), cache.size()
+        cache.put(key, [b"x" * 400])
+        assert cache.size() == _disk_size(cache), cache.size()
+        assert AssetCache(directory).size() == cache.size()
+
+
+def check_evict_least_recently_used():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = AssetCache(directory, max_bytes=1000)
+        keys = [cache.make_key("entry", i) for i in range(3)]
+        for i, key in enumerate(keys):
+            cache.put(key, [b"x" * 300])
+            # the entries are ordered by modification time
+            os.utime(cache._path(key), (1000 + i, 1000 + i))
+        assert cache.get(keys[0]) is not None
+        cache.put(cache.make_key("entry", 3), [b"x" * 300])
+        assert cache.size() == _disk_size(cache) <= 750
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[1]) is None
+        cache.clear()
+        assert cache.size() == _disk_size(cache) == 0
+
+
+def check_damaged_entry_is_a_miss():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = AssetCache(directory)
+        key = cache.make_key("entry")
+        cache.put(key, [b"x" * 100])
+        path = cache._path(key)
+        path.write_bytes(path.read_bytes()[:20])
+        assert cache.get(key) is None
+        path.write_bytes(b"not an asset file")
+        assert cache.get(key) is None
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("check_"):
+            check()
+            print(f"{name}: ok")
@@ -0,0 +1,112 @@
+"""
+    Headless checks of the image sharing in `ttkbootstrap.imageregistry`.
+
+    The checks register placeholder images, which only report their
+    size, so that they do not need a display.
+
+    Usage:
+
+        python tests/checks/check_imageregistry.py
+"""
+from ttkbootstrap.imageregistry import ImageRegistry
+from ttkbootstrap.style import Scaled
+
+
+class _Image:
+    def __init__(self, width, height):
+        self._size = width, height
+
+    def width(self):
+        return self._size[0]
+
+    def height(self):
+        return self._size[1]
+
+
+def render_arrow(color, size):
+    pass
+
+
+def render_toggle(color, size):
+    pass
+
+
+def _add(registry, render, params, count=1):
+    key = registry.make_key(render, params)
+    images = [_Image(10, 20) for _ in range(count)]
+    names = [f"image{i}" for i in range(count)]
+    return registry.add(key, images, names, render, params, 1.0)
+
+
+def check_keys():
+    make_key = ImageRegistry.make_key
+    key = make_key(render_arrow, ("#fff", [Scaled(12), 4]))
+    assert key == make_key(render_arrow, ("#fff", (Scaled(12), 4)))
+    assert hash(key) == hash(make_key(render_arrow, ["#fff", [Scaled(12), 4]]))
+    assert key != make_key(render_toggle, ("#fff", [Scaled(12), 4]))
+    # a scaled size is not the same parameter as an unscaled size
+    assert key != make_key(render_arrow, ("#fff", [(12,), 4]))
+
+
+def check_lookup_counts():
+    registry = ImageRegistry()
+    group = _add(registry, render_arrow, ("#fff", 12), count=2)
+    key = registry.make_key(render_arrow, ("#fff", 12))
+    assert registry.lookup(key) is group
+    assert registry.lookup(key) is group
+    assert registry.lookup(registry.make_key(render_arrow, ("#000", 12))) is None
+    assert registry.get(key) is group
+    assert (registry.hits, registry.misses, group.hits) == (2, 1, 2)
+    report = registry.report()
+    assert report["images"] == 2
+    assert report["images_saved"] == 4
+    assert report["bytes_saved"] == 4 * 10 * 20 * 4
+    registry.clear()
+    assert registry.get(key) is None
+    assert (registry.hits, registry.misses) == (0, 0)
+
+
+def check_reference_counts():
+    registry = ImageRegistry()
+    group = _add(registry, render_arrow, ("#fff", 12))
+    assert registry.retain(group) is False
+    assert registry.retain(group) is False
+    assert group.refs == 2
+    assert registry.release(group) is False
+    # the last holder is released; the images are emptied by the caller
+    assert registry.release(group) is True
+    assert group.refs == 0
+    group.evicted = True
+    # the images must be rendered again for the next holder
+    assert registry.retain(group) is True
+    assert group.refs == 1
+    # the images are only emptied once
+    assert registry.release(group) is False
+    assert group.refs == 0
+
+
+def check_update_and_discard():
+    registry = ImageRegistry()
+    group = _add(registry, render_arrow, ("#fff", 12))
+    other = _add(registry, render_arrow, ("#000", 12))
+    old_key = registry.make_key(render_arrow, ("#fff", 12))
+    new_key = registry.make_key(render_arrow, ("#f00", 12))
+    registry.update(group, render_arrow, ("#f00", 12))
+    assert registry.get(old_key) is None
+    assert registry.get(new_key) is group
+    assert group.params == ("#f00", 12)
+    # a group is not registered over another group with the same key
+    registry.update(group, render_arrow, ("#000", 12))
+    assert registry.get(registry.make_key(render_arrow, ("#000", 12))) is other
+    assert registry.get(new_key) is None
+    registry.discard(group)
+    assert registry.get(registry.make_key(render_arrow, ("#000", 12))) is other
+    registry.discard(other)
+    assert registry.report()["images"] == 0
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("check_"):
+            check()
+            print(f"{name}: ok")
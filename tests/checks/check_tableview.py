@@ -0,0 +1,218 @@
+"""
+    Headless checks of the record store behind `ttkbootstrap.tableview`.
+
+    The checks use the store and index classes directly, and the table
+    methods that only need the store, so that they do not need a
+    display.
+
+    Usage:
+
+        python tests/checks/check_tableview.py
+"""
+from types import SimpleNamespace
+
+from ttkbootstrap.tableview import (
+    ASCENDING,
+    DESCENDING,
+    ColumnStore,
+    RowFilter,
+    Tableview,
+    _parse_filter_expression,
+)
+
+
+def _store(rows):
+    store = ColumnStore()
+    store.extend(rows)
+    return store
+
+
+def _column_values(store, index, positions):
+    return [store.get_row(p)[index] for p in positions]
+
+
+def check_sort_natural_order():
+    store = _store([[v] for v in ["item 10", "Item 2", "item 1", "item 2b"]])
+    ordered = store.sort_index(0).positions()
+    values = _column_values(store, 0, ordered)
+    assert values == ["item 1", "Item 2", "item 2b", "item 10"], values
+
+
+def check_sort_missing_values_last():
+    store = _store([[v] for v in [3, None, 1, "", 2, float("nan")]])
+    sortindex = store.sort_index(0)
+    for descending, expected in ((False, [1, 2, 3]), (True, [3, 2, 1])):
+        values = _column_values(store, 0, sortindex.positions(descending))
+        assert values[:3] == expected, (descending, values)
+        assert sorted(map(str, values[3:])) == ["", "None", "nan"], values
+
+
+def check_sort_numbers_and_numeric_strings():
+    store = _store([[v] for v in [10, "2", 1.5, "-4"]])
+    values = _column_values(store, 0, store.sort_index(0).positions())
+    assert values == ["-4", 1.5, "2", 10], values
+
+
+def check_sort_numbers_and_text():
+    store = _store([[v] for v in [10, "item 10", 2, "item 2", "3"]])
+    values = _column_values(store, 0, store.sort_index(0).positions())
+    assert values == [2, "3", 10, "item 2", "item 10"], values
+
+
+def check_sort_multiple_columns():
+    rows = [["b", 2], ["a", 2], ["b", 1], ["a", 1], ["a", None]]
+    store = _store(rows)
+    columns = [SimpleNamespace(tableindex=i) for i in range(2)]
+    sortcolumns = [(columns[0], ASCENDING), (columns[1], DESCENDING)]
+    table = SimpleNamespace(_store=store, _sortcolumns=sortcolumns)
+    ordered = Tableview._sorted_positions(table, list(range(len(rows))))
+    assert ordered == [1, 3, 4, 0, 2], ordered
+    ordered = Tableview._sorted_positions(table, [0, 2, 4])
+    assert ordered == [4, 0, 2], ordered
+
+
+def check_search_refines_recent_query():
+    store = _store([["Apple", 1], ["apricot", 2], ["banana", 3], ["Grape", 4]])
+    assert store.search("ap") == [0, 1, 3]
+    assert store.search("apr") == [1]
+    assert store.search("AP") == [0, 1, 3]
+    assert store.search("p\x1f") == []  # no match across two values
+    assert store.search("") == [0, 1, 2, 3]
+
+
+def check_search_after_changes():
+    store = _store([["Apple", 1], ["apricot", 2], ["banana", 3]])
+    assert store.search("an") == [2]
+    store.set_value(0, 0, "Mango")
+    assert store.search("an") == [0, 2]
+    assert store.search("ap") == [1]
+    store.extend([["Pineapple", 4]])
+    assert store.search("ap") == [1, 3]
+    store.set_row(1, ["cherry", 2])
+    assert store.search("ap") == [3]
+    store.delete_column(0)
+    assert store.search("ap") == []
+    assert store.search("4") == [3]
+
+
+FILTER_ROWS = [
+    ["A1", 12, "open"],
+    ["A2", "", "closed"],
+    ["A3", 5, None],
+    ["A4", 12.0, "pending"],
+    ["A5", "12", "open"],
+]
+
+
+def _filter(column, operator, value):
+    rowfilter = RowFilter(SimpleNamespace(tableindex=column), operator, value)
+    return sorted(rowfilter.positions(_store(FILTER_ROWS)))
+
+
+def check_filter_equal_and_not_equal():
+    assert _filter(1, "=", 12) == [0, 3, 4]
+    assert _filter(1, "=", "12") == [0, 3, 4]
+    # empty values never match "!="
+    assert _filter(1, "!=", 12) == [2]
+    assert _filter(2, "!=", "open") == [1, 3]
+
+
+def check_filter_in():
+    assert _filter(2, "in", ["open", "pending"]) == [0, 3, 4]
+    assert _filter(1, "in", ["5", 99]) == [2]
+    assert _filter(0, "in", []) == []
+
+
+def check_filter_range_and_contains():
+    assert _filter(1, ">", 5) == [0, 3, 4]
+    assert _filter(1, "<=", "5") == [2]
+    assert _filter(1, "<", "text") == []
+    assert _filter(2, "contains", "EN") == [0, 3, 4]
+
+
+def check_filter_cache_follows_changes():
+    store = _store(FILTER_ROWS)
+    rowfilter = RowFilter(SimpleNamespace(tableindex=2), "=", "open")
+    assert sorted(rowfilter.positions(store)) == [0, 4]
+    store.set_value(1, 2, "open")
+    assert sorted(rowfilter.positions(store)) == [0, 1, 4]
+
+
+def check_parse_filter_expression():
+    columns = {
+        name: SimpleNamespace(tableindex=i)
+        for i, name in enumerate(["id", "quantity", "status", "company name"])
+    }
+    filters = _parse_filter_expression(
+        'Quantity >= 10 and status in (open, "on hold") '
+        'or "Company Name" ~ acme',
+        columns,
+    )
+    expected = [
+        (columns["quantity"], ">=", "10", "and"),
+        (columns["status"], "in", ["open", "on hold"], "and"),
+        (columns["company name"], "contains", "acme", "or"),
+    ]
+    assert filters == expected, filters
+    assert _parse_filter_expression("id == A1", columns) == [
+        (columns["id"], "=", "A1", "and")
+    ]
+    for text in [
+        "plain text",
+        "apple",
+        "unknown = 1",
+        "quantity",
+        "quantity >",
+        "quantity > 1 and",
+        "quantity > 1 status = open",
+        "status in open",
+        "status in (open",
+        "quantity > (1)",
+        "",
+    ]:
+        assert not _parse_filter_expression(text, columns), text
+
+
+def check_compact_matches_new_store():
+    rows = [
+        [i % 7 or None, f"item {i % 11}", i / 3, "" if i % 5 else "x"]
+        for i in range(200)
+    ]
+    store = _store(rows)
+    for index in range(4):
+        store.sort_index(index)
+        store.value_index(index)
+    store.search("item 1")
+    keep = [p for p in range(200) if p % 3]
+    mapping = store.compact(reversed(keep))
+    assert [mapping[p] for p in keep] == list(range(len(keep)))
+    assert all(mapping[p] == -1 for p in range(0, 200, 3))
+
+    expected = _store([rows[p] for p in keep])
+    assert len(store) == len(expected)
+    for position in range(len(store)):
+        assert store.get_row(position) == expected.get_row(position)
+    for index in range(4):
+        sortindex, other = store.sort_index(index), expected.sort_index(index)
+        for descending in (False, True):
+            assert sortindex.positions(descending) == other.positions(
+                descending
+            )
+            # the ranks of values that were removed are not reused
+            keys, otherkeys = sortindex.keys(descending), other.keys(descending)
+            positions = range(len(store))
+            assert sorted(positions, key=keys.__getitem__) == sorted(
+                positions, key=otherkeys.__getitem__
+            )
+        for value in (3, "item 4", 20):
+            assert sortindex.compare(">=", value) == other.compare(">=", value)
+        values = store.value_index(index)
+        assert values == expected.value_index(index), index
+    assert store.search("item 1") == expected.search("item 1")
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("check_"):
+            check()
+            print(f"{name}: ok")
@@ -0,0 +1,115 @@
+"""
+    Headless checks of the tcl command batching in `ttkbootstrap.tclbatch`.
+
+    The checks use a `tkinter.Tcl` interpreter, which does not need a
+    display.
+
+    Usage:
+
+        python tests/checks/check_tclbatch.py
+"""
+import tkinter
+
+from ttkbootstrap.tclbatch import _is_batchable, tcl_command, tcl_quote
+
+VALUES = [
+    "plain",
+    "",
+    "a b",
+    "$x",
+    "a;b",
+    "[cmd]",
+    "[cmd arg]",
+    "{",
+    "}a{",
+    "{balanced}",
+    '"quoted"',
+    "back\\slash",
+    "trailing\\",
+    "line\nnext",
+    "tab\there",
+    "#comment",
+    " leading space",
+    "-padding",
+    "#ffffff",
+    "é ü ✓",
+    1,
+    -3,
+    1.5,
+    True,
+    (),
+    ("a b", "[c]", ""),
+    ("disabled", ("pressed", "!disabled"), "$img"),
+]
+
+
+def _same(interp, word, value, expected):
+    """Compare a tcl value with the value passed by `tk.call`, element by
+    element for lists."""
+    if isinstance(value, (list, tuple)):
+        words = interp.splitlist(word)
+        values = interp.splitlist(expected)
+        return len(words) == len(values) == len(value) and all(
+            _same(interp, w, v, e) for w, v, e in zip(words, value, values)
+        )
+    return str(word) == str(expected)
+
+
+def check_quote_round_trip():
+    interp = tkinter.Tcl()
+    interp.eval("set x substituted; proc cmd args {error substituted}")
+    for value in VALUES:
+        word = interp.eval("set quoted " + tcl_quote(value))
+        interp.call("set", "called", value)
+        expected = interp.eval("set called")
+        assert _same(interp, word, value, expected), (value, word, expected)
+
+
+def check_command_round_trip():
+    interp = tkinter.Tcl()
+    args = ("list", "$x", ("a b", "[c]"), "d;e", None, "ignored")
+    result = interp.eval(tcl_command(args))
+    expected = interp.call(*args)
+    assert _same(interp, result, args[1:4], expected), (result, expected)
+
+
+# commands that change the theme and return nothing
+COMMANDS = [
+    ("ttk::style", "configure", "TButton", "-foreground", "red"),
+    ("ttk::style", "configure", ".", "-font", "x", "-padding", (1, 2)),
+    ("ttk::style", "map", "TButton", "-foreground", ("active", "blue")),
+    ("ttk::style", "layout", "TButton", "Button.border -sticky nswe"),
+    ("ttk::style", "element", "create", "Toggle.indicator", "image", "img"),
+]
+
+# commands that return a value, or that are not theme commands
+QUERIES = [
+    ("ttk::style",),
+    ("ttk::style", "configure", "TButton"),
+    ("ttk::style", "configure", "TButton", "-foreground"),
+    ("ttk::style", "configure", "TButton", "-foreground", "red", "-padding"),
+    ("ttk::style", "map", "TButton", "-foreground"),
+    ("ttk::style", "layout", "TButton"),
+    ("ttk::style", "layout", "TButton", None),
+    ("ttk::style", "lookup", "TButton", "-foreground"),
+    ("ttk::style", "element", "names", "x"),
+    ("ttk::style", "element", "options", "Button.border"),
+    ("ttk::style", "theme", "use", "clam"),
+    ("ttk::style", "theme", "names", "x"),
+    ("image", "create", "photo", "img"),
+    ("winfo", "rgb", ".", "red"),
+]
+
+
+def check_batchable_commands():
+    for args in COMMANDS:
+        assert _is_batchable(args), args
+    for args in QUERIES:
+        assert not _is_batchable(args), args
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("check_"):
+            check()
+            print(f"{name}: ok")